@@ -7,102 +7,260 @@ from src import (
     amplitud,
     recocido,
     genetico,
+    minimos_cuadrados,
+    descenso_gradiente,
     experiment_runner,
+    barrido,
+    espacio_rejilla,
+    espacio_hipercubo,
+    mejor_configuracion,
+    ObjetivoECM,
+    CacheResultados,
+    cargar_estadisticos,
+    ruta_estadisticos,
+    guardar_resultados,
+    cargar_resultados,
     generar_tabla_resumen,
+    ResumenEnLinea,
+    intervalos_bootstrap,
+    pruebas_pareadas,
     plot_convergencia,
     plot_solucion,
     plot_boxplot,
+    BusEventos,
+    SumideroJSONL,
+    SumideroUDP,
 )
 
 # Configuración de semilla inicial
 SEMILLA = 42
-np.random.seed(SEMILLA)
-random.seed(SEMILLA)
-
-print("=== PROYECTO DE OPTIMIZACIÓN: 30 EJECUCIONES ===")
-
-# --- 1. Carga de Datos ---
-base_dir = os.getcwd()
-csv_path = os.path.join(base_dir, 'data', 'processed', 'clean_fish_data.csv')
-results_dir = os.path.join(base_dir, 'reports', 'results')
-figures_dir = os.path.join(base_dir, 'reports', 'figures')
-
-df = pd.read_csv(csv_path)
-X = df['Length1_norm'].values
-Y = df['Weight_norm'].values
-
-print(f"Datos cargados correctamente: {len(X)} registros normalizados.")
-
-# --- 2. Configuración de Parámetros ---
-params_bfs = {
-    'inicio_b0': 0.0,
-    'inicio_b1': 0.0,
-    'paso': 0.05,
-    'max_iter': 2000
-}
-
-params_sa = {
-    'inicio_b0': 0.0,
-    'inicio_b1': 0.0,
-    't_inicial': 100.0,
-    't_final': 0.001,
-    'alpha': 0.95,
-    'paso': 0.2
-}
-
-params_ga = {
-    'tam_poblacion': 50,
-    'generaciones': 100,
-    'prob_mutacion': 0.1,
-    'rango_mutacion': 0.2,
-    'k_torneo': 3,
-    'rango_inicio': (-1, 1)
-}
-
-# --- 3. Ejecución de Experimentos (Decorados) ---
-# El decorador ejecuta cada algoritmo 30 veces y registra desempeño
-
-print("\nEjecutando Búsqueda en Amplitud (30 corridas)...")
-df_bfs = experiment_runner(30)(amplitud)(X, Y, params_bfs)
-
-print("Ejecutando Recocido Simulado (30 corridas)...")
-df_sa = experiment_runner(30)(recocido)(X, Y, params_sa)
-
-print("Ejecutando Algoritmo Genético (30 corridas)...")
-df_ga = experiment_runner(30)(genetico)(X, Y, params_ga)
-
-# --- 4. Consolidación y Reporte ---
-df_total = pd.concat([df_bfs, df_sa, df_ga], ignore_index=True)
-
-# Conversión de datos numpy a float nativo para evitar formato sucio en CSV
-df_total['Historial'] = df_total['Historial'].apply(lambda lista: [float(x) for x in lista])
-
-# Guardar resultados
-results_path = os.path.join(results_dir, 'resultados.csv')
-df_total.to_csv(results_path, index=False)
-print(f"\nResultados guardados en: {results_path}")
-
-# Generar tabla resumen
-tabla_resumen = generar_tabla_resumen(df_total)
-
-print("\n" + "=" * 190)
-print("TABLA RESUMEN DE DESEMPEÑO (30 ejecuciones por algoritmo)")
-print("=" * 190)
-
-pd.set_option('display.max_columns', None)
-pd.set_option('display.width', 1000)
-pd.set_option('display.float_format', '{:.6f}'.format)
-
-print(tabla_resumen)
-print("=" * 190)
-
-# --- 5. Generación de Gráficas ---
-print("\nGenerando gráficas comparativas...")
-
-try:
-    plot_convergencia(df_total, figures_dir)
-    plot_solucion(df, df_total, figures_dir)
-    plot_boxplot(df_total, figures_dir)
-    print(f"Gráficas generadas exitosamente en: {figures_dir}")
-except Exception as e:
-    print(f"Error durante la generación de gráficas: {e}")
\ No newline at end of file
+
+# Procesos para las corridas (1 = en serie, -1 = todos los núcleos).
+# Cada corrida recibe una semilla derivada de SEMILLA, de modo que los
+# resultados no dependen de este valor.
+N_PROCESOS = 1
+
+# Si es True, alpha/paso del recocido y tam_poblacion/prob_mutacion del
+# genético se eligen con un barrido (successive halving) antes de las corridas.
+BARRER_PARAMETROS = False
+
+# Si es True, el progreso de las corridas se emite como eventos en
+# reports/results/telemetria.jsonl y por UDP a 127.0.0.1:9999 (nc -ul 9999).
+TELEMETRIA = False
+
+# Si es True, cada corrida mide el tiempo de sus fases internas (selección,
+# evaluación, aceptación, etc.) y la tabla resumen incluye el desglose.
+PERFILAR = False
+
+
+def main():
+    np.random.seed(SEMILLA)
+    random.seed(SEMILLA)
+
+    print("=== PROYECTO DE OPTIMIZACIÓN: 30 EJECUCIONES ===")
+
+    # --- 1. Carga de Datos ---
+    base_dir = os.getcwd()
+    csv_path = os.path.join(base_dir, 'data', 'processed', 'clean_fish_data.csv')
+    results_dir = os.path.join(base_dir, 'reports', 'results')
+    figures_dir = os.path.join(base_dir, 'reports', 'figures')
+
+    df = pd.read_csv(csv_path)
+    X = df['Length1_norm'].values
+    Y = df['Weight_norm'].values
+
+    print(f"Datos cargados correctamente: {len(X)} registros normalizados.")
+
+    # Estadísticos suficientes del ECM: se calculan una sola vez y se comparten
+    # entre todas las corridas (cada evaluación del objetivo cuesta O(1)).
+    objetivo = ObjetivoECM.desde_datos(X, Y)
+
+    # --- 2. Configuración de Parámetros ---
+    params_bfs = {
+        'inicio_b0': 0.0,
+        'inicio_b1': 0.0,
+        'paso': 0.05,
+        'max_iter': 2000
+    }
+
+    params_sa = {
+        'inicio_b0': 0.0,
+        'inicio_b1': 0.0,
+        't_inicial': 100.0,
+        't_final': 0.001,
+        'alpha': 0.95,
+        'paso': 0.2
+    }
+
+    params_ga = {
+        'tam_poblacion': 50,
+        'generaciones': 100,
+        'prob_mutacion': 0.1,
+        'rango_mutacion': 0.2,
+        'k_torneo': 3,
+        'rango_inicio': (-1, 1),
+        # Opcional: detenerse tras N generaciones sin mejora ('paciencia': 20)
+        # y adaptar el rango de mutación con la regla de 1/5
+        # ('mutacion_adaptativa': True); cambian los resultados del genético
+        # (ver columnas Parada y Rango_Mutacion_Final)
+    }
+
+    params_gd = {
+        'inicio_b0': 0.0,
+        'inicio_b1': 0.0,
+        'optimizador': 'adam',
+        'tasa_aprendizaje': 0.05,
+        'epocas': 20,
+        'tam_lote': 16
+    }
+
+    if BARRER_PARAMETROS:
+        print("\nBarrido de hiperparámetros (recocido y genético)...")
+
+        espacio_sa = {'alpha': (0.8, 0.99), 'paso': (0.01, 1.0, 'log')}
+        _, resumen_sa = barrido(recocido, objetivo, None,
+                                espacio_hipercubo(espacio_sa, 16, rng=SEMILLA), params_sa,
+                                n_semillas=16, n_jobs=N_PROCESOS, semilla=SEMILLA, eta=2)
+        params_sa.update(mejor_configuracion(resumen_sa))
+
+        rejilla_ga = {'tam_poblacion': [20, 50, 100], 'prob_mutacion': [0.05, 0.1, 0.2]}
+        _, resumen_ga = barrido(genetico, objetivo, None,
+                                espacio_rejilla(rejilla_ga), params_ga,
+                                n_semillas=9, n_jobs=N_PROCESOS, semilla=SEMILLA, eta=3)
+        params_ga.update(mejor_configuracion(resumen_ga))
+
+        print(f"Recocido: {params_sa}")
+        print(f"Genético: {params_ga}")
+
+    # --- 3. Ejecución de Experimentos (Decorados) ---
+    # El decorador ejecuta cada algoritmo 30 veces y registra desempeño.
+    # Las metas (ECM a 10% y 1% del óptimo) miden evaluaciones y tiempo
+    # hasta alcanzar una calidad dada, comparables entre algoritmos.
+    metas = {'10%': objetivo.ecm_minimo * 1.10, '1%': objetivo.ecm_minimo * 1.01}
+    # Cada corrida terminada se agrega a la bitácora; si la ejecución se
+    # interrumpe, al volver a lanzarla solo se ejecutan las corridas que faltan
+    # (borrar el archivo para repetir la campaña completa).
+    bitacora = os.path.join(results_dir, 'bitacora.jsonl')
+    # La caché conserva las corridas entre campañas: mientras no cambien los
+    # datos, el código del algoritmo, sus parámetros o la semilla, las
+    # corridas se leen del disco en lugar de repetirse.
+    cache = CacheResultados(os.path.join(base_dir, 'reports', 'cache'))
+    telemetria = None
+    if TELEMETRIA:
+        telemetria = BusEventos([SumideroJSONL(os.path.join(results_dir, 'telemetria.jsonl')),
+                                 SumideroUDP('127.0.0.1', 9999)])
+    # La tabla resumen se acumula corrida a corrida; de los historiales solo
+    # se conserva el de la mejor corrida de cada algoritmo (el que se grafica)
+    resumen = ResumenEnLinea()
+    runner = experiment_runner(30, n_jobs=N_PROCESOS, semilla=SEMILLA, metas=metas,
+                               bitacora=bitacora, cache=cache, resumen=resumen,
+                               historiales='mejor', telemetria=telemetria,
+                               perfilar=PERFILAR)
+
+    print("\nEjecutando Búsqueda en Amplitud (30 corridas)...")
+    df_bfs = runner(amplitud)(objetivo, None, params_bfs)
+
+    print("Ejecutando Recocido Simulado (30 corridas)...")
+    df_sa = runner(recocido)(objetivo, None, params_sa)
+
+    print("Ejecutando Algoritmo Genético (30 corridas)...")
+    df_ga = runner(genetico)(objetivo, None, params_ga)
+
+    # Líneas base: solución exacta y descenso por gradiente con mini-lotes
+    print("Ejecutando líneas base (mínimos cuadrados y Adam)...")
+    df_ols = runner(minimos_cuadrados)(objetivo, None, {})
+    df_gd = runner(descenso_gradiente)(X, Y, params_gd)
+
+    # --- 4. Consolidación y Reporte ---
+    df_total = pd.concat([df_bfs, df_sa, df_ga, df_ols, df_gd], ignore_index=True)
+
+    # Guardar resultados (almacén columnar: escalares + historiales contiguos)
+    results_path = os.path.join(results_dir, 'resultados')
+    guardar_resultados(df_total, results_path)
+    print(f"\nResultados guardados en: {results_path}")
+
+    # Generar tabla resumen (la brecha se mide contra el óptimo exacto)
+    tabla_resumen = generar_tabla_resumen(resumen, ecm_optimo=objetivo.ecm_minimo)
+
+    print("\n" + "=" * 190)
+    print("TABLA RESUMEN DE DESEMPEÑO (30 ejecuciones por algoritmo)")
+    print("=" * 190)
+
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.width', 1000)
+    pd.set_option('display.float_format', '{:.6f}'.format)
+
+    print(tabla_resumen)
+    print("=" * 190)
+
+    if PERFILAR:
+        print("\nTiempo promedio por fase (segundos por corrida):")
+        fases = [c for c in tabla_resumen.columns if c.startswith('Perfil_') and c.endswith('Promedio')]
+        print(tabla_resumen[fases].rename(columns=lambda c: c[len('Perfil_'):-len(' Promedio')]))
+
+    # Intervalos de confianza (bootstrap) y pruebas de Mann-Whitney entre pares
+    print("\nIntervalos de confianza al 95% del ECM final promedio (bootstrap):")
+    print(intervalos_bootstrap(df_total, 'ECM_Final', rng=SEMILLA))
+    print("\nPruebas de Mann-Whitney del ECM final (p-valores ajustados por Holm):")
+    print(pruebas_pareadas(df_total, 'ECM_Final').to_string(index=False))
+
+    # --- 5. Generación de Gráficas ---
+    print("\nGenerando gráficas comparativas...")
+
+    try:
+        resultados = cargar_resultados(results_path)
+        plot_convergencia(resultados, figures_dir)
+        plot_solucion(df, resultados, figures_dir)
+        plot_boxplot(resultados, figures_dir)
+        print(f"Gráficas generadas exitosamente en: {figures_dir}")
+    except Exception as e:
+        print(f"Error durante la generación de gráficas: {e}")
+
+    # --- 6. Regresión Múltiple ---
+    # Mismos algoritmos sobre las cinco medidas del pez: el objetivo usa la
+    # matriz de Gram (XᵀX, Xᵀy) y cada individuo / estado es un vector de 6 coeficientes.
+    variables = ['Length1_norm', 'Length2_norm', 'Length3_norm', 'Height_norm', 'Width_norm']
+    X_multi = df[variables].values
+    objetivo_multi = ObjetivoECM.desde_datos(X_multi, Y)
+
+    print(f"\nEjecutando regresión múltiple ({len(variables)} variables, 30 corridas)...")
+
+    metas_multi = {'10%': objetivo_multi.ecm_minimo * 1.10, '1%': objetivo_multi.ecm_minimo * 1.01}
+    resumen_multi = ResumenEnLinea()
+    runner_multi = experiment_runner(30, n_jobs=N_PROCESOS, semilla=SEMILLA, metas=metas_multi,
+                                     bitacora=bitacora, cache=cache, resumen=resumen_multi,
+                                     historiales='ninguno', telemetria=telemetria,
+                                     perfilar=PERFILAR)
+
+    params_sa_multi = dict(params_sa, t_final=0.0001, alpha=0.995, paso=0.05)
+    params_ga_multi = dict(params_ga, modo='arreglos', generaciones=300, elitismo=2, rango_mutacion=0.05)
+
+    df_multi = pd.concat([
+        runner_multi(recocido)(objetivo_multi, None, params_sa_multi),
+        runner_multi(genetico)(objetivo_multi, None, params_ga_multi),
+        runner_multi(minimos_cuadrados)(objetivo_multi, None, {}),
+        runner_multi(descenso_gradiente)(X_multi, Y, dict(params_gd, epocas=100)),
+    ], ignore_index=True)
+
+    tabla_multi = generar_tabla_resumen(resumen_multi, ecm_optimo=objetivo_multi.ecm_minimo)
+
+    print("\n" + "=" * 190)
+    print("TABLA RESUMEN DE DESEMPEÑO - REGRESIÓN MÚLTIPLE (30 ejecuciones por algoritmo)")
+    print("=" * 190)
+    print(tabla_multi)
+    print("=" * 190)
+
+    # Modelo de mínimos cuadrados en unidades originales (gramos y centímetros),
+    # a partir de los estadísticos guardados por el preprocesamiento
+    escalado, _ = cargar_estadisticos(ruta_estadisticos(csv_path))
+    originales = [v.removesuffix('_norm') for v in variables]
+    coeficientes = escalado.desnormalizar_betas(objetivo_multi.betas_optimos, originales, 'Weight')
+    terminos = " ".join(f"{c:+.4f}·{v}" for c, v in zip(coeficientes[1:], originales))
+    print(f"\nModelo en unidades originales: Weight = {coeficientes[0]:.4f} {terminos}")
+
+    if telemetria is not None:
+        telemetria.cerrar()
+
+
+if __name__ == "__main__":
+    main()
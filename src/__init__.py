@@ -1,9 +1,26 @@
-from .utils.common import calcular_ecm, generar_tabla_resumen
+from .utils.common import calcular_ecm, calcular_ecm_lote, generar_tabla_resumen
+from .utils.objetivo import ObjetivoECM, ContadorEvaluaciones, crear_objetivo
 from .utils.decorators import experiment_runner
+from .utils.cache import CacheResultados
+from .utils.telemetria import BusEventos, SumideroJSONL, SumideroUDP
+from .utils.perfilado import PerfilFases
+from .utils.estadisticas import (ResumenEnLinea, intervalos_bootstrap, pruebas_pareadas,
+                                mann_whitney)
+from .utils.aleatorio import obtener_generador
+from .utils.resultados import guardar_resultados, cargar_resultados
+from .utils.historial import RegistroHistorial
+from .utils.barrido import (barrido, espacio_rejilla, espacio_aleatorio, espacio_hipercubo,
+                            mejor_configuracion)
+
+from .preprocessing.fuente_datos import objetivo_desde_csv, objetivo_desde_binario
+from .preprocessing.normalizacion import (EscaladoMinMax, preprocesar, agregar_filas,
+                                          cargar_estadisticos, ruta_estadisticos)
 
 from .algorithms.recocido import recocido
 from .algorithms.amplitud import amplitud
 from .algorithms.genetico import genetico
+from .algorithms.analitico import minimos_cuadrados
+from .algorithms.gradiente import descenso_gradiente
 
 from .visualization.plots import plot_convergencia
 from .visualization.plots import plot_solucion
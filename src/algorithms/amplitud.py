@@ -1,7 +1,9 @@
 import sys
 import os
+import math
 import pandas as pd
 import numpy as np
+from array import array
 from collections import deque
 
 # Agregar la raíz del proyecto al path (solo para ejecución directa de este archivo)
@@ -10,7 +12,9 @@ root_dir = os.path.abspath(os.path.join(current_dir, '..', '..'))
 if root_dir not in sys.path:
     sys.path.append(root_dir)
 
-from src.utils.common import calcular_ecm
+from src.utils.objetivo import crear_objetivo, vector_inicial
+from src.utils.historial import crear_registro
+from src.utils.perfilado import instrumentar_metodos
 
 
 def generar_vecinos_grid(b0, b1, paso):
@@ -26,73 +30,316 @@ def generar_vecinos_grid(b0, b1, paso):
     ]
 
 
+def radio_busqueda(max_iter, dimensiones=2):
+    """
+    Radio (en distancia Manhattan sobre la retícula) que puede alcanzar un
+    nodo encolado por BFS tras 'max_iter' expansiones desde el origen.
+
+    En una retícula de D dimensiones con vecindad de 2D, el número de nodos
+    a distancia <= r es N(D, r) = Σ_k 2^k C(D, k) C(r, k) (en dos
+    dimensiones, 2r² + 2r + 1); los nodos expandidos quedan dentro del menor
+    r que cubre max_iter y sus vecinos a lo sumo un paso más lejos.
+    """
+    def nodos(r):
+        return sum(2 ** k * math.comb(dimensiones, k) * math.comb(r, k)
+                   for k in range(min(dimensiones, r) + 1))
+
+    r = 0
+    while nodos(r) < max_iter:
+        r += 1
+    return r + 1
+
+
+def tolerancia_ajuste(objetivo):
+    """
+    ECM por debajo del cual un nodo se considera un ajuste exacto.
+
+    El objetivo por estadísticos suficientes deja un residuo de redondeo
+    (del orden de 1e-32) aun cuando el modelo reproduce los datos, por lo
+    que la comparación exacta con cero no sirve; la tolerancia se escala con
+    la varianza de 'y' para no depender de sus unidades.
+    """
+    return 1e-12 * max(1.0, objetivo.syy / objetivo.n)
+
+
+# Valor en caché de un nodo encolado que aún no se evalúa (cada nodo se
+# evalúa al salir de la cola, no al encolarse)
+ENCOLADO = math.inf
+
+
+class _CacheDispersa(dict):
+    """Caché de ECM por diccionario: los nodos no visitados valen NaN."""
+
+    def __missing__(self, k):
+        return math.nan
+
+
+class IndiceReticula:
+    """
+    Índice de visitados y caché de ECM sobre la retícula entera de BFS.
+
+    El nodo de coordenadas enteras (c_0, ..., c_{D-1}) representa el vector
+    de coeficientes inicio + c * paso y se codifica en base mixta como el
+    entero k = Σ (c_i + R) * lado^(D-1-i), con lado = 2R + 1 (en dos
+    dimensiones, k = (i + R) * lado + (j + R)). Trabajar con enteros hace
+    que la identidad de un nodo sea exacta (sin redondeos ni deriva por
+    sumas repetidas de 'paso').
+
+    El arreglo 'ecm' (8 bytes por celda) guarda el valor evaluado de cada
+    nodo, ENCOLADO en los encolados aún sin evaluar y NaN en los no
+    visitados, de modo que sirve a la vez como mapa de visitados y como
+    caché: un nodo nunca se evalúa dos veces. Si la
+    retícula completa supera 'max_celdas' (muchas dimensiones), 'ecm' es un
+    diccionario que solo guarda los nodos visitados.
+
+    Parámetros
+    ----------
+    radio : int
+        Máxima distancia al origen que puede alcanzar un nodo (R).
+    dimensiones : int
+        Número de coeficientes (D = d + 1).
+    max_celdas : int
+        Tamaño máximo de la caché densa.
+    """
+
+    def __init__(self, radio, dimensiones=2, max_celdas=2**22):
+        self.radio = radio
+        self.dimensiones = dimensiones
+        self.lado = 2 * radio + 1
+        self.pasos = np.array([self.lado ** (dimensiones - 1 - i) for i in range(dimensiones)],
+                              dtype=np.int64)
+
+        # Vecinos en el orden de generar_vecinos_grid: +b0, -b0, +b1, -b1, ...
+        self.desplazamientos = [int(s) * signo for s in self.pasos for signo in (1, -1)]
+
+        celdas = self.lado ** dimensiones
+        self.denso = celdas <= max_celdas
+        self.ecm = array('d', [math.nan]) * celdas if self.denso else _CacheDispersa()
+
+    def codificar(self, *coordenadas):
+        """Índice lineal del nodo de coordenadas enteras dadas."""
+        k = 0
+        for c in coordenadas:
+            k = k * self.lado + (c + self.radio)
+        return k
+
+    def decodificar(self, k):
+        """
+        Coordenadas enteras del índice lineal 'k'. Con un escalar se obtiene
+        un vector (D,); con un arreglo de m índices, una matriz (m, D).
+        """
+        k = np.asarray(k, dtype=np.int64)
+        return (k[..., None] // self.pasos) % self.lado - self.radio
+
+    def coordenadas(self, k):
+        """Coordenadas enteras del índice lineal 'k' como lista (sin NumPy)."""
+        coordenadas = [0] * self.dimensiones
+        for i in range(self.dimensiones - 1, -1, -1):
+            k, c = divmod(k, self.lado)
+            coordenadas[i] = c - self.radio
+        return coordenadas
+
+    def visitado(self, k):
+        return not math.isnan(self.ecm[k])
+
+    def consultar(self, ks):
+        """Valores en caché de un arreglo de índices (NaN si no visitados)."""
+        if self.denso:
+            return np.frombuffer(self.ecm, dtype=np.float64)[ks]
+        return np.fromiter((self.ecm[k] for k in ks.tolist()), dtype=np.float64, count=ks.size)
+
+    def guardar(self, ks, valores):
+        """Guarda en la caché los valores de un arreglo de índices."""
+        if self.denso:
+            np.frombuffer(self.ecm, dtype=np.float64)[ks] = valores
+        else:
+            self.ecm.update(zip(ks.tolist(), valores.tolist()))
+
+
+def _amplitud_niveles(objetivo, indice, inicio, paso, max_iter, historial, tolerancia=0.0):
+    """
+    BFS síncrono por niveles.
+
+    En lugar de extraer un nodo a la vez, se procesa un nivel completo de la
+    búsqueda como arreglo NumPy: el nivel se evalúa con una sola llamada al
+    ECM y sus vecinos se generan en bloque, descartando en bloque los ya
+    visitados y los duplicados (conservando la primera aparición, que es el
+    orden en que la cola los habría encolado).
+
+    Como el orden de los nodos coincide con el de la cola, el último nivel
+    se trunca antes de evaluarse para respetar max_iter exactamente (no se
+    evalúan nodos que la cola no habría extraído) y el resultado
+    (mejor solución, iteraciones e historial) es el mismo que el del modo
+    nodo a nodo (incluido el corte en el primer nodo con ECM <= 'tolerancia').
+    """
+    desplazamientos = np.array(indice.desplazamientos, dtype=np.int64)
+
+    mejor_k = indice.codificar(*[0] * indice.dimensiones)
+    mejor_ecm = float(indice.ecm[mejor_k])
+    frontera = np.array([mejor_k], dtype=np.int64)
+    iteracion = 0
+
+    while frontera.size and iteracion < max_iter:
+        nivel = frontera[:max_iter - iteracion]
+        valores = indice.consultar(nivel)
+
+        pendientes = valores == ENCOLADO
+        if pendientes.any():
+            puntos = inicio + indice.decodificar(nivel[pendientes]) * paso
+            valores[pendientes] = objetivo.evaluar_matriz(puntos)
+            indice.guardar(nivel[pendientes], valores[pendientes])
+
+        # Corte anticipado en el primer nodo con ajuste exacto
+        if mejor_ecm > tolerancia:
+            ceros = np.flatnonzero(valores <= tolerancia)
+            if ceros.size:
+                corte = ceros[0]
+                historial.registrar_lote(valores[:corte + 1])
+                return int(nivel[corte]), float(valores[corte]), iteracion + int(corte)
+
+        historial.registrar_lote(valores)
+
+        idx = int(np.argmin(valores))
+        if valores[idx] < mejor_ecm:
+            mejor_ecm = float(valores[idx])
+            mejor_k = int(nivel[idx])
+
+        iteracion += nivel.size
+        if iteracion >= max_iter:
+            break
+
+        candidatos = (nivel[:, None] + desplazamientos).ravel()
+        candidatos = candidatos[np.isnan(indice.consultar(candidatos))]
+        _, primeros = np.unique(candidatos, return_index=True)
+        frontera = candidatos[np.sort(primeros)]
+        indice.guardar(frontera, np.full(frontera.size, ENCOLADO))
+
+    return mejor_k, mejor_ecm, iteracion
+
+
 def amplitud(x, y, params):
     """
     Algoritmo de búsqueda en amplitud (BFS) aplicado a la estimación de parámetros
-    de un modelo de regresión lineal simple mediante exploración de una cuadrícula.
+    de un modelo de regresión lineal mediante exploración de una cuadrícula.
+
+    Con d variables independientes la cuadrícula tiene d + 1 dimensiones
+    (intercepto y pendientes) y cada nodo tiene 2(d + 1) vecinos.
 
     Parámetros
     ----------
-    x : array_like
-        Valores de la variable independiente.
-    y : array_like
-        Valores de la variable objetivo.
+    x : array_like u ObjetivoECM
+        Valores de la(s) variable(s) independiente(s), (n,) o (n, d), o un
+        objetivo ya precalculado.
+    y : array_like o None
+        Valores de la variable objetivo (se ignora si x es un ObjetivoECM).
     params : dict
         Diccionario de parámetros del algoritmo:
         - inicio_b0 : valor inicial del intercepto.
-        - inicio_b1 : valor inicial de la pendiente.
+        - inicio_b1 : valor inicial de la(s) pendiente(s).
+        - inicio : vector inicial [b0, b1, ..., bd] (reemplaza a los dos
+          anteriores).
         - paso : tamaño del desplazamiento en cada expansión.
         - max_iter : número máximo de iteraciones permitidas.
+        - modo : 'nodos' (por defecto, un nodo por iteración de la cola) o
+          'niveles' (expande y evalúa un nivel completo del BFS en bloque;
+          mismo resultado, mucho más rápido en cuadrículas grandes).
+        - historial : modo de registro del historial ('completo',
+          'diezmado', 'mejoras' o 'apagado'; ver RegistroHistorial).
+        - historial_cada : intervalo del modo 'diezmado'.
+        - perfil : PerfilFases opcional (lo agrega experiment_runner con
+          perfilar=True). Mide las fases 'evaluacion', 'decodificacion'
+          (índices de la retícula a coordenadas), 'historial' y, en el
+          modo 'niveles', 'cache' (consultas y escrituras del índice). En
+          el modo 'nodos' la expansión de vecinos sobre la caché queda en
+          'otros' para no agregar llamadas al ciclo.
 
     Retorna
     -------
     list
-        Lista con los valores óptimos encontrados para b0 y b1.
+        Lista con los valores óptimos encontrados para b0, b1, ..., bd.
     float
         Valor del ECM en la mejor solución.
     int
         Número total de iteraciones realizadas.
-    list
+    numpy.ndarray
         Historial de valores de ECM durante la búsqueda.
     """
 
-    inicio_b0 = params.get('inicio_b0', 0.0)
-    inicio_b1 = params.get('inicio_b1', 0.0)
     paso = params.get('paso', 0.05)
     max_iter = params.get('max_iter', 1000)
 
-    cola = deque([(inicio_b0, inicio_b1)])
-    visitados = {(round(inicio_b0, 4), round(inicio_b1, 4))}
+    if paso <= 0:
+        raise ValueError("El tamaño de paso debe ser positivo.")
+
+    objetivo = crear_objetivo(x, y, params)
+    inicio = vector_inicial(params, objetivo.dimension)
+    dimensiones = inicio.size
+
+    indice = IndiceReticula(radio_busqueda(max_iter, dimensiones), dimensiones)
+    instrumentar_metodos(indice, params.get('perfil'), {'consultar': 'cache', 'guardar': 'cache',
+                                                        'decodificar': 'decodificacion',
+                                                        'coordenadas': 'decodificacion'})
+    cache = indice.ecm
+    desplazamientos = indice.desplazamientos
 
-    mejor_b0, mejor_b1 = inicio_b0, inicio_b1
-    mejor_ecm = calcular_ecm(mejor_b0, mejor_b1, x, y)
+    mejor_k = indice.codificar(*[0] * dimensiones)
+    mejor_ecm = objetivo.evaluar_vector(inicio)
+    cache[mejor_k] = mejor_ecm
 
-    historial = [mejor_ecm]
+    # La cola guarda índices enteros de la retícula; el ECM vive en la caché
+    cola = deque([mejor_k])
+
+    # La búsqueda termina al encontrar un ajuste exacto (salvo redondeo)
+    tolerancia = tolerancia_ajuste(objetivo)
+
+    historial = crear_registro(params, capacidad=max_iter + 1)
+    instrumentar_metodos(historial, params.get('perfil'), {'registrar': 'historial',
+                                                           'registrar_lote': 'historial'})
+    historial.registrar(mejor_ecm)
+
+    if params.get('modo', 'nodos') == 'niveles':
+        mejor_k, mejor_ecm, iteracion = _amplitud_niveles(
+            objetivo, indice, inicio, paso, max_iter, historial, tolerancia
+        )
+        mejor = inicio + indice.decodificar(mejor_k) * paso
+        historial.reportar(params)
+        return mejor.tolist(), mejor_ecm, iteracion, historial.valores()
+
+    coordenadas = indice.coordenadas
+    evaluar = objetivo.evaluar_vector
+    origen = inicio.tolist()
     iteracion = 0
 
     while cola and iteracion < max_iter:
-        actual_b0, actual_b1 = cola.popleft()
-        ecm_actual = calcular_ecm(actual_b0, actual_b1, x, y)
-        historial.append(ecm_actual)
+        k = cola.popleft()
+        ecm_actual = cache[k]
+
+        # Cada nodo se evalúa (y cuenta para las metas) al salir de la cola
+        if ecm_actual == ENCOLADO:
+            ecm_actual = evaluar([b + c * paso for b, c in zip(origen, coordenadas(k))])
+            cache[k] = ecm_actual
+        historial.registrar(ecm_actual)
 
         if ecm_actual < mejor_ecm:
             mejor_ecm = ecm_actual
-            mejor_b0, mejor_b1 = actual_b0, actual_b1
+            mejor_k = k
 
-            if mejor_ecm == 0:
+            if mejor_ecm <= tolerancia:
                 break
 
-        vecinos = generar_vecinos_grid(actual_b0, actual_b1, paso)
-
-        for v_b0, v_b1 in vecinos:
-            estado_round = (round(v_b0, 4), round(v_b1, 4))
-            if estado_round not in visitados:
-                visitados.add(estado_round)
-                cola.append((v_b0, v_b1))
+        # Vecinos en el mismo orden que generar_vecinos_grid
+        for s in desplazamientos:
+            v = k + s
+            if math.isnan(cache[v]):
+                cache[v] = ENCOLADO
+                cola.append(v)
 
         iteracion += 1
 
-    return [mejor_b0, mejor_b1], mejor_ecm, iteracion, historial
+    mejor = inicio + indice.decodificar(mejor_k) * paso
+
+    historial.reportar(params)
+    return mejor.tolist(), mejor_ecm, iteracion, historial.valores()
 
 
 def main():
@@ -0,0 +1,78 @@
+import sys
+import os
+import numpy as np
+
+# Agregar la raíz del proyecto al path (solo para ejecución directa de este archivo)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..', '..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from src.utils.objetivo import crear_objetivo
+from src.utils.historial import crear_registro
+
+
+def minimos_cuadrados(x, y, params):
+    """
+    Solución analítica (cerrada) de mínimos cuadrados ordinarios.
+
+    Sirve como referencia exacta: su ECM es el mínimo global del problema,
+    de modo que la diferencia con el ECM de cada metaheurística es su
+    brecha de optimalidad.
+
+        b1 = Σ(x - x̄)(y - ȳ) / Σ(x - x̄)²
+        b0 = ȳ - b1 * x̄
+
+    En la regresión múltiple se resuelven las ecuaciones normales sobre la
+    matriz de Gram centrada, Sxx b = Sxy, y b0 = ȳ - bᵀ x̄.
+
+    Parámetros
+    ----------
+    x, y : array_like
+        Datos de entrenamiento (x de forma (n,) o (n, d)). En lugar de los arreglos puede pasarse un
+        ObjetivoECM precalculado como 'x' (y 'y' = None).
+    params : dict
+        No requiere parámetros; se acepta por compatibilidad con el resto
+        de los algoritmos (admite 'historial').
+
+    Retorna
+    -------
+    list
+        Coeficientes óptimos [b0, b1, ..., bd].
+    float
+        ECM mínimo.
+    int
+        Número de iteraciones (1: una única evaluación directa).
+    numpy.ndarray
+        Historial con el ECM de la solución.
+    """
+    objetivo = crear_objetivo(x, y, params)
+
+    betas = objetivo.betas_optimos
+    ecm = objetivo.evaluar_vector(betas)
+
+    historial = crear_registro(params, capacidad=1)
+    historial.registrar(ecm)
+
+    historial.reportar(params)
+    return betas, ecm, 1, historial.valores()
+
+
+def main():
+    print("--- Solución analítica de mínimos cuadrados ---")
+
+    X = np.array([1, 2, 3, 4, 5])
+    Y = 4 * X + 2
+
+    print("Modelo objetivo: b0 = 2, b1 = 4")
+
+    betas, error, iters, hist = minimos_cuadrados(X, Y, {})
+
+    print("\nResultados:")
+    print(f"b0: {betas[0]:.4f}")
+    print(f"b1: {betas[1]:.4f}")
+    print(f"ECM: {error:.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,23 @@
 import sys
 import os
+import atexit
 import random
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 
-# Ajuste de ruta para importar calcular_ecm
+# Ajuste de ruta para importar el objetivo
 current_dir = os.path.dirname(os.path.abspath(__file__))
 root_dir = os.path.abspath(os.path.join(current_dir, '..', '..'))
 if root_dir not in sys.path:
     sys.path.append(root_dir)
 
-from src.utils.common import calcular_ecm
+from src.utils.objetivo import crear_objetivo
+from src.utils.aleatorio import FlujoAleatorio, obtener_generador, generador_desde_params
+from src.utils.historial import crear_registro
+from src.utils.perfilado import instrumentar, instrumentar_metodos
 
 
-def seleccion_torneo(poblacion, k=3):
+def seleccion_torneo(poblacion, k=3, flujo=None):
     """
     Selección mediante torneo.
 
@@ -22,21 +27,26 @@ def seleccion_torneo(poblacion, k=3):
     Parámetros
     ----------
     poblacion : list
-        Lista de individuos, cada uno con la forma [b0, b1, ecm].
+        Lista de individuos, cada uno con la forma [b0, b1, ..., bd, ecm].
     k : int
         Cantidad de participantes del torneo.
+    flujo : FlujoAleatorio o None
+        Fuente de números aleatorios. Si es None se usa el módulo 'random'.
 
     Retorna
     -------
     list
         Individuo ganador del torneo.
     """
-    torneo = random.sample(poblacion, k)
-    ganador = min(torneo, key=lambda ind: ind[2])
+    if flujo is None:
+        torneo = random.sample(poblacion, k)
+    else:
+        torneo = [poblacion[i] for i in flujo.indices_sin_reemplazo(len(poblacion), k)]
+    ganador = min(torneo, key=lambda ind: ind[-1])
     return ganador
 
 
-def cruza_aritmetica_completa(padre1, padre2):
+def cruza_aritmetica_completa(padre1, padre2, flujo=None):
     """
     Cruza aritmética completa entre dos individuos.
 
@@ -46,72 +56,615 @@ def cruza_aritmetica_completa(padre1, padre2):
     Parámetros
     ----------
     padre1 : list
-        Individuo con formato [b0, b1, ecm].
+        Individuo con formato [b0, b1, ..., bd, ecm].
     padre2 : list
-        Individuo con formato [b0, b1, ecm].
+        Individuo con formato [b0, b1, ..., bd, ecm].
+    flujo : FlujoAleatorio o None
+        Fuente de números aleatorios. Si es None se usa el módulo 'random'.
 
     Retorna
     -------
     tuple
-        (hijo1, hijo2) donde cada hijo es [b0, b1].
+        (hijo1, hijo2) donde cada hijo es [b0, b1, ..., bd].
     """
-    alpha = random.random()
+    alpha = random.random() if flujo is None else flujo.siguiente()
 
-    p1_b0, p1_b1 = padre1[0], padre1[1]
-    p2_b0, p2_b1 = padre2[0], padre2[1]
+    genes1, genes2 = padre1[:-1], padre2[:-1]
 
-    h1_b0 = alpha * p1_b0 + (1 - alpha) * p2_b0
-    h1_b1 = alpha * p1_b1 + (1 - alpha) * p2_b1
+    hijo1 = [alpha * g1 + (1 - alpha) * g2 for g1, g2 in zip(genes1, genes2)]
+    hijo2 = [alpha * g2 + (1 - alpha) * g1 for g1, g2 in zip(genes1, genes2)]
 
-    h2_b0 = alpha * p2_b0 + (1 - alpha) * p1_b0
-    h2_b1 = alpha * p2_b1 + (1 - alpha) * p1_b1
+    return hijo1, hijo2
 
-    return [h1_b0, h1_b1], [h2_b0, h2_b1]
 
-
-def mutacion_uniforme(individuo, prob_mutacion, rango_mutacion):
+def mutacion_uniforme(individuo, prob_mutacion, rango_mutacion, flujo=None):
     """
     Mutación uniforme sobre un individuo.
 
-    Cada gen (b0 o b1) tiene prob_mutacion de sufrir 
+    Cada gen (b0, b1, ..., bd) tiene prob_mutacion de sufrir 
     un cambio aleatorio dentro de [-rango_mutacion, +rango_mutacion].
 
     Parámetros
     ----------
     individuo : list
-        Genes del individuo en forma [b0, b1].
+        Genes del individuo en forma [b0, b1, ..., bd].
     prob_mutacion : float
         Probabilidad de que cada gen mute.
     rango_mutacion : float
         Magnitud de la perturbación uniforme.
+    flujo : FlujoAleatorio o None
+        Fuente de números aleatorios. Si es None se usa el módulo 'random'.
 
     Retorna
     -------
     list
         Individuo mutado.
     """
-    b0, b1 = individuo
+    mutado = list(individuo)
+
+    if flujo is None:
+        for i in range(len(mutado)):
+            if random.random() < prob_mutacion:
+                mutado[i] += random.uniform(-rango_mutacion, rango_mutacion)
+        return mutado
+
+    for i in range(len(mutado)):
+        if flujo.siguiente() < prob_mutacion:
+            mutado[i] += flujo.uniforme(-rango_mutacion, rango_mutacion)
+
+    return mutado
+
+
+def seleccion_torneo_vectorizada(fitness, num_ganadores, k=3, rng=None):
+    """
+    Selección por torneo para toda una generación a la vez.
+
+    Se sortean 'num_ganadores' torneos de 'k' participantes (con reemplazo
+    entre torneos y dentro de cada uno) y se retorna el índice del
+    participante con menor ECM en cada torneo.
+
+    Parámetros
+    ----------
+    fitness : numpy.ndarray, forma (N,)
+        ECM de cada individuo de la población.
+    num_ganadores : int
+        Cantidad de torneos a realizar.
+    k : int
+        Cantidad de participantes por torneo.
+    rng : numpy.random.Generator o None
+        Generador a utilizar (ver obtener_generador).
+
+    Retorna
+    -------
+    numpy.ndarray, forma (num_ganadores,)
+        Índices de los individuos ganadores.
+    """
+    rng = obtener_generador(rng)
+    participantes = rng.integers(0, fitness.shape[0], size=(num_ganadores, k))
+    posicion = np.argmin(fitness[participantes], axis=1)
+    return participantes[np.arange(num_ganadores), posicion]
+
+
+def cruza_aritmetica_vectorizada(padres1, padres2, rng=None):
+    """
+    Cruza aritmética completa aplicada a pares de padres en bloque.
+
+    Cada pareja usa su propio factor alpha ~ U(0, 1).
+
+    Parámetros
+    ----------
+    padres1, padres2 : numpy.ndarray, forma (M, D)
+        Genes (b0, b1, ..., bd) de los padres.
+    rng : numpy.random.Generator o None
+        Generador a utilizar (ver obtener_generador).
+
+    Retorna
+    -------
+    tuple
+        (hijos1, hijos2), ambos de forma (M, D).
+    """
+    rng = obtener_generador(rng)
+    alpha = rng.random((padres1.shape[0], 1))
+    hijos1 = alpha * padres1 + (1 - alpha) * padres2
+    hijos2 = alpha * padres2 + (1 - alpha) * padres1
+    return hijos1, hijos2
+
+
+def mutacion_uniforme_vectorizada(genes, prob_mutacion, rango_mutacion, rng=None):
+    """
+    Mutación uniforme aplicada a todos los genes de una generación.
+
+    Modifica 'genes' en el lugar y lo retorna.
+
+    Parámetros
+    ----------
+    genes : numpy.ndarray, forma (M, D)
+        Genes de los individuos a mutar.
+    prob_mutacion : float
+        Probabilidad de que cada gen mute.
+    rango_mutacion : float
+        Magnitud de la perturbación uniforme.
+    rng : numpy.random.Generator o None
+        Generador a utilizar (ver obtener_generador).
+
+    Retorna
+    -------
+    numpy.ndarray
+        El mismo arreglo 'genes', mutado.
+    """
+    rng = obtener_generador(rng)
+    mascara = rng.random(genes.shape) < prob_mutacion
+    perturbacion = rng.uniform(-rango_mutacion, rango_mutacion, size=genes.shape)
+    genes += mascara * perturbacion
+    return genes
 
-    if random.random() < prob_mutacion:
-        b0 += random.uniform(-rango_mutacion, rango_mutacion)
 
-    if random.random() < prob_mutacion:
-        b1 += random.uniform(-rango_mutacion, rango_mutacion)
+def diversidad_poblacion(genes):
+    """
+    Diversidad de una población: desviación estándar de cada gen entre los
+    individuos, promediada sobre los genes (0 si todos son iguales).
+    """
+    genes = np.asarray(genes, dtype=float)
+    return float(np.std(genes, axis=0).mean())
 
-    return [b0, b1]
+
+def regla_un_quinto(rango_mutacion, tasa_exito, factor=0.85):
+    """
+    Regla de 1/5 de éxito (Rechenberg) para el rango de mutación.
+
+    Si más de 1/5 de los hijos mejora a sus padres la búsqueda es demasiado
+    local y el rango crece (se divide entre 'factor'); si menos, el rango
+    se reduce (se multiplica por 'factor').
+    """
+    if tasa_exito > 0.2:
+        return rango_mutacion / factor
+    if tasa_exito < 0.2:
+        return max(rango_mutacion * factor, 1e-12)
+    return rango_mutacion
+
+
+class ControlEvolucion:
+    """
+    Criterios de parada y mutación adaptativa del algoritmo genético.
+
+    Lleva la cuenta de la última generación con mejora, decide si la
+    corrida debe detenerse y adapta el rango de mutación con la regla de
+    1/5 de éxito. Al final, informa el resumen en params['detalles'] (que
+    experiment_runner agrega al registro de la corrida).
+
+    Parámetros (en params)
+    ----------------------
+    paciencia : int o None
+        Generaciones sin mejora del mejor ECM tras las que se detiene la
+        corrida (None = sin detección de estancamiento).
+    tolerancia : float
+        Mejora relativa mínima para considerar que el mejor ECM mejoró.
+    diversidad_minima : float o None
+        Diversidad (ver diversidad_poblacion) por debajo de la cual se
+        detiene la corrida porque la población colapsó.
+    mutacion_adaptativa : bool
+        Adaptar 'rango_mutacion' con la regla de 1/5 de éxito.
+    factor_adaptacion : float
+        Factor de la regla de 1/5 (entre 0 y 1).
+    """
+
+    def __init__(self, params):
+        self.paciencia = params.get('paciencia')
+        self.tolerancia = params.get('tolerancia', 1e-8)
+        self.diversidad_minima = params.get('diversidad_minima')
+        self.adaptativa = params.get('mutacion_adaptativa', False)
+        self.factor = params.get('factor_adaptacion', 0.85)
+        self.rango_mutacion = params.get('rango_mutacion', 0.1)
+
+        self.mejor = np.inf
+        self.generacion_mejora = 0
+        self.parada = 'generaciones'
+
+    def registrar(self, gen, mejor_ecm):
+        """Registra el mejor ECM de la generación 'gen'."""
+        if mejor_ecm < self.mejor * (1 - self.tolerancia):
+            self.mejor = mejor_ecm
+            self.generacion_mejora = gen
+
+    def detener(self, gen, mejor_ecm, genes=None):
+        """
+        Registra el mejor ECM de la generación 'gen' y decide si parar.
+        'genes' (la población) solo se usa con 'diversidad_minima'.
+        """
+        self.registrar(gen, mejor_ecm)
+
+        if mejor_ecm < 1e-10:
+            self.parada = 'convergencia'
+        elif self.paciencia is not None and gen - self.generacion_mejora >= self.paciencia:
+            self.parada = 'estancamiento'
+        elif self.diversidad_minima is not None and diversidad_poblacion(genes) < self.diversidad_minima:
+            self.parada = 'diversidad'
+        else:
+            return False
+        return True
+
+    def adaptar(self, tasa_exito):
+        if self.adaptativa:
+            self.rango_mutacion = regla_un_quinto(self.rango_mutacion, tasa_exito, self.factor)
+
+    def reportar(self, params, genes, rango_mutacion=None):
+        """Escribe el resumen de la corrida en params['detalles'] (si existe)."""
+        detalles = params.get('detalles')
+        if detalles is None:
+            return
+        detalles.update({
+            'Parada': self.parada,
+            'Generacion_Mejora': self.generacion_mejora,
+            'Diversidad_Final': diversidad_poblacion(genes),
+            'Rango_Mutacion_Final': self.rango_mutacion if rango_mutacion is None else rango_mutacion,
+        })
+
+
+def _nueva_generacion(objetivo, genes, fitness, params, rng, rango_mutacion=None):
+    """
+    Produce la siguiente generación de una población en arreglos:
+    élites + hijos por torneo, cruza aritmética y mutación uniforme.
+
+    Retorna
+    -------
+    tuple
+        (genes, fitness, ecm_hijos, tasa_exito) de la nueva generación;
+        'ecm_hijos' son las evaluaciones realizadas, en orden, y
+        'tasa_exito' la fracción de hijos que mejora al mejor de sus padres.
+    """
+    tam_poblacion, dimensiones = genes.shape
+    prob_mutacion = params.get('prob_mutacion', 0.1)
+    if rango_mutacion is None:
+        rango_mutacion = params.get('rango_mutacion', 0.1)
+    k_torneo = params.get('k_torneo', 3)
+    num_elites = min(params.get('elitismo', 1), tam_poblacion)
+
+    num_hijos = tam_poblacion - num_elites
+    num_parejas = (num_hijos + 1) // 2
+
+    # Operadores medidos con params['perfil']; sin perfil son los originales
+    perfil = params.get('perfil')
+    seleccionar = instrumentar(seleccion_torneo_vectorizada, perfil, 'seleccion')
+    cruzar = instrumentar(cruza_aritmetica_vectorizada, perfil, 'cruza')
+    mutar = instrumentar(mutacion_uniforme_vectorizada, perfil, 'mutacion')
+
+    # Elitismo: los 'num_elites' mejores sin ordenar toda la población
+    if 0 < num_elites < tam_poblacion:
+        elites = np.argpartition(fitness, num_elites - 1)[:num_elites]
+    else:
+        elites = np.arange(num_elites)
+
+    ganadores = seleccionar(fitness, 2 * num_parejas, k_torneo, rng)
+    hijos1, hijos2 = cruzar(genes[ganadores[:num_parejas]], genes[ganadores[num_parejas:]], rng)
+
+    # Se intercalan los hijos como en la versión por individuo
+    hijos = np.empty((2 * num_parejas, dimensiones))
+    hijos[0::2] = hijos1
+    hijos[1::2] = hijos2
+    hijos = mutar(hijos[:num_hijos], prob_mutacion, rango_mutacion, rng)
+
+    ecm_hijos = objetivo.evaluar_matriz(hijos)
+
+    mejor_padre = np.minimum(fitness[ganadores[:num_parejas]], fitness[ganadores[num_parejas:]])
+    tasa_exito = float(np.mean(ecm_hijos < np.repeat(mejor_padre, 2)[:num_hijos])) if num_hijos else 0.0
+
+    genes = np.concatenate((genes[elites], hijos))
+    fitness = np.concatenate((fitness[elites], ecm_hijos))
+    return genes, fitness, ecm_hijos, tasa_exito
+
+
+def _genetico_arreglos(objetivo, params):
+    """
+    Variante del algoritmo genético respaldada por arreglos NumPy.
+
+    La población es un arreglo (N, D) de genes (D = d + 1 coeficientes) más
+    un arreglo (N,) de ECM.
+    Selección, cruza y mutación se aplican a toda la generación con
+    operaciones vectorizadas, y los élites se obtienen con argpartition en
+    lugar de ordenar la población completa.
+    """
+    tam_poblacion = params.get('tam_poblacion', 50)
+    num_generaciones = params.get('generaciones', 100)
+    rango_ini = params.get('rango_inicio', (-10, 10))
+    rng = generador_desde_params(params)
+
+    # Inicialización de población
+    dimensiones = objetivo.dimension + 1
+    genes = rng.uniform(*rango_ini, size=(tam_poblacion, dimensiones))
+    fitness = objetivo.evaluar_matriz(genes)
+
+    idx_mejor = int(np.argmin(fitness))
+    mejor_global = genes[idx_mejor].copy()
+    mejor_ecm = float(fitness[idx_mejor])
+    historial = crear_registro(params, capacidad=num_generaciones)
+    control = ControlEvolucion(params)
+
+    perfil = params.get('perfil')
+    instrumentar_metodos(historial, perfil, {'registrar': 'historial'})
+    instrumentar_metodos(control, perfil, {'detener': 'control'})
+
+    # Bucle generacional
+    for gen in range(num_generaciones):
+
+        idx_mejor = int(np.argmin(fitness))
+        ecm_actual = float(fitness[idx_mejor])
+        historial.registrar(ecm_actual)
+
+        if ecm_actual < mejor_ecm:
+            mejor_ecm = ecm_actual
+            mejor_global = genes[idx_mejor].copy()
+
+        if control.detener(gen, mejor_ecm, genes):
+            break
+
+        genes, fitness, _, tasa_exito = _nueva_generacion(objetivo, genes, fitness, params, rng,
+                                                          control.rango_mutacion)
+        control.adaptar(tasa_exito)
+
+    control.reportar(params, genes)
+    historial.reportar(params)
+    return mejor_global.tolist(), mejor_ecm, gen, historial.valores()
+
+
+# Grupo de procesos del modelo de islas, (procesos, ejecutor): se crea la
+# primera vez que se necesita y se reutiliza en las corridas siguientes
+_EJECUTOR_ISLAS = None
+
+
+def _ejecutor_islas(procesos):
+    """Grupo de procesos compartido por las corridas del modelo de islas."""
+    global _EJECUTOR_ISLAS
+    if _EJECUTOR_ISLAS is None or _EJECUTOR_ISLAS[0] != procesos:
+        cerrar_ejecutor_islas()
+        _EJECUTOR_ISLAS = (procesos, ProcessPoolExecutor(max_workers=procesos))
+    return _EJECUTOR_ISLAS[1]
+
+
+def cerrar_ejecutor_islas(cancelar=False):
+    """Detiene el grupo de procesos del modelo de islas (si existe)."""
+    global _EJECUTOR_ISLAS
+    if _EJECUTOR_ISLAS is not None:
+        _EJECUTOR_ISLAS[1].shutdown(wait=not cancelar, cancel_futures=cancelar)
+        _EJECUTOR_ISLAS = None
+
+
+atexit.register(cerrar_ejecutor_islas)
+
+
+def _evolucionar_isla(estado, num_generaciones, objetivo, params):
+    """
+    Evoluciona una isla 'num_generaciones' generaciones de forma aislada.
+
+    Parámetros
+    ----------
+    estado : tuple
+        (genes, fitness, rng, rango_mutacion) de la isla.
+    objetivo : ObjetivoECM
+        Objetivo sin instrumentar (solo estadísticos: se envía por tarea).
+    params : dict
+        Parámetros de los operadores.
+
+    Retorna
+    -------
+    tuple
+        (estado, mejores, evaluadas, mejor): el nuevo estado, el mejor ECM
+        de la isla al inicio de cada generación, todas las evaluaciones
+        hechas (en orden, para el contador del proceso principal) y el
+        mejor individuo visto en la época como (genes, ecm).
+    """
+    genes, fitness, rng, rango_mutacion = estado
+    adaptativa = params.get('mutacion_adaptativa', False)
+
+    idx = int(np.argmin(fitness))
+    mejor = (genes[idx].copy(), float(fitness[idx]))
+    mejores = np.empty(num_generaciones)
+    evaluadas = []
+    for g in range(num_generaciones):
+        mejores[g] = fitness.min()
+        genes, fitness, ecm_hijos, tasa_exito = _nueva_generacion(objetivo, genes, fitness, params,
+                                                                  rng, rango_mutacion)
+        if adaptativa:
+            rango_mutacion = regla_un_quinto(rango_mutacion, tasa_exito,
+                                             params.get('factor_adaptacion', 0.85))
+        evaluadas.append(ecm_hijos)
+
+        # Sin elitismo el mejor individuo puede perderse en la generación siguiente
+        idx = int(np.argmin(fitness))
+        if fitness[idx] < mejor[1]:
+            mejor = (genes[idx].copy(), float(fitness[idx]))
+
+    evaluadas = np.concatenate(evaluadas) if evaluadas else np.empty(0)
+    return (genes, fitness, rng, rango_mutacion), mejores, evaluadas, mejor
+
+
+def origenes_migracion(num_islas, topologia):
+    """
+    Islas de las que recibe migrantes cada isla.
+
+    Parámetros
+    ----------
+    num_islas : int
+    topologia : str
+        'anillo' (la isla i recibe de la i - 1) o 'completa' (cada isla
+        recibe de todas las demás).
+
+    Retorna
+    -------
+    list de list
+        origenes[i] = islas que envían migrantes a la isla i.
+    """
+    if topologia == 'anillo':
+        return [[(i - 1) % num_islas] for i in range(num_islas)]
+    if topologia == 'completa':
+        return [[j for j in range(num_islas) if j != i] for i in range(num_islas)]
+    raise ValueError(f"Topología desconocida: '{topologia}'. Opciones: anillo, completa.")
+
+
+def migrar(estados, origenes, num_migrantes):
+    """
+    Intercambia los mejores individuos entre islas.
+
+    Cada isla envía copias de sus 'num_migrantes' mejores individuos a las
+    islas que la tienen como origen; los inmigrantes reemplazan a los peores
+    individuos de la isla receptora. Los ECM viajan con los genes, por lo
+    que la migración no requiere evaluaciones.
+
+    Parámetros
+    ----------
+    estados : list de (genes, fitness, rng, rango_mutacion)
+    origenes : list de list
+        Ver origenes_migracion.
+    num_migrantes : int
+
+    Retorna
+    -------
+    list de (genes, fitness, rng, rango_mutacion)
+    """
+    # Los emigrantes se eligen antes de modificar cualquier isla
+    emigrantes = []
+    for genes, fitness, *_ in estados:
+        mejores = np.argsort(fitness, kind='stable')[:num_migrantes]
+        emigrantes.append((genes[mejores], fitness[mejores]))
+
+    nuevos = []
+    for (genes, fitness, *resto), fuentes in zip(estados, origenes):
+        genes_in = np.concatenate([emigrantes[j][0] for j in fuentes])
+        fitness_in = np.concatenate([emigrantes[j][1] for j in fuentes])
+        k = min(len(fitness_in), len(fitness) - 1)
+
+        genes, fitness = genes.copy(), fitness.copy()
+        peores = np.argsort(fitness, kind='stable')[len(fitness) - k:]
+        genes[peores] = genes_in[:k]
+        fitness[peores] = fitness_in[:k]
+        nuevos.append((genes, fitness, *resto))
+    return nuevos
+
+
+def _genetico_islas(objetivo, params):
+    """
+    Modelo de islas: varias subpoblaciones (cada una con la variante por
+    arreglos) evolucionan por separado y cada 'migracion_cada' generaciones
+    intercambian sus mejores individuos según la topología.
+
+    Entre migraciones las islas son independientes, por lo que cada época
+    se reparte entre procesos trabajadores (params['n_jobs']), que se
+    reutilizan entre corridas (ver cerrar_ejecutor_islas). Cada isla tiene
+    su propio generador derivado del de la corrida, de modo que el
+    resultado no depende del número de procesos. El resultado es el mejor
+    individuo visto en toda la corrida, no solo en las poblaciones finales.
+
+    El historial es una matriz (generaciones, islas) con el mejor ECM de
+    cada isla al inicio de cada generación.
+
+    'objetivo' debe ser el objetivo sin instrumentar: las evaluaciones se
+    informan a params['contador'] al terminar cada época, por lo que el
+    tiempo hasta cada meta tiene la resolución de una época. Del mismo modo,
+    params['perfil'] solo mide el proceso principal: 'evolucion' (épocas
+    completas de todas las islas, evaluaciones incluidas), 'migracion',
+    'control' e 'historial'.
+    """
+    num_islas = params['islas']
+    tam_poblacion = params.get('tam_poblacion', 50)
+    num_generaciones = params.get('generaciones', 100)
+    rango_ini = params.get('rango_inicio', (-10, 10))
+    migracion_cada = max(1, params.get('migracion_cada', 10))
+    num_migrantes = params.get('migrantes', 1)
+    origenes = origenes_migracion(num_islas, params.get('topologia', 'anillo'))
+    n_jobs = params.get('n_jobs', 1)
+    procesos = os.cpu_count() if n_jobs == -1 else min(n_jobs, num_islas)
+
+    # Los trabajadores reciben el objetivo sin instrumentar; las evaluaciones
+    # se informan al contador en el proceso principal al final de cada época
+    contador = params.get('contador')
+    operadores = {c: params[c] for c in ('prob_mutacion', 'rango_mutacion', 'k_torneo', 'elitismo',
+                                         'mutacion_adaptativa', 'factor_adaptacion')
+                  if c in params}
+    control = ControlEvolucion(params)
+
+    rng = generador_desde_params(params)
+    dimensiones = objetivo.dimension + 1
+    estados = []
+    for semilla in rng.integers(0, 2**63 - 1, size=num_islas):
+        rng_isla = np.random.default_rng(int(semilla))
+        genes = rng_isla.uniform(*rango_ini, size=(tam_poblacion, dimensiones))
+        fitness = objetivo.evaluar_matriz(genes)
+        if contador is not None:
+            contador.registrar_lote(fitness)
+        estados.append((genes, fitness, rng_isla, control.rango_mutacion))
+
+    historial = crear_registro(params, capacidad=num_generaciones, ancho=num_islas)
+
+    # Mejor individuo visto en todas las islas y épocas
+    genes, fitness, *_ = min(estados, key=lambda estado: estado[1].min())
+    idx_mejor = int(np.argmin(fitness))
+    mejor_global, mejor_ecm_global = genes[idx_mejor].copy(), float(fitness[idx_mejor])
+
+    ejecutor = _ejecutor_islas(procesos) if procesos > 1 else None
+
+    def evolucionar(estados, epoca):
+        if ejecutor is None:
+            return [_evolucionar_isla(estado, epoca, objetivo, operadores) for estado in estados]
+        return list(ejecutor.map(_evolucionar_isla, estados, [epoca] * num_islas,
+                                 [objetivo] * num_islas, [operadores] * num_islas))
+
+    perfil = params.get('perfil')
+    evolucionar = instrumentar(evolucionar, perfil, 'evolucion')
+    migrar_islas = instrumentar(migrar, perfil, 'migracion')
+    instrumentar_metodos(historial, perfil, {'registrar_lote': 'historial'})
+    instrumentar_metodos(control, perfil, {'detener': 'control'})
+
+    hechas = 0
+    try:
+        while hechas < num_generaciones:
+            epoca = min(migracion_cada, num_generaciones - hechas)
+            resultados = evolucionar(estados, epoca)
+
+            estados = [estado for estado, *_ in resultados]
+            mejores = np.column_stack([mejores for _, mejores, *_ in resultados])
+            historial.registrar_lote(mejores)
+            if contador is not None:
+                for _, _, evaluadas, _ in resultados:
+                    contador.registrar_lote(evaluadas)
+            for *_, (genes, ecm) in resultados:
+                if ecm < mejor_ecm_global:
+                    mejor_global, mejor_ecm_global = genes, ecm
+
+            # Estancamiento y diversidad se revisan al final de cada época
+            for g, mejor in enumerate(mejores.min(axis=1), start=hechas):
+                control.registrar(g, mejor)
+            hechas += epoca
+
+            genes_todos = np.concatenate([genes for genes, *_ in estados])
+            mejor_ecm = min(fitness.min() for _, fitness, *_ in estados)
+            if control.detener(hechas, mejor_ecm, genes_todos):
+                break
+            if hechas < num_generaciones:
+                estados = migrar_islas(estados, origenes, num_migrantes)
+    except BaseException:
+        # Un grupo con un error (o interrumpido) no se reutiliza
+        if ejecutor is not None:
+            cerrar_ejecutor_islas(cancelar=True)
+        raise
+
+    control.reportar(params, np.concatenate([genes for genes, *_ in estados]),
+                     float(np.mean([rango for *_, rango in estados])))
+
+    historial.reportar(params)
+    return mejor_global.tolist(), mejor_ecm_global, hechas - 1, historial.valores()
 
 
 def genetico(x, y, params):
     """
     Algoritmo Genético para aproximar los parámetros de una 
-    regresión lineal simple minimizando el ECM.
+    regresión lineal (simple o múltiple) minimizando el ECM.
 
-    Cada individuo representa un par (b0, b1).
+    Cada individuo representa un vector de coeficientes (b0, b1, ..., bd).
 
     Parámetros
     ----------
     x, y : array_like
-        Datos de entrada y salida.
+        Datos de entrada (n,) o (n, d) y salida. En lugar de los arreglos
+        puede pasarse un ObjetivoECM precalculado como 'x' (y 'y' = None).
     params : dict
         - tam_poblacion : tamaño de la población
         - generaciones : número de generaciones
@@ -119,66 +672,129 @@ def genetico(x, y, params):
         - rango_mutacion : magnitud de la mutación
         - k_torneo : tamaño del torneo
         - rango_inicio : (min, max) para inicializar poblaciones
+        - modo : 'lista' (por defecto) o 'arreglos' para la variante
+          vectorizada con la población en arreglos NumPy
+        - elitismo : número de élites conservados (solo modo 'arreglos'
+          y modelo de islas)
+        - islas : si es mayor que 1, se usa el modelo de islas con ese
+          número de subpoblaciones de 'tam_poblacion' individuos cada una
+          (variante por arreglos)
+        - migracion_cada : generaciones entre migraciones (islas)
+        - migrantes : mejores individuos que envía cada isla (islas)
+        - topologia : 'anillo' o 'completa' (islas)
+        - n_jobs : procesos para evolucionar las islas (-1 = todos los
+          núcleos); el resultado no depende de este valor
+        - rng : numpy.random.Generator opcional
+        - semilla : semilla del generador (si no se indica 'rng')
+        - historial : modo de registro del historial ('completo',
+          'diezmado', 'mejoras' o 'apagado')
+        - historial_cada : intervalo del modo 'diezmado'
+        - paciencia, tolerancia, diversidad_minima : criterios de parada
+          por estancamiento y por pérdida de diversidad (ver
+          ControlEvolucion)
+        - mutacion_adaptativa, factor_adaptacion : rango de mutación
+          adaptado con la regla de 1/5 de éxito
+        - detalles : dict opcional donde se informan el motivo de parada,
+          la última generación con mejora, la diversidad final y el rango
+          de mutación final (lo agrega experiment_runner)
+        - perfil : PerfilFases opcional (lo agrega experiment_runner con
+          perfilar=True). Mide las fases 'seleccion', 'cruza', 'mutacion',
+          'evaluacion', 'control' (criterios de parada) e 'historial'
+          (ver _genetico_islas para el modelo de islas)
 
     Retorna
     -------
     tuple
-        ([b0, b1], mejor_ecm, generaciones_usadas, historial_ecm)
+        ([b0, b1, ..., bd], mejor_ecm, generaciones_usadas, historial_ecm).
+        En el modelo de islas el historial es una matriz
+        (generaciones, islas) con el historial de cada isla.
     """
 
     tam_poblacion = params.get('tam_poblacion', 50)
     num_generaciones = params.get('generaciones', 100)
     prob_mutacion = params.get('prob_mutacion', 0.1)
-    rango_mutacion = params.get('rango_mutacion', 0.1)
     k_torneo = params.get('k_torneo', 3)
     rango_ini = params.get('rango_inicio', (-10, 10))
 
+    if params.get('islas', 1) > 1:
+        return _genetico_islas(crear_objetivo(x, y), params)
+
+    objetivo = crear_objetivo(x, y, params)
+
+    if params.get('modo', 'lista') == 'arreglos':
+        return _genetico_arreglos(objetivo, params)
+
+    # Números aleatorios extraídos por bloques de un generador propio
+    flujo = FlujoAleatorio(generador_desde_params(params))
+
     # Inicialización de población
-    poblacion = []
-    for _ in range(tam_poblacion):
-        b0 = random.uniform(*rango_ini)
-        b1 = random.uniform(*rango_ini)
-        ecm = calcular_ecm(b0, b1, x, y)
-        poblacion.append([b0, b1, ecm])
-
-    poblacion.sort(key=lambda ind: ind[2])
+    dimensiones = objetivo.dimension + 1
+    genes = [[flujo.uniforme(*rango_ini) for _ in range(dimensiones)]
+             for _ in range(tam_poblacion)]
+    ecms = objetivo.evaluar_matriz(np.array(genes))
+    poblacion = [[*ind, ecm] for ind, ecm in zip(genes, ecms.tolist())]
+
+    poblacion.sort(key=lambda ind: ind[-1])
     mejor_global = list(poblacion[0])
-    historial = []
+    historial = crear_registro(params, capacidad=num_generaciones)
+    control = ControlEvolucion(params)
+
+    # Operadores medidos con params['perfil']; sin perfil son los originales
+    perfil = params.get('perfil')
+    seleccionar = instrumentar(seleccion_torneo, perfil, 'seleccion')
+    cruzar = instrumentar(cruza_aritmetica_completa, perfil, 'cruza')
+    mutar = instrumentar(mutacion_uniforme, perfil, 'mutacion')
+    instrumentar_metodos(historial, perfil, {'registrar': 'historial'})
+    instrumentar_metodos(control, perfil, {'detener': 'control'})
 
     # Bucle generacional
     for gen in range(num_generaciones):
 
         mejor_actual = poblacion[0]
-        historial.append(mejor_actual[2])
+        historial.registrar(mejor_actual[-1])
 
-        if mejor_actual[2] < mejor_global[2]:
+        if mejor_actual[-1] < mejor_global[-1]:
             mejor_global = list(mejor_actual)
 
-        if mejor_global[2] < 1e-10:
+        # La diversidad solo se calcula si es un criterio de parada
+        genes = [ind[:-1] for ind in poblacion] if control.diversidad_minima is not None else None
+        if control.detener(gen, mejor_global[-1], genes):
             break
 
         nueva = [list(poblacion[0])]  # Elitismo
 
-        while len(nueva) < tam_poblacion:
-            padre1 = seleccion_torneo(poblacion, k_torneo)
-            padre2 = seleccion_torneo(poblacion, k_torneo)
+        # Se generan primero todos los hijos y se evalúan en un solo lote
+        hijos = []
+        mejor_padre = []
+        num_hijos = tam_poblacion - 1
+        rango_mutacion = control.rango_mutacion
 
-            hijo1, hijo2 = cruza_aritmetica_completa(padre1, padre2)
+        while len(hijos) < num_hijos:
+            padre1 = seleccionar(poblacion, k_torneo, flujo)
+            padre2 = seleccionar(poblacion, k_torneo, flujo)
 
-            hijo1 = mutacion_uniforme(hijo1, prob_mutacion, rango_mutacion)
-            hijo2 = mutacion_uniforme(hijo2, prob_mutacion, rango_mutacion)
+            hijo1, hijo2 = cruzar(padre1, padre2, flujo)
 
-            ecm1 = calcular_ecm(hijo1[0], hijo1[1], x, y)
-            ecm2 = calcular_ecm(hijo2[0], hijo2[1], x, y)
+            hijo1 = mutar(hijo1, prob_mutacion, rango_mutacion, flujo)
+            hijo2 = mutar(hijo2, prob_mutacion, rango_mutacion, flujo)
 
-            nueva.append([hijo1[0], hijo1[1], ecm1])
-            if len(nueva) < tam_poblacion:
-                nueva.append([hijo2[0], hijo2[1], ecm2])
+            hijos.append(hijo1)
+            if len(hijos) < num_hijos:
+                hijos.append(hijo2)
+            mejor_padre.append(min(padre1[-1], padre2[-1]))
 
-        nueva.sort(key=lambda ind: ind[2])
+        if hijos:
+            ecms = objetivo.evaluar_matriz(np.array(hijos))
+            for hijo, ecm in zip(hijos, ecms.tolist()):
+                nueva.append([*hijo, ecm])
+            control.adaptar(float(np.mean(ecms < np.repeat(mejor_padre, 2)[:num_hijos])))
+
+        nueva.sort(key=lambda ind: ind[-1])
         poblacion = nueva
 
-    return [mejor_global[0], mejor_global[1]], mejor_global[2], gen, historial
+    control.reportar(params, [ind[:-1] for ind in poblacion])
+    historial.reportar(params)
+    return mejor_global[:-1], mejor_global[-1], gen, historial.valores()
 
 
 def main():
@@ -212,6 +828,16 @@ def main():
     print(f"ECM final:   {error:.6f}")
     print(f"Generaciones: {gens}")
 
+    # Modelo de islas: 4 subpoblaciones en anillo que migran cada 10 generaciones
+    params_islas = dict(params, islas=4, migracion_cada=10, migrantes=2, topologia='anillo')
+    betas, error, gens, hist = genetico(X, Y, params_islas)
+
+    print("\nModelo de islas (4 islas, anillo):")
+    print(f"b0 estimado: {betas[0]:.4f}")
+    print(f"b1 estimado: {betas[1]:.4f}")
+    print(f"ECM final:   {error:.6f}")
+    print(f"Mejor ECM final por isla: {np.round(hist[-1], 6)}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,192 @@
+import sys
+import os
+import math
+import numpy as np
+
+# Agregar la raíz del proyecto al path (solo para ejecución directa de este archivo)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..', '..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from src.utils.objetivo import ObjetivoECM, crear_objetivo, vector_inicial
+from src.utils.aleatorio import generador_desde_params
+from src.utils.historial import crear_registro
+
+
+def gradiente_lote(b0, b1, x_lote, y_lote):
+    """
+    Gradiente del ECM de un mini-lote respecto de (b0, b1).
+
+    Con x_lote de forma (m, d) y b1 de forma (d,) el segundo componente es
+    el vector de derivadas respecto de cada pendiente.
+
+    Retorna
+    -------
+    (float, float o numpy.ndarray)
+        (dECM/db0, dECM/db1) estimados con el lote.
+    """
+    residuo = y_lote - (np.dot(x_lote, b1) + b0)
+    m = residuo.shape[0]
+    return -2.0 * residuo.sum() / m, -2.0 * np.dot(residuo, x_lote) / m
+
+
+def descenso_gradiente(x, y, params):
+    """
+    Descenso por gradiente estocástico (SGD) o Adam con mini-lotes para la
+    regresión lineal simple o múltiple.
+
+    Junto con minimos_cuadrados sirve de línea base de velocidad frente a
+    las metaheurísticas. Si se recibe un ObjetivoECM en lugar de los datos,
+    el gradiente se calcula de forma exacta a partir de los estadísticos
+    suficientes (descenso por lote completo, O(1) por paso).
+
+    Parámetros
+    ----------
+    x, y : array_like
+        Datos de entrenamiento (x de forma (n,) o (n, d)), o un ObjetivoECM
+        como 'x' (y 'y' = None).
+    params : dict
+        Parámetros del algoritmo:
+            - inicio_b0, inicio_b1 : valores iniciales.
+            - inicio : vector inicial [b0, b1, ..., bd] (opcional).
+            - optimizador : 'adam' (por defecto) o 'sgd'.
+            - tasa_aprendizaje : tamaño de paso (por defecto 0.01).
+            - epocas : pasadas completas sobre los datos.
+            - tam_lote : observaciones por mini-lote.
+            - beta1, beta2, epsilon : constantes de Adam.
+            - tol : detiene la búsqueda si la norma del gradiente exacto
+              es menor que este valor (por defecto 0, desactivado).
+            - rng / semilla : generador para barajar los datos.
+            - historial / historial_cada : registro del historial.
+
+    Con params['contador'] (lo agrega experiment_runner) cada gradiente,
+    de mini-lote o exacto, cuenta en 'gradientes'. El ECM que se calcula
+    solo para el historial no cuenta como evaluación, pero sí actualiza las
+    metas, cuyo costo queda medido en gradientes.
+
+    Retorna
+    -------
+    list
+        Coeficientes [b0, b1, ..., bd] finales.
+    float
+        ECM de la solución final (sobre todos los datos).
+    int
+        Número de actualizaciones realizadas.
+    numpy.ndarray
+        Historial del ECM tras cada actualización.
+    """
+    optimizador = params.get('optimizador', 'adam')
+    tasa = params.get('tasa_aprendizaje', 0.01)
+    epocas = params.get('epocas', 20)
+    tam_lote = params.get('tam_lote', 32)
+    beta1 = params.get('beta1', 0.9)
+    beta2 = params.get('beta2', 0.999)
+    epsilon = params.get('epsilon', 1e-8)
+    tol = params.get('tol', 0.0)
+
+    if optimizador not in ('sgd', 'adam'):
+        raise ValueError(f"Optimizador desconocido: '{optimizador}'. Opciones: sgd, adam.")
+
+    rng = generador_desde_params(params)
+
+    # 'ecm' (sin instrumentar) solo alimenta el historial y el resultado
+    ecm = crear_objetivo(x, y)
+    objetivo = crear_objetivo(ecm, None, params)
+    contador = params.get('contador')
+
+    # Pendiente escalar en la regresión simple, vector (d,) en la múltiple
+    inicio = vector_inicial(params, objetivo.dimension)
+    b0 = float(inicio[0])
+    b1 = float(inicio[1]) if objetivo.dimension == 1 else inicio[1:].copy()
+
+    # Sin datos crudos (ObjetivoECM): un paso de lote completo por época
+    con_datos = not isinstance(x, ObjetivoECM)
+    if con_datos:
+        y = np.asarray(y, dtype=float).ravel()
+        x = np.asarray(x, dtype=float).reshape(y.shape[0], -1)
+        if x.shape[1] == 1:
+            x = x.ravel()
+        lotes_por_epoca = math.ceil(x.shape[0] / tam_lote)
+    else:
+        lotes_por_epoca = 1
+
+    def registrar(valor):
+        historial.registrar(valor)
+        if contador is not None:
+            contador.registrar_progreso(valor)
+
+    historial = crear_registro(params, capacidad=epocas * lotes_por_epoca + 1)
+    registrar(ecm(b0, b1))
+
+    m0 = v0 = 0.0
+    m1 = v1 = np.zeros_like(b1)
+    iteracion = 0
+
+    for _ in range(epocas):
+        orden = rng.permutation(x.shape[0]) if con_datos else None
+
+        for lote in range(lotes_por_epoca):
+            if con_datos:
+                indices = orden[lote * tam_lote:(lote + 1) * tam_lote]
+                g0, g1 = gradiente_lote(b0, b1, x[indices], y[indices])
+                if contador is not None:
+                    contador.registrar_gradiente()
+            else:
+                g0, g1 = objetivo.gradiente(b0, b1)
+
+            iteracion += 1
+
+            if optimizador == 'sgd':
+                b0 -= tasa * g0
+                b1 = b1 - tasa * g1
+            else:
+                m0 = beta1 * m0 + (1 - beta1) * g0
+                m1 = beta1 * m1 + (1 - beta1) * g1
+                v0 = beta2 * v0 + (1 - beta2) * g0 * g0
+                v1 = beta2 * v1 + (1 - beta2) * g1 * g1
+                correccion1 = 1 - beta1 ** iteracion
+                correccion2 = 1 - beta2 ** iteracion
+                b0 -= tasa * (m0 / correccion1) / (math.sqrt(v0 / correccion2) + epsilon)
+                b1 = b1 - tasa * (m1 / correccion1) / (np.sqrt(v1 / correccion2) + epsilon)
+
+            registrar(ecm(b0, b1))
+
+        if tol > 0:
+            g0, g1 = objetivo.gradiente(b0, b1)
+            if math.sqrt(g0 * g0 + np.sum(np.square(g1))) < tol:
+                break
+
+    betas = [float(b0)] + np.atleast_1d(b1).astype(float).tolist()
+    historial.reportar(params)
+    return betas, float(ecm(b0, b1)), iteracion, historial.valores()
+
+
+def main():
+    print("--- Prueba de descenso por gradiente (Adam) ---")
+
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 5, 200)
+    Y = 4 * X + 2
+
+    print("Modelo objetivo: b0 = 2, b1 = 4")
+
+    params = {
+        'optimizador': 'adam',
+        'tasa_aprendizaje': 0.1,
+        'epocas': 50,
+        'tam_lote': 16,
+        'semilla': 0
+    }
+
+    betas, error, iters, hist = descenso_gradiente(X, Y, params)
+
+    print("\nResultados:")
+    print(f"b0 estimado: {betas[0]:.4f}")
+    print(f"b1 estimado: {betas[1]:.4f}")
+    print(f"ECM final:   {error:.6f}")
+    print(f"Actualizaciones: {iters}")
+
+
+if __name__ == "__main__":
+    main()
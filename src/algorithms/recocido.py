@@ -10,10 +10,13 @@ root_dir = os.path.abspath(os.path.join(current_dir, '..', '..'))
 if root_dir not in sys.path:
     sys.path.append(root_dir)
 
-from src.utils.common import calcular_ecm
+from src.utils.objetivo import crear_objetivo, vector_inicial
+from src.utils.aleatorio import FlujoAleatorio, generador_desde_params
+from src.utils.historial import crear_registro
+from src.utils.perfilado import instrumentar, instrumentar_metodos
 
 
-def generar_vecino(b0, b1, paso):
+def generar_vecino(b0, b1, paso, flujo=None):
     """
     Genera un vecino perturbando aleatoriamente los parámetros.
 
@@ -25,68 +28,372 @@ def generar_vecino(b0, b1, paso):
         Parámetros actuales de la regresión.
     paso : float
         Magnitud máxima de la perturbación.
+    flujo : FlujoAleatorio o None
+        Fuente de números aleatorios. Si es None se usa el módulo 'random'.
 
     Retorna
     -------
     (float, float)
         Nuevos valores (b0, b1) vecinos.
     """
+    if flujo is None:
+        return (
+            b0 + random.uniform(-paso, paso),
+            b1 + random.uniform(-paso, paso)
+        )
+
     return (
-        b0 + random.uniform(-paso, paso),
-        b1 + random.uniform(-paso, paso)
+        b0 + flujo.uniforme(-paso, paso),
+        b1 + flujo.uniforme(-paso, paso)
     )
 
 
+def generar_vecino_vector(betas, paso, flujo=None):
+    """
+    Versión vectorial de generar_vecino para un vector de coeficientes
+    [b0, b1, ..., bd] de cualquier dimensión.
+
+    Las perturbaciones se extraen en el mismo orden que en generar_vecino
+    (b0 primero), de modo que con d = 1 ambas producen el mismo vecino.
+
+    Parámetros
+    ----------
+    betas : numpy.ndarray, forma (d + 1,)
+        Coeficientes actuales.
+    paso : float
+        Magnitud máxima de la perturbación.
+    flujo : FlujoAleatorio o None
+        Fuente de números aleatorios. Si es None se usa el módulo 'random'.
+
+    Retorna
+    -------
+    numpy.ndarray, forma (d + 1,)
+    """
+    if flujo is None:
+        return betas + np.array([random.uniform(-paso, paso) for _ in range(betas.size)])
+    return betas + flujo.uniformes(-paso, paso, betas.size)
+
+
+def enfriamiento_geometrico(temp, iteracion, params, tasa_aceptacion):
+    """Esquema geométrico: T <- alpha * T (comportamiento original)."""
+    return temp * params.get('alpha', 0.95)
+
+
+def enfriamiento_logaritmico(temp, iteracion, params, tasa_aceptacion):
+    """
+    Esquema logarítmico: T_k = T_0 * ln(2) / ln(k + 2).
+
+    Desciende muy lentamente, por lo que requiere 'max_iter' o un criterio
+    de estancamiento para terminar en un tiempo razonable.
+    """
+    return params.get('t_inicial', 100.0) * math.log(2) / math.log(iteracion + 2)
+
+
+def enfriamiento_adaptativo(temp, iteracion, params, tasa_aceptacion):
+    """
+    Esquema adaptativo según la tasa de aceptación de la última ventana.
+
+    Se aplica T <- alpha^r * T con r = tasa / aceptacion_objetivo (acotado a
+    [0.1, 2]): si se acepta más de lo buscado la temperatura baja más
+    rápido, y si se acepta poco el enfriamiento se frena.
+    """
+    alpha = params.get('alpha', 0.95)
+    objetivo = params.get('aceptacion_objetivo', 0.44)
+    razon = min(max(tasa_aceptacion / objetivo, 0.1), 2.0)
+    return temp * alpha ** razon
+
+
+ESQUEMAS_ENFRIAMIENTO = {
+    'geometrico': enfriamiento_geometrico,
+    'logaritmico': enfriamiento_logaritmico,
+    'adaptativo': enfriamiento_adaptativo,
+}
+
+
+def pasos_enfriamiento(t_inicial, t_final, alpha):
+    """
+    Número de pasos del enfriamiento geométrico T <- alpha * T desde
+    t_inicial hasta t_final (se usa para preasignar el historial).
+    """
+    if 0 < alpha < 1 and t_inicial > t_final > 0:
+        return math.ceil(math.log(t_final / t_inicial) / math.log(alpha)) + 1
+    return 1024
+
+
+def intercambiar_replicas(estados, ecms, temperaturas, desfase, u):
+    """
+    Intercambio de réplicas entre cadenas de temperaturas adyacentes.
+
+    Se proponen los pares (k, k + 1) con k = desfase, desfase + 2, ...
+    (pares disjuntos, alternando desfase 0 y 1 entre llamadas) y cada par
+    intercambia sus estados con probabilidad
+        min(1, exp((1/T_k - 1/T_{k+1}) * (E_k - E_{k+1}))).
+
+    Modifica 'estados' y 'ecms' en el lugar.
+
+    Parámetros
+    ----------
+    estados : numpy.ndarray, forma (K, d + 1)
+        Coeficientes [b0, b1, ..., bd] de cada cadena.
+    ecms : numpy.ndarray, forma (K,)
+        ECM actual de cada cadena.
+    temperaturas : numpy.ndarray, forma (K,)
+        Temperatura de cada cadena.
+    desfase : int
+        0 o 1; índice de la primera cadena de los pares propuestos.
+    u : numpy.ndarray
+        Números U[0, 1) (al menos K // 2 valores).
+
+    Retorna
+    -------
+    int
+        Número de intercambios aceptados.
+    """
+    k = np.arange(desfase, temperaturas.shape[0] - 1, 2)
+    if k.size == 0:
+        return 0
+
+    log_prob = (1 / temperaturas[k] - 1 / temperaturas[k + 1]) * (ecms[k] - ecms[k + 1])
+    aceptados = k[np.log(u[:k.size]) < np.minimum(log_prob, 0.0)]
+
+    if aceptados.size:
+        estados[[*aceptados, *(aceptados + 1)]] = estados[[*(aceptados + 1), *aceptados]]
+        ecms[[*aceptados, *(aceptados + 1)]] = ecms[[*(aceptados + 1), *aceptados]]
+
+    return int(aceptados.size)
+
+
+def _recocido_multicadena(objetivo, params, rng):
+    """
+    Recocido simulado con K cadenas en paralelo e intercambio de réplicas
+    (parallel tempering).
+
+    Las K cadenas avanzan al mismo tiempo como arreglos: en cada paso se
+    proponen K vecinos, se evalúan con una sola llamada al ECM y se aplica
+    la regla de Metropolis de forma vectorizada. La cadena k trabaja a la
+    temperatura T * escalera[k], con 'escalera' geométrica entre 1 y
+    'razon_temperaturas', y todas se enfrían con el mismo 'alpha'. Cada
+    'intervalo_intercambio' pasos se proponen intercambios entre cadenas
+    vecinas. El proceso termina cuando la cadena más fría alcanza t_final
+    (o tras 'max_iter' pasos), por lo que el número de pasos es el mismo
+    que con una sola cadena.
+
+    Solo admite el enfriamiento geométrico: los esquemas alternativos, la
+    adaptación del paso y la parada por estancamiento se definen para una
+    sola cadena y producen un ValueError.
+    """
+    num_cadenas = params['num_cadenas']
+    temp_base = params.get('t_inicial', 100.0)
+    temp_final = params.get('t_final', 0.01)
+    alpha = params.get('alpha', 0.95)
+    paso = params.get('paso', 0.1)
+    intervalo = params.get('intervalo_intercambio', 10)
+    razon = params.get('razon_temperaturas', 10.0)
+    max_iter = params.get('max_iter')
+    tam_bloque = 256
+
+    if params.get('enfriamiento', 'geometrico') != 'geometrico':
+        raise ValueError("El modo multicadena solo admite el enfriamiento geométrico.")
+    for opcion in ('adaptar_paso', 'max_estancamiento'):
+        if params.get(opcion):
+            raise ValueError(f"'{opcion}' no está disponible en el modo multicadena.")
+    if intervalo < 1:
+        raise ValueError("'intervalo_intercambio' debe ser al menos 1.")
+
+    escalera = np.geomspace(1.0, razon, num_cadenas)
+
+    perfil = params.get('perfil')
+    intercambiar = instrumentar(intercambiar_replicas, perfil, 'intercambio')
+
+    estados = np.tile(vector_inicial(params, objetivo.dimension), (num_cadenas, 1))
+    dimensiones = estados.shape[1]
+    ecms = objetivo.evaluar_matriz(estados)
+
+    mejor = estados[0].copy()
+    mejor_ecm = float(ecms[0])
+
+    capacidad = pasos_enfriamiento(temp_base, temp_final, alpha) + 1
+    if max_iter is not None:
+        capacidad = min(capacidad, max_iter + 1)
+    historial = crear_registro(params, capacidad=capacidad, ancho=num_cadenas)
+    instrumentar_metodos(historial, perfil, {'registrar': 'historial'})
+    historial.registrar(ecms)
+
+    iteracion = 0
+    while temp_base > temp_final and (max_iter is None or iteracion < max_iter):
+
+        # Números aleatorios extraídos por bloques de pasos
+        t = iteracion % tam_bloque
+        if t == 0:
+            perturbaciones = rng.uniform(-paso, paso, size=(tam_bloque, num_cadenas, dimensiones))
+            u_aceptacion = rng.random((tam_bloque, num_cadenas))
+            u_intercambio = rng.random((tam_bloque, num_cadenas))
+
+        temperaturas = temp_base * escalera
+
+        vecinos = estados + perturbaciones[t]
+        ecm_vecinos = objetivo.evaluar_matriz(vecinos)
+
+        # Regla de Metropolis para todas las cadenas a la vez
+        delta = ecm_vecinos - ecms
+        aceptar = (delta < 0) | (u_aceptacion[t] < np.exp(-np.maximum(delta, 0.0) / temperaturas))
+
+        estados[aceptar] = vecinos[aceptar]
+        ecms[aceptar] = ecm_vecinos[aceptar]
+
+        idx = int(np.argmin(ecms))
+        if ecms[idx] < mejor_ecm:
+            mejor_ecm = float(ecms[idx])
+            mejor = estados[idx].copy()
+
+        iteracion += 1
+
+        if iteracion % intervalo == 0:
+            desfase = (iteracion // intervalo) % 2
+            intercambiar(estados, ecms, temperaturas, desfase, u_intercambio[t])
+
+        historial.registrar(ecms)
+
+        # Enfriamiento
+        temp_base *= alpha
+
+    historial.reportar(params)
+    return mejor.tolist(), mejor_ecm, iteracion, historial.valores()
+
+
 def recocido(x, y, params):
     """
     Implementación del algoritmo de Recocido Simulado (Simulated Annealing)
     aplicado a la minimización del Error Cuadrático Medio (ECM) en un modelo
-    de regresión lineal simple.
+    de regresión lineal simple o múltiple.
 
     Parámetros
     ----------
     x, y : array_like
-        Datos de entrenamiento.
+        Datos de entrenamiento (x de forma (n,) o (n, d)). En lugar de los
+        arreglos puede pasarse un ObjetivoECM precalculado como 'x'
+        (y 'y' = None).
     params : dict
         Parámetros del algoritmo:
-            - inicio_b0, inicio_b1 : valores iniciales.
+            - inicio_b0, inicio_b1 : valores iniciales (inicio_b1 se usa
+              para todas las pendientes).
+            - inicio : vector inicial [b0, b1, ..., bd] (opcional).
             - t_inicial : temperatura inicial.
             - t_final : temperatura mínima para detener el proceso.
             - alpha : tasa de enfriamiento (0 < alpha < 1).
             - paso : magnitud de perturbación en vecinos.
+            - rng : numpy.random.Generator opcional.
+            - semilla : semilla del generador (si no se indica 'rng').
+            - historial : modo de registro del historial ('completo',
+              'diezmado', 'mejoras' o 'apagado').
+            - historial_cada : intervalo del modo 'diezmado'.
+            - enfriamiento : 'geometrico' (por defecto), 'logaritmico',
+              'adaptativo' o una función (temp, iteracion, params, tasa)
+              que retorne la nueva temperatura. El logarítmico requiere
+              'max_iter' o 'max_estancamiento'. El modo multicadena solo
+              admite el geométrico.
+            - max_iter : límite opcional de iteraciones.
+            - adaptar_paso : si es True, 'paso' se ajusta al final de cada
+              ventana para acercar la tasa de aceptación a
+              'aceptacion_objetivo' (por defecto 0.44).
+            - ventana : pasos usados para medir la tasa de aceptación.
+            - max_estancamiento : detiene la búsqueda tras este número de
+              pasos sin una mejora relativa mayor que 'tol_relativa'.
+            - tol_relativa : mejora relativa mínima que reinicia el
+              contador de estancamiento (por defecto 0).
+            - num_cadenas : si es mayor que 1, se usa el modo multicadena
+              con intercambio de réplicas (parallel tempering).
+            - razon_temperaturas : cociente entre la temperatura de la
+              cadena más caliente y la más fría (modo multicadena).
+            - intervalo_intercambio : pasos entre intentos de intercambio
+              (modo multicadena, al menos 1). Este modo no admite
+              'adaptar_paso' ni 'max_estancamiento'.
+            - perfil : PerfilFases opcional (lo agrega experiment_runner
+              con perfilar=True). Mide las fases 'vecino', 'evaluacion',
+              'aceptacion', 'enfriamiento' e 'historial' ('intercambio'
+              en lugar de las tres primeras del modo multicadena, donde
+              vecinos y aceptación son operaciones vectorizadas).
 
     Retorna
     -------
     list
-        Mejor par [b0, b1] encontrado.
+        Mejores coeficientes [b0, b1, ..., bd] encontrados.
     float
         Valor mínimo de ECM alcanzado.
     int
         Número total de iteraciones realizadas.
-    list
-        Historial de ECM en cada iteración.
+    numpy.ndarray
+        Historial de ECM en cada iteración. En el modo multicadena es una
+        matriz (iteraciones + 1, num_cadenas) con el historial de cada cadena.
     """
 
-    b0_actual = params.get('inicio_b0', 0.0)
-    b1_actual = params.get('inicio_b1', 0.0)
     temp_actual = params.get('t_inicial', 100.0)
     temp_final = params.get('t_final', 0.01)
     alpha = params.get('alpha', 0.95)
     paso = params.get('paso', 0.1)
 
-    ecm_actual = calcular_ecm(b0_actual, b1_actual, x, y)
+    rng = generador_desde_params(params)
+    objetivo = crear_objetivo(x, y, params)
+
+    if params.get('num_cadenas', 1) > 1:
+        return _recocido_multicadena(objetivo, params, rng)
+
+    # Números aleatorios extraídos por bloques de un generador propio
+    flujo = FlujoAleatorio(rng)
+
+    esquema = params.get('enfriamiento', 'geometrico')
+    if not callable(esquema):
+        if esquema not in ESQUEMAS_ENFRIAMIENTO:
+            raise ValueError(f"Esquema de enfriamiento desconocido: '{esquema}'. "
+                             f"Opciones: {', '.join(ESQUEMAS_ENFRIAMIENTO)}.")
+        esquema = ESQUEMAS_ENFRIAMIENTO[esquema]
 
-    mejor_b0, mejor_b1 = b0_actual, b1_actual
+    max_iter = params.get('max_iter')
+    adaptar_paso = params.get('adaptar_paso', False)
+    aceptacion_objetivo = params.get('aceptacion_objetivo', 0.44)
+    ventana = params.get('ventana', 50)
+    max_estancamiento = params.get('max_estancamiento')
+    tol_relativa = params.get('tol_relativa', 0.0)
+
+    if esquema is enfriamiento_logaritmico and max_iter is None and max_estancamiento is None:
+        raise ValueError("El enfriamiento logarítmico requiere 'max_iter' o 'max_estancamiento'.")
+    if ventana < 1:
+        raise ValueError("'ventana' debe ser al menos 1.")
+    if aceptacion_objetivo <= 0:
+        raise ValueError("'aceptacion_objetivo' debe ser positiva.")
+
+    actual = vector_inicial(params, objetivo.dimension)
+    ecm_actual = objetivo.evaluar_vector(actual)
+
+    mejor = actual
     mejor_ecm = ecm_actual
 
-    historial = [ecm_actual]                        
+    if esquema is enfriamiento_geometrico:
+        capacidad = pasos_enfriamiento(temp_actual, temp_final, alpha) + 1
+    else:
+        capacidad = (max_iter or 1023) + 1
+    historial = crear_registro(params, capacidad=capacidad)
+    historial.registrar(ecm_actual)
+
+    # Fases medidas con params['perfil']; sin perfil son las funciones originales
+    perfil = params.get('perfil')
+    vecino_de = instrumentar(generar_vecino_vector, perfil, 'vecino')
+    exp = instrumentar(math.exp, perfil, 'aceptacion')
+    uniforme = instrumentar(flujo.siguiente, perfil, 'aceptacion')
+    esquema = instrumentar(esquema, perfil, 'enfriamiento')
+    instrumentar_metodos(historial, perfil, {'registrar': 'historial'})
     iteracion = 0
 
-    while temp_actual > temp_final:
+    aceptados_ventana = 0
+    tasa_aceptacion = aceptacion_objetivo
+    referencia = mejor_ecm
+    sin_mejora = 0
+
+    while temp_actual > temp_final and (max_iter is None or iteracion < max_iter):
 
         # Generación de vecino
-        b0_vecino, b1_vecino = generar_vecino(b0_actual, b1_actual, paso)
-        ecm_vecino = calcular_ecm(b0_vecino, b1_vecino, x, y)
+        vecino = vecino_de(actual, paso, flujo)
+        ecm_vecino = objetivo.evaluar_vector(vecino)
 
         delta = ecm_vecino - ecm_actual
 
@@ -94,27 +401,44 @@ def recocido(x, y, params):
         if delta < 0:
             aceptar = True
         else:
-            prob = math.exp(-delta / temp_actual)
-            aceptar = random.random() < prob
+            prob = exp(-delta / temp_actual)
+            aceptar = uniforme() < prob
 
         # Actualización si se acepta la transición
         if aceptar:
-            b0_actual = b0_vecino
-            b1_actual = b1_vecino
+            aceptados_ventana += 1
+            actual = vecino
             ecm_actual = ecm_vecino
 
             if ecm_actual < mejor_ecm:
                 mejor_ecm = ecm_actual
-                mejor_b0 = b0_actual
-                mejor_b1 = b1_actual
+                mejor = actual
+
+        historial.registrar(ecm_actual)
+        iteracion += 1
+
+        # Estancamiento: solo una mejora relativa suficiente reinicia el contador
+        if mejor_ecm < referencia - tol_relativa * referencia:
+            referencia = mejor_ecm
+            sin_mejora = 0
+        else:
+            sin_mejora += 1
 
-        historial.append(ecm_actual)
+        # Tasa de aceptación por ventana y adaptación del tamaño de paso
+        if iteracion % ventana == 0:
+            tasa_aceptacion = aceptados_ventana / ventana
+            aceptados_ventana = 0
+            if adaptar_paso:
+                paso *= math.exp(tasa_aceptacion - aceptacion_objetivo)
 
         # Enfriamiento
-        temp_actual *= alpha
-        iteracion += 1
+        temp_actual = esquema(temp_actual, iteracion, params, tasa_aceptacion)
+
+        if max_estancamiento is not None and sin_mejora >= max_estancamiento:
+            break
 
-    return [mejor_b0, mejor_b1], mejor_ecm, iteracion, historial
+    historial.reportar(params)
+    return mejor.tolist(), mejor_ecm, iteracion, historial.valores()
 
 
 def main():
@@ -1,30 +1,40 @@
-import pandas as pd
+import sys
 import os
+import pandas as pd
+
+# Agregar la raíz del proyecto al path (solo para ejecución directa de este archivo)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..', '..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from src.preprocessing.normalizacion import preprocesar, ruta_estadisticos
 
 try:
-    # Carga de la base de datos
-    df = pd.read_csv(os.path.join('data', 'raw', 'Fish.csv'))
-    print(df.head())
+    # Variables independientes para la regresión múltiple (Length1 es la de la regresión simple)
+    variables = ['Length1', 'Length2', 'Length3', 'Height', 'Width']
+    columnas = variables + ['Weight']
 
-    df = df[['Length1', 'Weight']]
-    print(df.head())
+    # Normalización (min-max de cada columna). Los estadísticos se guardan junto
+    # a los datos y la salida solo se reescribe si cambió el archivo crudo.
+    input_path = os.path.join('data', 'raw', 'Fish.csv')
+    output_path = os.path.join('data', 'processed', 'clean_fish_data.csv')
+    escalado, reescrito = preprocesar(input_path, output_path, columnas)
 
+    df = pd.read_csv(output_path)
     correlation = df['Length1'].corr(df['Weight'])
 
-    # Normalización
-    df['Length1_norm'] = (df['Length1'] - df['Length1'].min()) / (df['Length1'].max() - df['Length1'].min())
-    df['Weight_norm'] = (df['Weight'] - df['Weight'].min()) / (df['Weight'].max() - df['Weight'].min())
-
     print(f"Correlación de Pearson : {correlation:.4f}")
-    print(f"Número de registros: {len(df)}")
-
-    # Guardar base de datos limpia
-    output_path = os.path.join('data', 'processed', 'clean_fish_data.csv')
-    df.to_csv(output_path, index=False)
-
-    print("Se limpio correctamente la base de datos")
+    print("Correlaciones con Weight:")
+    print(df[variables].corrwith(df['Weight']).round(4).to_string())
+    print(f"Número de registros: {escalado.n}")
+
+    if reescrito:
+        print("Se limpio correctamente la base de datos")
+    else:
+        print("La base de datos limpia ya está actualizada")
+    print(f"Estadísticos de normalización: {ruta_estadisticos(output_path)}")
     print(df.head())
 
 except FileNotFoundError:
     print("Base de datos no encontrado")
-    
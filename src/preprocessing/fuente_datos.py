@@ -0,0 +1,117 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Agregar la raíz del proyecto al path (solo para ejecución directa de este archivo)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..', '..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from src.utils.objetivo import ObjetivoECM
+
+
+def leer_bloques_csv(ruta, col_x, col_y, tam_bloque=1_000_000):
+    """
+    Recorre un CSV por bloques de filas sin cargarlo completo en memoria.
+
+    Parámetros
+    ----------
+    ruta : str
+        Ruta del archivo CSV.
+    col_x : str o list de str
+        Columna de la variable independiente, o lista de columnas para la
+        regresión múltiple (x de cada bloque tendrá forma (filas, d)).
+    col_y : str
+        Columna de la variable objetivo.
+    tam_bloque : int
+        Número de filas por bloque.
+
+    Retorna
+    -------
+    generador de (numpy.ndarray, numpy.ndarray)
+        Pares (x, y) de cada bloque.
+    """
+    columnas_x = [col_x] if isinstance(col_x, str) else list(col_x)
+    col_x = col_x if isinstance(col_x, str) else columnas_x
+
+    lector = pd.read_csv(ruta, usecols=columnas_x + [col_y], chunksize=tam_bloque)
+    for bloque in lector:
+        yield bloque[col_x].to_numpy(dtype=float), bloque[col_y].to_numpy(dtype=float)
+
+
+def leer_bloques_binario(ruta_x, ruta_y, tam_bloque=1_000_000):
+    """
+    Recorre dos columnas guardadas como archivos .npy mediante memory-mapping.
+
+    Solo se leen del disco las páginas del bloque en curso, por lo que el
+    tamaño de los archivos puede superar la memoria disponible.
+
+    Parámetros
+    ----------
+    ruta_x, ruta_y : str
+        Rutas de los archivos .npy con el mismo número de filas. 'ruta_x'
+        puede contener una matriz (n, d) para la regresión múltiple.
+    tam_bloque : int
+        Número de elementos por bloque.
+
+    Retorna
+    -------
+    generador de (numpy.ndarray, numpy.ndarray)
+        Pares (x, y) de cada bloque.
+    """
+    x = np.load(ruta_x, mmap_mode='r')
+    y = np.load(ruta_y, mmap_mode='r')
+
+    if x.shape[0] != y.shape[0]:
+        raise ValueError("Las columnas binarias deben tener la misma longitud.")
+
+    for inicio in range(0, x.shape[0], tam_bloque):
+        yield (np.asarray(x[inicio:inicio + tam_bloque], dtype=float),
+               np.asarray(y[inicio:inicio + tam_bloque], dtype=float))
+
+
+def objetivo_desde_csv(ruta, col_x, col_y, tam_bloque=1_000_000):
+    """
+    Reduce un CSV arbitrariamente grande a los estadísticos suficientes del
+    ECM en una sola pasada.
+
+    El resultado puede pasarse a amplitud, recocido o genetico en lugar de
+    los arreglos: algoritmo(objetivo, None, params).
+
+    Retorna
+    -------
+    ObjetivoECM
+    """
+    return ObjetivoECM.desde_bloques(leer_bloques_csv(ruta, col_x, col_y, tam_bloque))
+
+
+def objetivo_desde_binario(ruta_x, ruta_y, tam_bloque=1_000_000):
+    """
+    Reduce dos columnas .npy (memory-mapped) a los estadísticos suficientes
+    del ECM en una sola pasada.
+
+    Retorna
+    -------
+    ObjetivoECM
+    """
+    return ObjetivoECM.desde_bloques(leer_bloques_binario(ruta_x, ruta_y, tam_bloque))
+
+
+def main():
+    ruta = os.path.join('data', 'processed', 'clean_fish_data.csv')
+
+    try:
+        objetivo = objetivo_desde_csv(ruta, 'Length1_norm', 'Weight_norm', tam_bloque=50)
+    except FileNotFoundError:
+        print("Base de datos no encontrada")
+        return
+
+    print(f"Registros procesados: {objetivo.n}")
+    print(f"Solución de mínimos cuadrados: b0 = {objetivo.b0_optimo:.4f}, "
+          f"b1 = {objetivo.b1_optimo:.4f}, ECM = {objetivo.ecm_minimo:.6f}")
+
+
+if __name__ == "__main__":
+    main()
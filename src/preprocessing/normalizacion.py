@@ -0,0 +1,351 @@
+import sys
+import os
+import json
+import hashlib
+import itertools
+import numpy as np
+import pandas as pd
+
+# Agregar la raíz del proyecto al path (solo para ejecución directa de este archivo)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..', '..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+
+class EscaladoMinMax:
+    """
+    Estadísticos de la normalización min-max de un conjunto de columnas.
+
+    Se acumulan por bloques de filas (una sola pasada, sin cargar el archivo
+    completo) y pueden actualizarse al llegar filas nuevas: el mínimo y el
+    máximo de la unión son el mínimo y el máximo de las partes.
+
+    Parámetros
+    ----------
+    columnas : list de str
+        Columnas a normalizar.
+    minimos, maximos : dict o None
+        {columna: valor}. Si se omiten, el escalado empieza vacío.
+    n : int
+        Filas acumuladas.
+    """
+
+    def __init__(self, columnas, minimos=None, maximos=None, n=0):
+        self.columnas = list(columnas)
+        self.minimos = {c: float((minimos or {}).get(c, np.inf)) for c in self.columnas}
+        self.maximos = {c: float((maximos or {}).get(c, -np.inf)) for c in self.columnas}
+        self.n = int(n)
+
+    @classmethod
+    def desde_bloques(cls, columnas, bloques):
+        """Escalado de una secuencia de DataFrames, en una sola pasada."""
+        escalado = cls(columnas)
+        for bloque in bloques:
+            escalado.actualizar(bloque)
+        return escalado
+
+    def actualizar(self, bloque):
+        """
+        Incorpora un bloque de filas (DataFrame con las columnas del escalado).
+
+        Retorna
+        -------
+        bool
+            True si cambió algún mínimo o máximo (y con ello la
+            normalización de las filas anteriores).
+        """
+        if len(bloque) == 0:
+            return False
+
+        minimos = bloque[self.columnas].min()
+        maximos = bloque[self.columnas].max()
+        cambio = False
+        for c in self.columnas:
+            if minimos[c] < self.minimos[c]:
+                self.minimos[c] = float(minimos[c])
+                cambio = True
+            if maximos[c] > self.maximos[c]:
+                self.maximos[c] = float(maximos[c])
+                cambio = True
+        self.n += len(bloque)
+        return cambio
+
+    def rango(self, columna):
+        """max - min de una columna (1 si es constante, para no dividir entre 0)."""
+        rango = self.maximos[columna] - self.minimos[columna]
+        return rango if rango > 0 else 1.0
+
+    def transformar(self, bloque):
+        """Columnas normalizadas de un bloque, con el sufijo '_norm'."""
+        normalizadas = pd.DataFrame({c: (bloque[c] - self.minimos[c]) / self.rango(c)
+                                     for c in self.columnas}, index=bloque.index)
+        return normalizadas.add_suffix('_norm')
+
+    def desnormalizar_betas(self, betas, col_x, col_y):
+        """
+        Convierte los coeficientes de un modelo ajustado sobre columnas
+        normalizadas a las unidades originales.
+
+        Si y' = b0 + Σ bj xj', con xj' = (xj - min_j) / r_j y
+        y' = (y - min_y) / r_y, entonces y = c0 + Σ cj xj con
+            cj = r_y bj / r_j
+            c0 = min_y + r_y (b0 - Σ bj min_j / r_j)
+
+        Parámetros
+        ----------
+        betas : array_like
+            [b0, b1, ..., bd] sobre las columnas normalizadas.
+        col_x : str o list de str
+            Columna(s) originales de las variables independientes, en el
+            orden de los coeficientes.
+        col_y : str
+            Columna original de la variable objetivo.
+
+        Retorna
+        -------
+        list
+            [c0, c1, ..., cd] en unidades originales.
+        """
+        col_x = [col_x] if isinstance(col_x, str) else list(col_x)
+        betas = np.asarray(betas, dtype=float)
+        if len(betas) != len(col_x) + 1:
+            raise ValueError("Se esperan tantas pendientes como columnas en 'col_x'.")
+
+        rango_y = self.rango(col_y)
+        rangos_x = np.array([self.rango(c) for c in col_x])
+        minimos_x = np.array([self.minimos[c] for c in col_x])
+
+        pendientes = rango_y * betas[1:] / rangos_x
+        intercepto = self.minimos[col_y] + rango_y * (betas[0] - np.sum(betas[1:] * minimos_x / rangos_x))
+        return [float(intercepto), *pendientes.tolist()]
+
+    def a_dict(self):
+        return {'columnas': self.columnas, 'n': self.n,
+                'minimos': self.minimos, 'maximos': self.maximos}
+
+    @classmethod
+    def desde_dict(cls, datos):
+        return cls(datos['columnas'], datos['minimos'], datos['maximos'], datos['n'])
+
+
+def huella_archivo(ruta, tam_bloque=2**20):
+    """SHA-1 del contenido de un archivo, leído por bloques."""
+    return _sha1_archivo(ruta, tam_bloque).hexdigest()
+
+
+def _sha1_archivo(ruta, tam_bloque=2**20):
+    h = hashlib.sha1()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(tam_bloque), b''):
+            h.update(bloque)
+    return h
+
+
+def ruta_estadisticos(ruta_salida):
+    """Archivo de estadísticos asociado a un CSV procesado."""
+    return os.path.splitext(ruta_salida)[0] + '.stats.json'
+
+
+def guardar_estadisticos(escalado, ruta, fuente, salida=None):
+    """
+    Guarda el escalado, la huella del archivo crudo del que proviene y,
+    si se indica, el tamaño en bytes de la salida procesada.
+    """
+    datos = {**escalado.a_dict(), 'fuente': fuente}
+    if salida is not None:
+        datos['salida'] = {'bytes': salida}
+    temporal = f"{ruta}.tmp"
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(datos, f, indent=2)
+    os.replace(temporal, ruta)
+
+
+def cargar_estadisticos(ruta):
+    """
+    Lee un archivo de estadísticos.
+
+    Retorna
+    -------
+    EscaladoMinMax
+    dict
+        Huella del archivo crudo ({'sha1': ..., 'bytes': ...}).
+    """
+    with open(ruta, encoding='utf-8') as f:
+        datos = json.load(f)
+    return EscaladoMinMax.desde_dict(datos), datos.get('fuente')
+
+
+def _firma(ruta):
+    return {'sha1': huella_archivo(ruta), 'bytes': os.path.getsize(ruta)}
+
+
+def _firmas_agregado(ruta, agregado):
+    """
+    Firma actual de un archivo y la que tendrá después de agregarle los
+    bytes 'agregado', con una sola lectura y sin modificarlo.
+    """
+    h = _sha1_archivo(ruta)
+    tam = os.path.getsize(ruta)
+    actual = {'sha1': h.hexdigest(), 'bytes': tam}
+    h.update(agregado)
+    return actual, {'sha1': h.hexdigest(), 'bytes': tam + len(agregado)}
+
+
+def _salida_consistente(ruta_stats, ruta_salida):
+    """
+    Indica si la salida procesada tiene el tamaño registrado en sus
+    estadísticos (archivos anteriores sin ese dato se aceptan).
+    """
+    with open(ruta_stats, encoding='utf-8') as f:
+        salida = json.load(f).get('salida')
+    return salida is None or salida['bytes'] == os.path.getsize(ruta_salida)
+
+
+def _leer(ruta, columnas, tam_bloque):
+    return pd.read_csv(ruta, usecols=columnas, chunksize=tam_bloque,
+                       dtype={c: float for c in columnas})
+
+
+def _escribir(ruta_salida, escalado, bloques):
+    """Escribe el CSV procesado (columnas originales + normalizadas) de forma atómica."""
+    temporal = f"{ruta_salida}.tmp"
+    encabezado = True
+    with open(temporal, 'w', encoding='utf-8', newline='') as f:
+        for bloque in bloques:
+            bloque = bloque[escalado.columnas]
+            pd.concat([bloque, escalado.transformar(bloque)], axis=1).to_csv(f, index=False, header=encabezado)
+            encabezado = False
+    os.replace(temporal, ruta_salida)
+
+
+def _texto_agregado(ruta, filas):
+    """
+    Texto que agrega 'filas' al final de un CSV, precedido de un salto de
+    línea si el archivo no termina en uno.
+    """
+    with open(ruta, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        completo = f.tell() == 0
+        if not completo:
+            f.seek(-1, os.SEEK_END)
+            completo = f.read(1) == b'\n'
+
+    return ('' if completo else '\n') + filas.to_csv(index=False, header=False)
+
+
+def _agregar_csv(ruta, filas):
+    """Agrega filas al final de un CSV, cuidando que el archivo termine en salto de línea."""
+    _agregar_texto(ruta, _texto_agregado(ruta, filas))
+
+
+def _agregar_texto(ruta, texto):
+    with open(ruta, 'a', encoding='utf-8', newline='') as f:
+        f.write(texto)
+
+
+def preprocesar(ruta_cruda, ruta_salida, columnas, tam_bloque=100_000, forzar=False):
+    """
+    Normaliza (min-max) las columnas de un CSV crudo y guarda el resultado
+    junto con sus estadísticos ('<salida>.stats.json').
+
+    Los estadísticos se calculan en una pasada por bloques y la salida se
+    escribe en una segunda pasada. Si el archivo crudo no cambió desde el
+    último procesamiento (misma huella SHA-1) y la salida existe, no se
+    reescribe nada.
+
+    Parámetros
+    ----------
+    ruta_cruda : str
+        CSV original.
+    ruta_salida : str
+        CSV procesado: las columnas originales seguidas de las normalizadas
+        (sufijo '_norm').
+    columnas : list de str
+        Columnas a conservar y normalizar.
+    tam_bloque : int
+        Filas por bloque.
+    forzar : bool
+        Reprocesar aunque el archivo crudo no haya cambiado.
+
+    Retorna
+    -------
+    EscaladoMinMax
+    bool
+        True si se reescribió la salida.
+    """
+    ruta_stats = ruta_estadisticos(ruta_salida)
+    fuente = _firma(ruta_cruda)
+
+    if not forzar and os.path.exists(ruta_salida) and os.path.exists(ruta_stats):
+        escalado, fuente_previa = cargar_estadisticos(ruta_stats)
+        if fuente_previa == fuente and escalado.columnas == list(columnas) and \
+                _salida_consistente(ruta_stats, ruta_salida):
+            return escalado, False
+
+    escalado = EscaladoMinMax.desde_bloques(columnas, _leer(ruta_cruda, columnas, tam_bloque))
+    _escribir(ruta_salida, escalado, _leer(ruta_cruda, columnas, tam_bloque))
+    guardar_estadisticos(escalado, ruta_stats, fuente, os.path.getsize(ruta_salida))
+    return escalado, True
+
+
+def agregar_filas(nuevas, ruta_cruda, ruta_salida, tam_bloque=100_000):
+    """
+    Agrega filas nuevas al CSV crudo y actualiza la salida procesada.
+
+    Los estadísticos se actualizan con las filas nuevas sin releer los
+    datos anteriores. Si el mínimo y el máximo de todas las columnas se
+    mantienen, solo se agregan las filas nuevas al final de la salida; si
+    alguno cambia, la salida se renormaliza a partir de sus propias
+    columnas originales (sin volver al archivo crudo).
+
+    El archivo crudo se modifica al final: primero se actualiza la salida
+    (la renormalización se escribe en un temporal y se renombra) y luego
+    los estadísticos (escritura atómica), que registran la huella que
+    tendrá el crudo y el tamaño de la salida. Si el proceso se interrumpe
+    en cualquier punto, la siguiente llamada detecta la diferencia y pide
+    ejecutar preprocesar, que reconstruye todo desde el crudo (preprocesar
+    también la detecta y reprocesa).
+
+    Parámetros
+    ----------
+    nuevas : pandas.DataFrame
+        Filas con (al menos) las columnas del archivo crudo.
+    ruta_cruda, ruta_salida : str
+        Archivos de preprocesar (que debe haberse ejecutado antes).
+    tam_bloque : int
+        Filas por bloque al renormalizar.
+
+    Retorna
+    -------
+    EscaladoMinMax
+    bool
+        True si se reescribió la salida completa.
+    """
+    ruta_stats = ruta_estadisticos(ruta_salida)
+    escalado, fuente = cargar_estadisticos(ruta_stats)
+
+    encabezado = pd.read_csv(ruta_cruda, nrows=0).columns
+    texto_crudo = _texto_agregado(ruta_cruda, nuevas.reindex(columns=encabezado))
+    actual, fuente_nueva = _firmas_agregado(ruta_cruda, texto_crudo.encode('utf-8'))
+
+    if fuente != actual:
+        raise ValueError("El archivo crudo cambió desde el último procesamiento; ejecute preprocesar.")
+    if not _salida_consistente(ruta_stats, ruta_salida):
+        raise ValueError("La salida procesada no coincide con sus estadísticos; ejecute preprocesar.")
+
+    nuevas = nuevas[escalado.columnas].astype(float)
+    reescribir = escalado.actualizar(nuevas)
+
+    if reescribir:
+        # Las filas anteriores cambian de escala: se renormaliza la salida
+        # en un temporal que reemplaza a la anterior solo al terminar
+        _escribir(ruta_salida, escalado,
+                  itertools.chain(_leer(ruta_salida, escalado.columnas, tam_bloque), [nuevas]))
+    else:
+        _agregar_csv(ruta_salida, pd.concat([nuevas, escalado.transformar(nuevas)], axis=1))
+
+    guardar_estadisticos(escalado, ruta_stats, fuente_nueva, os.path.getsize(ruta_salida))
+    _agregar_texto(ruta_cruda, texto_crudo)
+    return escalado, reescribir
+
@@ -0,0 +1,100 @@
+import numpy as np
+
+
+def obtener_generador(fuente=None):
+    """
+    Convierte una fuente de aleatoriedad en un numpy.random.Generator.
+
+    Parámetros
+    ----------
+    fuente : numpy.random.Generator, int, SeedSequence o None
+        - Generator : se retorna tal cual.
+        - int / SeedSequence : se usa como semilla de un generador nuevo.
+        - None : la semilla se extrae del estado global de np.random, de
+          modo que np.random.seed(...) sigue haciendo reproducible la
+          ejecución.
+
+    Retorna
+    -------
+    numpy.random.Generator
+    """
+    if fuente is None:
+        fuente = int(np.random.randint(0, 2**32 - 1))
+    return np.random.default_rng(fuente)
+
+
+def generador_desde_params(params):
+    """
+    Obtiene el generador de un algoritmo a partir de su diccionario de
+    parámetros: usa params['rng'] si existe, si no params['semilla'].
+    """
+    fuente = params.get('rng')
+    if fuente is None:
+        fuente = params.get('semilla')
+    return obtener_generador(fuente)
+
+
+class FlujoAleatorio:
+    """
+    Flujo de números uniformes en [0, 1) extraídos por bloques.
+
+    En lugar de pedir un número al generador en cada llamada, se extrae un
+    bloque completo con una sola llamada vectorizada y se entrega de a uno.
+    Cada flujo tiene su propio Generator, por lo que varias corridas pueden
+    ejecutarse en paralelo dentro del mismo proceso sin compartir estado.
+
+    Parámetros
+    ----------
+    rng : numpy.random.Generator, int o None
+        Fuente de aleatoriedad (ver obtener_generador).
+    tam_bloque : int
+        Cantidad de números extraídos en cada recarga.
+    """
+
+    def __init__(self, rng=None, tam_bloque=4096):
+        self.rng = obtener_generador(rng)
+        self.tam_bloque = tam_bloque
+        self._bloque = []
+        self._pos = 0
+
+    def siguiente(self):
+        """Retorna el siguiente número U[0, 1) como float de Python."""
+        if self._pos >= len(self._bloque):
+            self._bloque = self.rng.random(self.tam_bloque).tolist()
+            self._pos = 0
+        valor = self._bloque[self._pos]
+        self._pos += 1
+        return valor
+
+    def uniforme(self, a, b):
+        """Retorna un número U[a, b)."""
+        return a + (b - a) * self.siguiente()
+
+    def uniformes(self, a, b, k):
+        """
+        Retorna un arreglo de 'k' números U[a, b), los mismos que darían
+        'k' llamadas consecutivas a uniforme(a, b).
+        """
+        valores = self._bloque[self._pos:self._pos + k]
+        self._pos += len(valores)
+        while len(valores) < k:
+            self._bloque = self.rng.random(self.tam_bloque).tolist()
+            self._pos = min(k - len(valores), self.tam_bloque)
+            valores += self._bloque[:self._pos]
+        return a + (b - a) * np.array(valores)
+
+    def indices_sin_reemplazo(self, n, k):
+        """
+        Retorna 'k' índices distintos en [0, n) elegidos de manera uniforme
+        (por rechazo: se descartan los índices ya elegidos), en el orden en
+        que se extrajeron.
+        """
+        if k > n:
+            raise ValueError("La muestra es más grande que la población.")
+
+        elegidos = []
+        while len(elegidos) < k:
+            indice = int(self.siguiente() * n)
+            if indice not in elegidos:
+                elegidos.append(indice)
+        return elegidos
@@ -0,0 +1,274 @@
+import sys
+import os
+import math
+import itertools
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+# Agregar la raíz del proyecto al path (solo para ejecución directa de este archivo)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..', '..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from src.utils.aleatorio import obtener_generador
+from src.utils.bitacora import huella
+from src.utils.decorators import _ejecutar_corrida, generar_semillas
+
+# Contexto de cada proceso trabajador del barrido: (func, x, y, metas)
+_CONTEXTO_BARRIDO = None
+
+
+def _inicializar_trabajador_barrido(func, x, y, metas):
+    global _CONTEXTO_BARRIDO
+    _CONTEXTO_BARRIDO = (func, x, y, metas)
+
+
+def _ejecutar_trabajo(configuracion, params, indice, semilla):
+    func, x, y, metas = _CONTEXTO_BARRIDO
+    registro = _ejecutar_corrida(func, (x, y, params), {}, func.__name__, indice, semilla, metas)
+    # El barrido solo compara métricas escalares: el historial no se conserva
+    del registro['Historial']
+    registro['Configuracion'] = configuracion
+    return registro
+
+
+def espacio_rejilla(rejilla):
+    """
+    Todas las combinaciones de una rejilla de parámetros.
+
+    Parámetros
+    ----------
+    rejilla : dict
+        {parametro: lista de valores}.
+
+    Retorna
+    -------
+    list de dict
+    """
+    nombres = list(rejilla)
+    return [dict(zip(nombres, valores)) for valores in itertools.product(*rejilla.values())]
+
+
+def _transformar(especificacion, u):
+    """
+    Convierte números U[0, 1) en valores de un parámetro según su
+    especificación:
+        - lista : valores discretos (se elige uno).
+        - (a, b) : uniforme en [a, b]; entero si a y b son enteros.
+        - (a, b, 'log') : log-uniforme en [a, b].
+    """
+    if isinstance(especificacion, list):
+        indices = np.minimum((u * len(especificacion)).astype(int), len(especificacion) - 1)
+        return [especificacion[i] for i in indices]
+
+    a, b = especificacion[0], especificacion[1]
+    if len(especificacion) > 2 and especificacion[2] == 'log':
+        return np.exp(np.log(a) + u * (np.log(b) - np.log(a))).tolist()
+    if isinstance(a, int) and isinstance(b, int):
+        return np.minimum(a + (u * (b - a + 1)).astype(int), b).tolist()
+    return (a + u * (b - a)).tolist()
+
+
+def espacio_aleatorio(espacio, n, rng=None):
+    """
+    'n' configuraciones muestreadas al azar de un espacio de parámetros
+    (ver _transformar para el formato de cada parámetro).
+    """
+    rng = obtener_generador(rng)
+    columnas = {nombre: _transformar(esp, rng.random(n)) for nombre, esp in espacio.items()}
+    return [{nombre: columnas[nombre][i] for nombre in espacio} for i in range(n)]
+
+
+def espacio_hipercubo(espacio, n, rng=None):
+    """
+    'n' configuraciones por muestreo de hipercubo latino: el rango de cada
+    parámetro se divide en 'n' estratos y cada estrato se usa exactamente
+    una vez, lo que cubre el espacio mejor que el muestreo aleatorio con el
+    mismo número de configuraciones.
+    """
+    rng = obtener_generador(rng)
+    columnas = {}
+    for nombre, esp in espacio.items():
+        u = (rng.permutation(n) + rng.random(n)) / n
+        columnas[nombre] = _transformar(esp, u)
+    return [{nombre: columnas[nombre][i] for nombre in espacio} for i in range(n)]
+
+
+def deduplicar(configuraciones):
+    """Elimina configuraciones repetidas conservando la primera aparición."""
+    vistas = set()
+    unicas = []
+    for config in configuraciones:
+        clave = huella(config)
+        if clave not in vistas:
+            vistas.add(clave)
+            unicas.append(config)
+    return unicas
+
+
+def barrido(func, x, y, configuraciones, params_base=None, n_semillas=10,
+            n_jobs=1, semilla=None, metas=None, metrica='ECM_Final',
+            eta=None, corridas_iniciales=2):
+    """
+    Barrido de hiperparámetros de un algoritmo.
+
+    Cada configuración se combina con 'params_base' y se ejecuta con
+    'n_semillas' semillas derivadas de 'semilla' (las mismas para todas las
+    configuraciones, de modo que se comparan con los mismos números
+    aleatorios). Los trabajos (configuración × semilla) se reparten en un
+    único grupo de procesos, y las configuraciones repetidas se ejecutan
+    una sola vez.
+
+    Con 'eta' se aplica successive halving: en la primera ronda cada
+    configuración corre 'corridas_iniciales' semillas; después de cada ronda
+    solo sigue la mejor fracción 1/eta (según el promedio de 'metrica') y
+    las sobrevivientes acumulan eta veces más corridas, hasta 'n_semillas'.
+
+    Parámetros
+    ----------
+    func : callable
+        Algoritmo con la firma (x, y, params).
+    x, y : array_like u ObjetivoECM
+        Datos (o un objetivo precalculado como 'x' e y = None).
+    configuraciones : list de dict
+        Configuraciones a evaluar (ver espacio_rejilla, espacio_aleatorio,
+        espacio_hipercubo).
+    params_base : dict o None
+        Parámetros comunes a todas las configuraciones.
+    n_semillas : int
+        Corridas por configuración (máximo con successive halving).
+    n_jobs : int
+        Número de procesos (-1 = todos los núcleos).
+    semilla : int o None
+        Semilla maestra.
+    metas : dict, iterable o None
+        Metas de ECM (ver experiment_runner).
+    metrica : str
+        Columna a minimizar al comparar configuraciones.
+    eta : int o None
+        Factor de reducción de successive halving (None = desactivado).
+    corridas_iniciales : int
+        Corridas por configuración en la primera ronda de successive halving.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        Registro de todas las corridas (sin 'Historial'), con las columnas
+        'Configuracion' (índice en la lista deduplicada) y 'Ronda'.
+    pandas.DataFrame
+        Resumen por configuración (ver resumen_barrido).
+    """
+    params_base = params_base or {}
+    configuraciones = deduplicar(configuraciones)
+    if not configuraciones:
+        raise ValueError("Se requiere al menos una configuración.")
+    if n_semillas < 1:
+        raise ValueError("'n_semillas' debe ser al menos 1.")
+    if eta is not None and eta <= 1:
+        raise ValueError("'eta' debe ser mayor que 1.")
+    if eta is not None and corridas_iniciales < 1:
+        raise ValueError("'corridas_iniciales' debe ser al menos 1.")
+
+    if semilla is None:
+        semilla = int(np.random.randint(0, 2**32 - 1))
+    semillas = generar_semillas(semilla, n_semillas)
+    procesos = os.cpu_count() if n_jobs == -1 else n_jobs
+
+    vivas = list(range(len(configuraciones)))
+    hechas = 0
+    corridas = n_semillas if eta is None else min(corridas_iniciales, n_semillas)
+    registros = []
+    ronda = 0
+
+    ejecutor = None
+    if procesos > 1:
+        ejecutor = ProcessPoolExecutor(max_workers=procesos,
+                                       initializer=_inicializar_trabajador_barrido,
+                                       initargs=(func, x, y, metas))
+    else:
+        _inicializar_trabajador_barrido(func, x, y, metas)
+
+    try:
+        while True:
+            trabajos = [(c, {**params_base, **configuraciones[c]}, i, semillas[i])
+                        for c in vivas for i in range(hechas, corridas)]
+
+            if ejecutor is None:
+                nuevos = [_ejecutar_trabajo(*trabajo) for trabajo in trabajos]
+            else:
+                nuevos = list(ejecutor.map(_ejecutar_trabajo, *zip(*trabajos)))
+
+            for registro in nuevos:
+                registro['Ronda'] = ronda
+            registros.extend(nuevos)
+
+            if corridas >= n_semillas or len(vivas) <= 1:
+                break
+
+            # Successive halving: sobrevive la mejor fracción 1/eta
+            parcial = pd.DataFrame(registros)
+            promedios = parcial[parcial['Configuracion'].isin(vivas)].groupby('Configuracion')[metrica].mean()
+            vivas = promedios.nsmallest(max(1, math.ceil(len(vivas) / eta))).index.tolist()
+
+            hechas = corridas
+            corridas = min(corridas * eta, n_semillas)
+            ronda += 1
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown()
+
+    df_corridas = pd.DataFrame(registros)
+    return df_corridas, resumen_barrido(df_corridas, configuraciones, metrica)
+
+
+def resumen_barrido(df_corridas, configuraciones, metrica='ECM_Final'):
+    """
+    Resumen por configuración: valores de los parámetros, número de
+    corridas y promedio, mediana y desviación estándar de 'metrica'.
+    Las configuraciones se ordenan de mejor a peor promedio; con successive
+    halving, las que completaron más corridas aparecen primero.
+    """
+    estadisticas = df_corridas.groupby('Configuracion')[metrica].agg(['count', 'mean', 'median', 'std'])
+    estadisticas.columns = ['Corridas', f"{metrica} Promedio", f"{metrica} Mediana", f"{metrica} Desv."]
+
+    parametros = pd.DataFrame(configuraciones)
+    parametros.index.name = 'Configuracion'
+
+    resumen = parametros.join(estadisticas, how='inner')
+    return resumen.sort_values(['Corridas', f"{metrica} Promedio"], ascending=[False, True])
+
+
+def mejor_configuracion(resumen):
+    """Parámetros de la mejor configuración de un resumen de barrido."""
+    columnas = [c for c in resumen.columns
+                if c != 'Corridas' and not c.endswith((' Promedio', ' Mediana', ' Desv.'))]
+    # Columna por columna para conservar el tipo de cada parámetro (int, float, ...)
+    valores = {c: resumen[c].iloc[0] for c in columnas}
+    return {c: (v.item() if hasattr(v, 'item') else v) for c, v in valores.items()}
+
+
+def main():
+    from src.utils.objetivo import ObjetivoECM
+    from src.algorithms.recocido import recocido
+
+    print("--- Barrido de hiperparámetros del Recocido Simulado ---")
+
+    df = pd.read_csv(os.path.join(root_dir, 'data', 'processed', 'clean_fish_data.csv'))
+    objetivo = ObjetivoECM.desde_datos(df['Length1_norm'].values, df['Weight_norm'].values)
+
+    espacio = {'alpha': (0.8, 0.99), 'paso': (0.01, 1.0, 'log')}
+    configuraciones = espacio_hipercubo(espacio, 16, rng=0)
+
+    _, resumen = barrido(recocido, objetivo, None, configuraciones,
+                         params_base={'t_final': 0.001}, n_semillas=16,
+                         semilla=0, eta=2, corridas_iniciales=2)
+
+    pd.set_option('display.width', 200)
+    print(resumen.head(8))
+    print("\nMejor configuración:", mejor_configuracion(resumen))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+import sys
+import os
+import json
+import time
+import platform
+import argparse
+import numpy as np
+
+# Agregar la raíz del proyecto al path (solo para ejecución directa de este archivo)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..', '..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from src.utils.common import calcular_ecm, calcular_ecm_lote
+from src.utils.objetivo import ObjetivoECM, ContadorEvaluaciones
+from src.utils.decorators import experiment_runner
+from src.algorithms.amplitud import amplitud
+from src.algorithms.recocido import recocido
+from src.algorithms.genetico import genetico
+from src.algorithms.gradiente import descenso_gradiente
+
+RUTA_LINEA_BASE = os.path.join(root_dir, 'reports', 'benchmarks', 'linea_base.json')
+
+# Tamaños de los conjuntos sintéticos (filas)
+TAMANOS = (150, 10_000, 1_000_000, 10_000_000)
+TAMANOS_RAPIDOS = (150, 10_000, 1_000_000)
+
+
+def datos_sinteticos(n, dimension=1, semilla=0):
+    """
+    Conjunto sintético y = 2 + X b + ruido con 'n' filas y variables en
+    [0, 1], como las columnas normalizadas del conjunto de peces.
+    """
+    rng = np.random.default_rng(semilla)
+    x = rng.random((n, dimension)) if dimension > 1 else rng.random(n)
+    pendientes = np.linspace(1.0, 2.0, dimension)
+    y = 2.0 + (x @ pendientes if dimension > 1 else x * pendientes[0]) + rng.normal(0, 0.1, n)
+    return x, y
+
+
+def _fijo(funcion, unidades):
+    """Caso de benchmark con una cantidad de trabajo conocida de antemano."""
+    def caso():
+        funcion()
+        return unidades
+    return caso
+
+
+def _optimizador(func, objetivo, params):
+    """
+    Caso de benchmark de un optimizador: una corrida con trabajo fijo
+    (iteraciones, generaciones o épocas fijadas en 'params', sin criterios
+    de parada anticipada), medida en corridas por segundo. Las
+    evaluaciones no sirven como unidad: no cuestan lo mismo que un
+    gradiente y una optimización que ahorra evaluaciones aparecería como
+    una regresión.
+    """
+    def caso():
+        func(objetivo, None, {**params, 'semilla': 0, 'contador': ContadorEvaluaciones()})
+        return 1
+    return caso
+
+
+def casos_benchmark(rapido=False):
+    """
+    Construye los casos del benchmark.
+
+    Cada caso es (nombre, unidad, funcion); 'funcion' no recibe argumentos
+    y retorna cuántas unidades de trabajo realizó (filas, evaluaciones o
+    corridas), de modo que el rendimiento se mide como unidades por segundo.
+    Los optimizadores se miden en corridas de trabajo fijo por segundo.
+
+    Parámetros
+    ----------
+    rapido : bool
+        Si es True se omite el conjunto de 10 millones de filas y se usan
+        las escalas pequeñas de los optimizadores.
+    """
+    casos = []
+
+    # Objetivo: evaluación directa sobre los datos y construcción de los estadísticos
+    for n in (TAMANOS_RAPIDOS if rapido else TAMANOS):
+        x, y = datos_sinteticos(n)
+        casos.append((f"calcular_ecm[n={n}]", 'filas',
+                      _fijo(lambda x=x, y=y: calcular_ecm(2.0, 1.0, x, y), n)))
+        casos.append((f"ObjetivoECM.desde_datos[n={n}]", 'filas',
+                      _fijo(lambda x=x, y=y: ObjetivoECM.desde_datos(x, y), n)))
+
+    x, y = datos_sinteticos(10_000)
+    lote = np.random.default_rng(1).uniform(-1, 3, (2, 1000))
+    casos.append(("calcular_ecm_lote[n=10000,k=1000]", 'evaluaciones',
+                  _fijo(lambda: calcular_ecm_lote(lote[0], lote[1], x, y), 1000)))
+
+    objetivo = ObjetivoECM.desde_datos(x, y)
+    candidatos = np.random.default_rng(1).uniform(-1, 3, (2, 1_000_000))
+    casos.append(("ObjetivoECM.evaluar_lote[k=1000000]", 'evaluaciones',
+                  _fijo(lambda: objetivo.evaluar_lote(candidatos[0], candidatos[1]), 1_000_000)))
+
+    x5, y5 = datos_sinteticos(10_000, dimension=5)
+    objetivo5 = ObjetivoECM.desde_datos(x5, y5)
+    candidatos5 = np.random.default_rng(1).uniform(-1, 3, (100_000, 6))
+    casos.append(("ObjetivoECM.evaluar_matriz[d=5,k=100000]", 'evaluaciones',
+                  _fijo(lambda: objetivo5.evaluar_matriz(candidatos5), 100_000)))
+
+    # Optimizadores a dos escalas de parámetros, con iteraciones, generaciones o épocas fijas
+    escalas = {'pequena': 1} if rapido else {'pequena': 1, 'grande': 10}
+    for escala, factor in escalas.items():
+        configuraciones = [
+            ('amplitud', amplitud, {'paso': 0.05, 'max_iter': 2000 * factor}),
+            ('amplitud_niveles', amplitud, {'paso': 0.05, 'max_iter': 2000 * factor, 'modo': 'niveles'}),
+            ('recocido', recocido, {'t_final': 0.001 / factor, 'alpha': 0.95, 'paso': 0.2}),
+            ('recocido_multicadena', recocido, {'t_final': 0.001 / factor, 'num_cadenas': 8}),
+            ('genetico', genetico, {'generaciones': 100 * factor}),
+            ('genetico_arreglos', genetico, {'generaciones': 100 * factor, 'modo': 'arreglos'}),
+            ('genetico_islas', genetico, {'generaciones': 100 * factor, 'islas': 4}),
+            ('descenso_gradiente', descenso_gradiente, {'epocas': 200 * factor}),
+        ]
+        for nombre, func, params in configuraciones:
+            casos.append((f"{nombre}[{escala}]", 'corridas', _optimizador(func, objetivo, params)))
+        casos.append((f"genetico_d5[{escala}]", 'corridas',
+                      _optimizador(genetico, objetivo5, {'generaciones': 100 * factor, 'modo': 'arreglos'})))
+
+    # Corridas completas a través del decorador
+    runner = experiment_runner(10, semilla=0)
+    casos.append(("experiment_runner[recocido,10]", 'corridas',
+                  _fijo(lambda: runner(recocido)(objetivo, None, {}), 10)))
+
+    return casos
+
+
+def medir(funcion, repeticiones=3):
+    """
+    Ejecuta 'funcion' varias veces y retorna el mejor rendimiento observado
+    (unidades por segundo), lo que reduce el ruido de otros procesos.
+    """
+    mejor = 0.0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter_ns()
+        unidades = funcion()
+        transcurrido = max(time.perf_counter_ns() - inicio, 1)
+        mejor = max(mejor, unidades * 1e9 / transcurrido)
+    return mejor
+
+
+def calibrar(repeticiones=5):
+    """
+    Rendimiento (cargas por segundo) de una carga de referencia fija en
+    este equipo: un bucle de Python y operaciones NumPy sobre un millón de
+    elementos, como los dos tipos de trabajo de los casos.
+
+    Los rendimientos se dividen por este valor para compararlos entre
+    equipos distintos: la línea base guarda rendimientos relativos y no los
+    absolutos de la máquina en la que se generó.
+    """
+    arreglo = np.random.default_rng(0).random(1_000_000)
+
+    def carga():
+        total = 0.0
+        for i in range(200_000):
+            total += i * 0.5
+        float(arreglo @ arreglo)
+        float(np.square(arreglo - arreglo.mean()).sum())
+        return 1
+
+    return medir(carga, repeticiones)
+
+
+def ejecutar_benchmark(rapido=False, repeticiones=3, filtro=None, calibracion=None):
+    """
+    Ejecuta los casos del benchmark.
+
+    Parámetros
+    ----------
+    calibracion : float o None
+        Resultado de calibrar(); si se indica, cada caso incluye también su
+        rendimiento relativo (rendimiento / calibracion).
+
+    Retorna
+    -------
+    dict
+        {nombre_caso: {'unidad': str, 'rendimiento': float[, 'relativo': float]}}
+    """
+    resultados = {}
+    for nombre, unidad, funcion in casos_benchmark(rapido):
+        if filtro and filtro not in nombre:
+            continue
+        rendimiento = medir(funcion, repeticiones)
+        resultados[nombre] = {'unidad': unidad, 'rendimiento': rendimiento}
+        if calibracion:
+            resultados[nombre]['relativo'] = rendimiento / calibracion
+        print(f"{nombre:<45} {rendimiento:>16,.2f} {unidad}/s")
+    return resultados
+
+
+def guardar_linea_base(resultados, ruta=RUTA_LINEA_BASE):
+    """
+    Guarda la línea base: solo los rendimientos relativos a la calibración
+    de cada caso (los absolutos dependen del equipo) y datos del entorno
+    como referencia.
+    """
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    contenido = {
+        'entorno': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+        },
+        'casos': {nombre: {'unidad': caso['unidad'], 'relativo': caso['relativo']}
+                  for nombre, caso in resultados.items()},
+    }
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(contenido, f, indent=2)
+
+
+def cargar_linea_base(ruta=RUTA_LINEA_BASE):
+    with open(ruta, encoding='utf-8') as f:
+        return json.load(f)['casos']
+
+
+def comparar(resultados, linea_base, umbral=0.25):
+    """
+    Compara los rendimientos relativos (ver calibrar) con la línea base.
+
+    Parámetros
+    ----------
+    umbral : float
+        Caída relativa de rendimiento tolerada (0.25 = hasta 25% más lento).
+
+    Retorna
+    -------
+    list de (nombre, relativo_base, relativo_actual, cambio)
+        Casos cuya caída de rendimiento supera el umbral. Los casos que no
+        están en la línea base se ignoran.
+    """
+    regresiones = []
+    for nombre, actual in resultados.items():
+        if nombre not in linea_base:
+            continue
+        base = linea_base[nombre]['relativo']
+        cambio = actual['relativo'] / base - 1
+        if cambio < -umbral:
+            regresiones.append((nombre, base, actual['relativo'], cambio))
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark del objetivo y los optimizadores.")
+    parser.add_argument('--rapido', action='store_true',
+                        help="omite el conjunto de 10M filas y la escala grande")
+    parser.add_argument('--guardar', action='store_true',
+                        help="guarda los resultados como nueva línea base")
+    parser.add_argument('--umbral', type=float, default=0.25,
+                        help="caída de rendimiento tolerada (por defecto 0.25)")
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--filtro', default=None, help="solo casos cuyo nombre contenga este texto")
+    parser.add_argument('--linea-base', default=RUTA_LINEA_BASE)
+    args = parser.parse_args(argv)
+
+    print("--- Benchmark de rendimiento ---")
+    calibracion = calibrar()
+    print(f"{'calibracion':<45} {calibracion:>16,.2f} cargas/s")
+    resultados = ejecutar_benchmark(args.rapido, args.repeticiones, args.filtro, calibracion)
+
+    if args.guardar:
+        guardar_linea_base(resultados, args.linea_base)
+        print(f"\nLínea base guardada en: {args.linea_base}")
+        return 0
+
+    if not os.path.exists(args.linea_base):
+        print("\nNo hay línea base; ejecute con --guardar para crearla.")
+        return 0
+
+    regresiones = comparar(resultados, cargar_linea_base(args.linea_base), args.umbral)
+    if not regresiones:
+        print(f"\nSin regresiones (umbral {args.umbral:.0%}).")
+        return 0
+
+    print(f"\nRegresiones de rendimiento (umbral {args.umbral:.0%}):")
+    for nombre, base, actual, cambio in regresiones:
+        print(f"  {nombre:<45} {base:>14,.2f} -> {actual:>14,.2f} ({cambio:+.1%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
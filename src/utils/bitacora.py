@@ -0,0 +1,122 @@
+import os
+import json
+import hashlib
+import numpy as np
+
+from src.utils.objetivo import ObjetivoECM
+from src.utils.historial import COLUMNA_PASOS
+
+
+def _a_json(obj):
+    """Conversión de los tipos que json no serializa por sí mismo."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if callable(obj):
+        return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', repr(obj))}"
+    return repr(obj)
+
+
+def _actualizar_huella(h, obj):
+    if isinstance(obj, ObjetivoECM):
+        # Un objetivo queda identificado por sus estadísticos suficientes
+        for valor in (obj.n, obj._mx, obj.media_y, obj._sxx, obj._sxy, obj.syy):
+            _actualizar_huella(h, valor)
+    elif isinstance(obj, np.ndarray):
+        arreglo = np.ascontiguousarray(obj)
+        h.update(f"{arreglo.dtype}{arreglo.shape}".encode())
+        h.update(arreglo.tobytes())
+    elif isinstance(obj, dict):
+        h.update(json.dumps(obj, sort_keys=True, default=_a_json).encode())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for elemento in obj:
+            _actualizar_huella(h, elemento)
+    elif callable(obj):
+        h.update(_a_json(obj).encode())
+    else:
+        h.update(repr(obj).encode())
+
+
+def huella(*objetos):
+    """
+    Identificador estable (SHA-1) de un conjunto de objetos: datos (arreglos
+    u ObjetivoECM), diccionarios de parámetros y valores simples.
+    """
+    h = hashlib.sha1()
+    for obj in objetos:
+        _actualizar_huella(h, obj)
+    return h.hexdigest()
+
+
+class BitacoraCorridas:
+    """
+    Bitácora de corridas terminadas, en un archivo JSON Lines de solo
+    agregado.
+
+    Cada corrida se escribe como una línea {"clave": ..., "registro": ...}
+    en cuanto termina, con flush y fsync, de modo que una interrupción
+    (error, corte de energía) pierde a lo sumo la corrida en curso. Una
+    última línea incompleta por una escritura interrumpida se ignora al
+    cargar.
+
+    Parámetros
+    ----------
+    ruta : str
+        Archivo de la bitácora (se crea al agregar la primera corrida).
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self._revisada = False
+
+    def cargar(self):
+        """
+        Lee las corridas registradas.
+
+        Retorna
+        -------
+        dict
+            {clave: registro}, con el historial (y sus pasos) como numpy.ndarray.
+        """
+        corridas = {}
+        if not os.path.exists(self.ruta):
+            return corridas
+
+        with open(self.ruta, encoding='utf-8') as f:
+            for linea in f:
+                try:
+                    entrada = json.loads(linea)
+                except json.JSONDecodeError:
+                    continue
+                registro = entrada['registro']
+                if 'Historial' in registro:
+                    registro['Historial'] = np.asarray(registro['Historial'], dtype=np.float64)
+                if COLUMNA_PASOS in registro:
+                    registro[COLUMNA_PASOS] = np.asarray(registro[COLUMNA_PASOS], dtype=np.int64)
+                corridas[entrada['clave']] = registro
+
+        return corridas
+
+    def agregar(self, clave, registro):
+        """Agrega una corrida terminada al final de la bitácora."""
+        directorio = os.path.dirname(self.ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+        linea = json.dumps({'clave': clave, 'registro': registro}, default=_a_json) + '\n'
+
+        # Si la última escritura quedó incompleta, la nueva línea empieza aparte
+        if not self._revisada:
+            self._revisada = True
+            if os.path.exists(self.ruta) and os.path.getsize(self.ruta) > 0:
+                with open(self.ruta, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        linea = '\n' + linea
+
+        with open(self.ruta, 'a', encoding='utf-8') as f:
+            f.write(linea)
+            f.flush()
+            os.fsync(f.fileno())
@@ -0,0 +1,156 @@
+import os
+import sys
+import json
+import inspect
+import hashlib
+import numpy as np
+
+from src.utils.bitacora import _a_json
+from src.utils.historial import COLUMNA_PASOS
+
+
+def version_fuente(func):
+    """
+    Huella del código fuente del que dependen los resultados de 'func'.
+
+    Si 'func' pertenece a un paquete (por ejemplo, src.algorithms.recocido)
+    se combinan todos los módulos .py del paquete raíz, ya que el algoritmo
+    depende también de los auxiliares comunes (objetivo, historial,
+    generadores aleatorios, ...); si no, solo el archivo que la define.
+    Editar cualquiera de ellos invalida los resultados guardados con la
+    versión anterior.
+    """
+    paquete = sys.modules.get(func.__module__.split('.')[0])
+    directorios = getattr(paquete, '__path__', None)
+    try:
+        if directorios:
+            archivos = sorted(os.path.join(carpeta, nombre)
+                              for directorio in directorios
+                              for carpeta, _, nombres in os.walk(directorio)
+                              for nombre in nombres if nombre.endswith('.py'))
+            base = os.path.dirname(list(directorios)[0])
+        else:
+            archivos = [inspect.getsourcefile(func)]
+            base = os.path.dirname(archivos[0])
+        h = hashlib.sha1()
+        for archivo in archivos:
+            h.update(os.path.relpath(archivo, base).encode())
+            with open(archivo, 'rb') as f:
+                h.update(f.read())
+        return h.hexdigest()
+    except (TypeError, OSError):
+        return f"{func.__module__}.{func.__qualname__}"
+
+
+# Parámetros con objetos vivos: su repr() no identifica su estado
+PARAMETROS_NO_CACHEABLES = ('rng', 'perfil', 'contador', 'detalles')
+
+
+def parametros_cacheables(params):
+    """
+    Indica si una corrida con estos parámetros puede guardarse en la caché:
+    no deben contener generadores ni otros objetos cuyo estado no quede
+    reflejado en la huella (ver PARAMETROS_NO_CACHEABLES).
+    """
+    if not isinstance(params, dict):
+        return True
+    if any(clave in params for clave in PARAMETROS_NO_CACHEABLES):
+        return False
+    generadores = (np.random.Generator, np.random.RandomState, np.random.BitGenerator)
+    return not any(isinstance(valor, generadores) for valor in params.values())
+
+
+class CacheResultados:
+    """
+    Caché en disco de corridas, direccionada por contenido.
+
+    Cada corrida se guarda como un archivo JSON cuyo nombre es su clave (la
+    huella de los datos, la versión del algoritmo, los parámetros y la
+    semilla), de modo que una misma entrada produce siempre el mismo
+    archivo y un cambio en cualquiera de ellas produce otro.
+
+    El tamaño total se acota con desalojo LRU: cada acierto actualiza la
+    fecha de modificación del archivo y, al superar 'max_bytes', se borran
+    primero las entradas usadas hace más tiempo.
+
+    Parámetros
+    ----------
+    ruta : str
+        Directorio de la caché (se crea si no existe).
+    max_bytes : int
+        Tamaño máximo de la caché en disco.
+    """
+
+    def __init__(self, ruta, max_bytes=512 * 2**20):
+        self.ruta = ruta
+        self.max_bytes = max_bytes
+        self.aciertos = 0
+        self.fallos = 0
+        self._total = None
+        os.makedirs(ruta, exist_ok=True)
+
+    def _archivo(self, clave):
+        return os.path.join(self.ruta, f"{clave}.json")
+
+    def obtener(self, clave):
+        """Registro guardado con 'clave', o None si no está en la caché."""
+        archivo = self._archivo(clave)
+        try:
+            with open(archivo, encoding='utf-8') as f:
+                registro = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.fallos += 1
+            return None
+
+        os.utime(archivo)
+        self.aciertos += 1
+        if 'Historial' in registro:
+            registro['Historial'] = np.asarray(registro['Historial'], dtype=np.float64)
+        if COLUMNA_PASOS in registro:
+            registro[COLUMNA_PASOS] = np.asarray(registro[COLUMNA_PASOS], dtype=np.int64)
+        return registro
+
+    def guardar(self, clave, registro):
+        """Guarda un registro (escritura atómica) y aplica el desalojo LRU."""
+        archivo = self._archivo(clave)
+        temporal = f"{archivo}.{os.getpid()}.tmp"
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(registro, f, default=_a_json)
+        tam = os.path.getsize(temporal)
+        os.replace(temporal, archivo)
+
+        # El directorio solo se recorre la primera vez o al superar el límite
+        if self._total is None:
+            self.desalojar()
+        else:
+            self._total += tam
+            if self._total > self.max_bytes:
+                self.desalojar()
+
+    def desalojar(self):
+        """Borra las entradas menos usadas hasta respetar 'max_bytes'."""
+        entradas = []
+        for nombre in os.listdir(self.ruta):
+            if not nombre.endswith('.json'):
+                continue
+            info = os.stat(os.path.join(self.ruta, nombre))
+            entradas.append((info.st_mtime_ns, info.st_size, nombre))
+
+        total = sum(tam for _, tam, _ in entradas)
+        for _, tam, nombre in sorted(entradas):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.ruta, nombre))
+            except OSError:
+                continue
+            total -= tam
+
+        self._total = total
+
+    def limpiar(self):
+        """Borra todas las entradas."""
+        for nombre in os.listdir(self.ruta):
+            if nombre.endswith('.json'):
+                os.remove(os.path.join(self.ruta, nombre))
+        self._total = 0
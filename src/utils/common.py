@@ -1,9 +1,12 @@
 import numpy as np
 import pandas as pd
 
+from src.utils.estadisticas import ResumenEnLinea
+
 def calcular_ecm(beta_0, beta_1, x, y):
     """
-    Calcula el Error Cuadrático Medio (ECM) para un modelo de regresión lineal simple.
+    Calcula el Error Cuadrático Medio (ECM) para un modelo de regresión lineal
+    simple o múltiple.
 
     El Error Cuadrático Medio (ECM) mide la magnitud promedio de los errores en las
     predicciones de un modelo. Se define como el promedio de los cuadrados de las
@@ -13,12 +16,14 @@ def calcular_ecm(beta_0, beta_1, x, y):
     ----------
     beta_0 : float
         Término independiente del modelo (intercepto).
-    beta_1 : float
-        Coeficiente asociado a la variable independiente x (pendiente).
+    beta_1 : float o array_like (d,)
+        Coeficiente asociado a la variable independiente x (pendiente), o
+        vector de pendientes en la regresión múltiple.
     x : float o array_like
-        Valores de entrada para el modelo. Puede ser un escalar, lista o arreglo numpy.
+        Valores de entrada para el modelo. Puede ser un escalar, lista o arreglo numpy,
+        o una matriz de diseño (n, d) en la regresión múltiple.
     y : float o array_like
-        Valores reales observados. Debe tener la misma forma que x.
+        Valores reales observados (una por fila de x).
 
     Retorna
     -------
@@ -31,6 +36,9 @@ def calcular_ecm(beta_0, beta_1, x, y):
     Para un modelo lineal simple:
         y_pred = beta_1 * x + beta_0
 
+    Para un modelo lineal múltiple (producto matriz-vector):
+        y_pred = X @ beta_1 + beta_0
+
     El ECM se define como:
         ECM = (1/n) * Σ (y_real - y_pred)^2
 
@@ -43,10 +51,72 @@ def calcular_ecm(beta_0, beta_1, x, y):
     0.75
     """
 
-    predicciones = beta_1 * x + beta_0
+    x = np.asarray(x)
+    if x.ndim == 2:
+        predicciones = x @ np.asarray(beta_1, dtype=float) + beta_0
+    else:
+        predicciones = beta_1 * x + beta_0
     return np.mean((y - predicciones) ** 2)
 
-def generar_tabla_resumen(df_total):
+def calcular_ecm_lote(betas_0, betas_1, x, y, max_elementos=2**22):
+    """
+    Calcula el ECM de k candidatos (b0, b1) en una sola llamada vectorizada.
+
+    Las predicciones de todos los candidatos se forman como una matriz
+    (bloque de datos × k). Para que la memoria quede acotada cuando n × k
+    es grande, los datos se recorren en bloques de filas de forma que cada
+    matriz intermedia tenga a lo sumo 'max_elementos' entradas.
+
+    Parámetros
+    ----------
+    betas_0 : array_like, forma (k,)
+        Interceptos de los candidatos.
+    betas_1 : array_like, forma (k,) o (k, d)
+        Pendientes de los candidatos.
+    x : array_like, forma (n,) o (n, d)
+        Variable(s) independiente(s).
+    y : array_like, forma (n,)
+        Variable objetivo.
+    max_elementos : int
+        Tamaño máximo de la matriz intermedia de residuos.
+
+    Retorna
+    -------
+    numpy.ndarray, forma (k,)
+        ECM de cada candidato.
+
+    Ejemplos
+    --------
+    >>> x = np.array([1, 2, 3, 4])
+    >>> y = np.array([5, 7, 10, 15])
+    >>> calcular_ecm_lote([2, 0], [3, 3], x, y)
+    array([0.75, 3.75])
+    """
+
+    betas_0 = np.asarray(betas_0, dtype=float).ravel()
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float).ravel()
+    x = x.reshape(y.size, -1)
+    betas_1 = np.asarray(betas_1, dtype=float).reshape(betas_0.size, x.shape[1])
+
+    k = betas_0.size
+    n = y.size
+    suma = np.zeros(k)
+
+    if k == 0 or n == 0:
+        return suma
+
+    filas_bloque = max(1, max_elementos // k)
+
+    for inicio in range(0, n, filas_bloque):
+        x_blk = x[inicio:inicio + filas_bloque]
+        y_blk = y[inicio:inicio + filas_bloque, None]
+        residuos = y_blk - (x_blk @ betas_1.T + betas_0)
+        suma += np.einsum('ij,ij->j', residuos, residuos)
+
+    return suma / n
+
+def generar_tabla_resumen(df_total, ecm_optimo=None):
     """
     Genera una tabla resumen con estadísticas descriptivas básicas para
     evaluar el desempeño de los algoritmos de optimización.
@@ -54,14 +124,32 @@ def generar_tabla_resumen(df_total):
     La tabla contiene, para cada algoritmo:
         - Promedio, mediana y desviación estándar del ECM final.
         - Promedio, mediana y desviación estándar del número de iteraciones.
+        - Promedio, mediana y desviación estándar del número de evaluaciones
+          del objetivo y del gradiente (si el DataFrame lo registra).
         - Promedio, mediana y desviación estándar del tiempo de ejecución.
+        - Por cada meta de ECM registrada: tasa de éxito (fracción de
+          corridas que la alcanzaron) y estadísticas de evaluaciones,
+          gradientes y tiempo hasta alcanzarla, calculadas sobre las
+          corridas exitosas.
+        - Si se indica 'ecm_optimo', las mismas estadísticas de la brecha de
+          optimalidad (ECM_Final - ecm_optimo).
+        - Si las corridas se perfilaron (experiment_runner con
+          perfilar=True), las mismas estadísticas del tiempo de cada fase
+          (columnas 'Perfil_<fase>', en segundos).
 
     Parámetros
     ----------
-    df_total : pandas.DataFrame
+    df_total : pandas.DataFrame o ResumenEnLinea
         DataFrame consolidado con los resultados de las ejecuciones.
         Debe contener las columnas:
         ['Algoritmo', 'ECM_Final', 'Iteraciones', 'Tiempo_seg']
+        También puede pasarse un ResumenEnLinea acumulado durante las
+        corridas; en ese caso la tabla se obtiene de sus estadísticos sin
+        necesidad de conservar los registros (medianas aproximadas si hay
+        más corridas por algoritmo que la capacidad de su bosquejo).
+    ecm_optimo : float o None
+        ECM mínimo global del problema (por ejemplo, el de
+        minimos_cuadrados), usado como referencia para la brecha.
 
     Retorna
     -------
@@ -69,12 +157,30 @@ def generar_tabla_resumen(df_total):
         Tabla resumen con estadísticas por algoritmo.
         Si el DataFrame está vacío, retorna un DataFrame vacío.
     """
-    
+    if isinstance(df_total, ResumenEnLinea):
+        return df_total.tabla(ecm_optimo)
+
     if df_total.empty:
         return pd.DataFrame()
 
     # Columnas esperadas
-    columnas_metricas = ['ECM_Final', 'Iteraciones', 'Tiempo_seg']
+    columnas_metricas = ['ECM_Final', 'Iteraciones', 'Evaluaciones', 'Gradientes', 'Tiempo_seg']
+
+    # Costo hasta cada meta (columnas agregadas por experiment_runner)
+    prefijo = 'Evaluaciones_Meta_'
+    for col in df_total.columns:
+        if col.startswith(prefijo):
+            etiqueta = col[len(prefijo):]
+            df_total = df_total.assign(**{f"Exito_Meta_{etiqueta}": df_total[col].notna().astype(float)})
+            columnas_metricas += [f"Exito_Meta_{etiqueta}", col, f"Gradientes_Meta_{etiqueta}",
+                                  f"Tiempo_Meta_{etiqueta}"]
+
+    # Tiempo por fase de las corridas perfiladas
+    columnas_metricas += [col for col in df_total.columns if col.startswith('Perfil_')]
+
+    if ecm_optimo is not None and 'ECM_Final' in df_total.columns:
+        df_total = df_total.assign(Brecha=df_total['ECM_Final'] - ecm_optimo)
+        columnas_metricas.append('Brecha')
 
     # Filtrar solo columnas válidas (por seguridad)
     columnas_presentes = [c for c in columnas_metricas if c in df_total.columns]
@@ -1,39 +1,382 @@
+import os
 import time
+import random
+import numpy as np
 import pandas as pd
 from functools import wraps
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-def experiment_runner(n_runs=30):
+from src.utils.objetivo import ContadorEvaluaciones
+from src.utils.bitacora import BitacoraCorridas, huella
+from src.utils.cache import CacheResultados, version_fuente, parametros_cacheables
+from src.utils.telemetria import BusEventos
+from src.utils.perfilado import PerfilFases
+from src.utils.historial import COLUMNA_PASOS
+
+# Contexto de cada proceso trabajador: (func, args, kwargs, metas, telemetria, perfilar). Se fija
+# una sola vez por proceso en el inicializador para no serializar los datos por tarea.
+_CONTEXTO_TRABAJADOR = None
+
+# Opciones de experiment_runner(historiales=...)
+HISTORIALES = ('todos', 'mejor', 'ninguno')
+
+
+def _inicializar_trabajador(func, args, kwargs, metas, telemetria=None, perfilar=False):
+    global _CONTEXTO_TRABAJADOR
+    # El bus (hilo y sumideros) no se puede enviar a otro proceso: cada
+    # trabajador construye el suyo a partir de la configuración
+    if telemetria is not None:
+        telemetria = BusEventos.desde_configuracion(telemetria)
+    _CONTEXTO_TRABAJADOR = (func, args, kwargs, metas, telemetria, perfilar)
+
+
+def _inyectar_params(args, kwargs, valores):
+    """
+    Retorna copias de (args, kwargs) donde el diccionario de parámetros del
+    algoritmo (tercer argumento posicional o 'params') incluye 'valores'
+    (por ejemplo, la semilla de la corrida), sin modificar el diccionario
+    original.
+    """
+    if 'params' in kwargs:
+        kwargs = dict(kwargs)
+        kwargs['params'] = {**kwargs['params'], **valores}
+    elif len(args) >= 3 and isinstance(args[2], dict):
+        args = args[:2] + ({**args[2], **valores},) + args[3:]
+    return args, kwargs
+
+
+def _params_de(args, kwargs):
+    """Diccionario de parámetros del algoritmo (ver _inyectar_params), o None."""
+    if 'params' in kwargs:
+        return kwargs['params']
+    if len(args) >= 3 and isinstance(args[2], dict):
+        return args[2]
+    return None
+
+
+def _descartar_historial(registro):
+    """Deja vacío el historial de un registro (y sus pasos, si los tiene)."""
+    registro['Historial'] = np.empty(0)
+    if COLUMNA_PASOS in registro:
+        registro[COLUMNA_PASOS] = np.empty(0, dtype=np.int64)
+
+
+def _segundos(ns):
+    return np.nan if ns is None else ns / 1e9
+
+
+def _ejecutar_corrida(func, args, kwargs, nombre, indice, semilla, metas=None, telemetria=None,
+                      perfilar=False):
+    """
+    Ejecuta una corrida individual y arma su registro de resultados.
+
+    Si se recibe una semilla, se pasa al algoritmo como params['semilla']
+    y además se reinicia con ella el estado global de 'random' y
+    'np.random' (para funciones que aún dependan de él).
+
+    El algoritmo recibe además params['contador'], un ContadorEvaluaciones
+    con el que su objetivo cuenta las evaluaciones y mide el tiempo hasta
+    cada meta de ECM, y params['detalles'], un diccionario donde puede
+    informar datos propios de la corrida (por ejemplo, el motivo de
+    parada) que se agregan como columnas del registro.
+
+    Con un BusEventos en 'telemetria' se emiten los eventos de inicio y fin
+    de la corrida y, desde el contador, una muestra del progreso cada
+    'muestreo_cada' evaluaciones (del objetivo más gradientes).
+
+    Con perfilar=True el algoritmo recibe también params['perfil'], un
+    PerfilFases, y el registro incluye el tiempo ('Perfil_<fase>') y las
+    llamadas ('Llamadas_<fase>') de cada fase medida, más 'Perfil_otros'.
+    """
+    contador = ContadorEvaluaciones(metas)
+    detalles = {}
+    valores = {'contador': contador, 'detalles': detalles}
+    perfil = None
+    if perfilar:
+        perfil = valores['perfil'] = PerfilFases()
+
+    if telemetria is not None:
+        telemetria.emitir('inicio_corrida', algoritmo=nombre, ejecucion=indice + 1, semilla=semilla)
+        contador.observar(
+            lambda c: telemetria.emitir('muestra', algoritmo=nombre, ejecucion=indice + 1,
+                                        evaluaciones=c.evaluaciones, gradientes=c.gradientes,
+                                        mejor=c.mejor,
+                                        segundos=(time.perf_counter_ns() - c.inicio_ns) / 1e9),
+            telemetria.muestreo_cada)
+
+    if semilla is not None:
+        random.seed(semilla)
+        np.random.seed(semilla)
+        valores['semilla'] = semilla
+
+    args, kwargs = _inyectar_params(args, kwargs, valores)
+
+    inicio = time.perf_counter_ns()
+    contador.inicio_ns = inicio
+    betas, ecm, iters, hist = func(*args, **kwargs)
+    fin = time.perf_counter_ns()
+
+    registro = {
+        "Algoritmo": nombre,
+        "Ejecucion": indice + 1,
+        "Semilla": semilla,
+    }
+    # Una columna por coeficiente: Beta_0, Beta_1, ..., Beta_d
+    registro.update({f"Beta_{i}": beta for i, beta in enumerate(betas)})
+    registro.update({
+        "ECM_Final": ecm,
+        "Iteraciones": iters,
+        "Evaluaciones": contador.evaluaciones,
+        "Gradientes": contador.gradientes,
+        "Tiempo_seg": (fin - inicio) / 1e9,
+    })
+    # Costo hasta cada meta (NaN si la corrida no la alcanzó), en evaluaciones
+    # del objetivo y en gradientes por separado
+    for etiqueta in contador.metas:
+        evaluaciones = contador.evaluaciones_meta[etiqueta]
+        gradientes = contador.gradientes_meta[etiqueta]
+        registro[f"Evaluaciones_Meta_{etiqueta}"] = np.nan if evaluaciones is None else evaluaciones
+        registro[f"Gradientes_Meta_{etiqueta}"] = np.nan if gradientes is None else gradientes
+        registro[f"Tiempo_Meta_{etiqueta}"] = _segundos(contador.ns_meta[etiqueta])
+    pasos = detalles.pop(COLUMNA_PASOS, None)
+    registro.update(detalles)
+    if perfil is not None:
+        registro.update(perfil.columnas(fin - inicio))
+    registro["Historial"] = hist
+    # Paso de cada valor del historial (solo si no es 0, 1, 2, ...)
+    if pasos is not None:
+        registro[COLUMNA_PASOS] = pasos
+
+    if telemetria is not None:
+        telemetria.emitir('fin_corrida', algoritmo=nombre, ejecucion=indice + 1, ecm=ecm,
+                          iteraciones=iters, evaluaciones=contador.evaluaciones,
+                          segundos=registro["Tiempo_seg"])
+    return registro
+
+
+def _ejecutar_corrida_trabajador(nombre, indice, semilla):
+    func, args, kwargs, metas, telemetria, perfilar = _CONTEXTO_TRABAJADOR
+    registro = _ejecutar_corrida(func, args, kwargs, nombre, indice, semilla, metas, telemetria,
+                                 perfilar)
+    # Los eventos de la corrida se escriben antes de entregar el resultado
+    if telemetria is not None:
+        telemetria.vaciar()
+    return registro
+
+
+def generar_semillas(semilla, n_runs):
+    """
+    Deriva 'n_runs' semillas independientes y deterministas a partir de una
+    semilla maestra usando numpy.random.SeedSequence.
+
+    La semilla de la corrida i depende solo de (semilla, i), por lo que los
+    resultados no cambian con el número de procesos utilizados.
+    """
+    hijos = np.random.SeedSequence(semilla).spawn(n_runs)
+    return [int(h.generate_state(1)[0]) for h in hijos]
+
+
+def experiment_runner(n_runs=30, n_jobs=1, semilla=None, metas=None, bitacora=None, cache=None,
+                      resumen=None, historiales='todos', telemetria=None, perfilar=False):
     """
     Ejecuta un algoritmo de optimización 'n_runs' veces y registra:
     - ECM final
     - Iteraciones
-    - Tiempo de ejecución
+    - Evaluaciones del objetivo (y del gradiente), comparables entre
+      algoritmos a diferencia de las iteraciones
+    - Tiempo de ejecución (time.perf_counter_ns)
+    - Evaluaciones, gradientes y tiempo hasta alcanzar cada meta de ECM
     - Parámetros óptimos (beta_0, beta_1)
-    - Historial de error
+    - Historial de error (y el paso de cada valor, 'Historial_Pasos', si
+      el algoritmo no registra todos los pasos; ver RegistroHistorial)
+    - Semilla utilizada en cada corrida
+
+    Parámetros
+    ----------
+    n_runs : int
+        Número de corridas.
+    n_jobs : int
+        Número de procesos. Con 1 las corridas se ejecutan en serie en el
+        proceso actual; con -1 se usan todos los núcleos disponibles.
+    semilla : int o None
+        Semilla maestra. Cada corrida recibe una semilla derivada propia
+        (como params['semilla']), por lo que los resultados son idénticos
+        sin importar 'n_jobs'. Si es None la semilla maestra se toma de
+        np.random (reproducible si se fijó np.random.seed).
+    metas : dict, iterable o None
+        Umbrales de ECM para medir el costo hasta alcanzar una calidad
+        dada. Con un diccionario {etiqueta: umbral} las columnas se llaman
+        'Evaluaciones_Meta_<etiqueta>', 'Gradientes_Meta_<etiqueta>' y
+        'Tiempo_Meta_<etiqueta>'. Evaluaciones y gradientes no se suman: los
+        métodos de gradiente alcanzan las metas con 0 evaluaciones, y el
+        tiempo es la medida común a todos los algoritmos.
+    bitacora : str o None
+        Archivo JSON Lines donde se guarda cada corrida en cuanto termina
+        (ver BitacoraCorridas). Al volver a ejecutar, las corridas ya
+        registradas con el mismo algoritmo (y versión de su código, ver
+        version_fuente), datos, parámetros, metas, semilla y número de
+        ejecución se toman de la bitácora en lugar de repetirse, lo que
+        permite reanudar una campaña interrumpida. Solo se usa si se
+        indica 'semilla'.
+    cache : str, CacheResultados o None
+        Caché en disco direccionada por contenido (directorio o instancia).
+        La clave de cada corrida combina los datos, la versión del código
+        del algoritmo, los parámetros, las metas y la semilla: si nada de
+        eso cambió, la corrida se toma de la caché sin ejecutarse. La
+        versión del código abarca todo el paquete del algoritmo (ver
+        version_fuente). Solo se usa si se indica 'semilla', ya que sin
+        ella las corridas no son repetibles entre campañas, y si los parámetros no contienen
+        objetos vivos como 'rng' (ver parametros_cacheables).
+    resumen : ResumenEnLinea o None
+        Resumen estadístico que se actualiza con cada corrida en cuanto
+        termina (o se recupera de la bitácora o la caché). Puede
+        compartirse entre varios algoritmos y pasarse a
+        generar_tabla_resumen.
+    historiales : {'todos', 'mejor', 'ninguno'}
+        Historiales que se conservan en el DataFrame retornado: todos, solo
+        el de la corrida con menor ECM final (el que grafica
+        plot_convergencia) o ninguno. Las demás corridas quedan con un
+        historial vacío una vez guardadas en la bitácora, la caché y el
+        resumen, de modo que la memoria no crece con el largo de cada
+        corrida.
+    telemetria : BusEventos o None
+        Bus de eventos para observar el progreso en vivo: se emiten
+        'inicio_experimento' y 'fin_experimento' por algoritmo, y
+        'inicio_corrida', 'muestra' y 'fin_corrida' por corrida (ver
+        BusEventos). En modo paralelo cada trabajador usa su propio bus con
+        los mismos sumideros.
+    perfilar : bool
+        Si es True, cada corrida mide el tiempo (time.perf_counter_ns) y
+        las llamadas de las fases internas del algoritmo (selección,
+        evaluación, aceptación, etc.; ver PerfilFases) y los agrega al
+        registro como 'Perfil_<fase>' y 'Llamadas_<fase>'. Sin perfilado
+        los algoritmos ejecutan exactamente el mismo código. Las corridas
+        perfiladas usan claves de bitácora y caché propias.
+
+    Notas
+    -----
+    En modo paralelo la función decorada y sus argumentos (por ejemplo los
+    arreglos X, Y) se envían una sola vez a cada proceso trabajador, no en
+    cada tarea. La función debe poder importarse desde su módulo, y el
+    script que la invoque debe proteger su ejecución con
+    'if __name__ == "__main__":'.
 
     Retorna un DataFrame con los resultados.
     """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
+            if historiales not in HISTORIALES:
+                raise ValueError(f"Opción de historiales desconocida: '{historiales}'. "
+                                 f"Opciones: {', '.join(HISTORIALES)}.")
             nombre = func.__name__
-            resultados = []
-
-            for i in range(n_runs):
-                inicio = time.time()
-                betas, ecm, iters, hist = func(*args, **kwargs)
-                fin = time.time()
-
-                resultados.append({
-                    "Algoritmo": nombre,
-                    "Ejecucion": i + 1,
-                    "Beta_0": betas[0],
-                    "Beta_1": betas[1],
-                    "ECM_Final": ecm,
-                    "Iteraciones": iters,
-                    "Tiempo_seg": fin - inicio,
-                    "Historial": hist
-                })
+            procesos = os.cpu_count() if n_jobs == -1 else n_jobs
+
+            # Sin semilla maestra se toma una de np.random: las semillas de las
+            # corridas se derivan igual con uno o varios procesos
+            semilla_maestra = semilla
+            if semilla_maestra is None:
+                semilla_maestra = int(np.random.randint(0, 2**32 - 1))
+            semillas = generar_semillas(semilla_maestra, n_runs)
+
+            resultados = [None] * n_runs
+            pendientes = list(range(n_runs))
+            # (ECM_Final, índice) de la corrida que conserva su historial
+            mejor = None
+
+            def conservar(i, registro):
+                """Agrega la corrida al resultado y al resumen, y aplica 'historiales'."""
+                nonlocal mejor
+                if resumen is not None:
+                    resumen.agregar(registro)
+                resultados[i] = registro
+                if historiales == 'todos':
+                    return
+                clave = (registro['ECM_Final'], i)
+                if historiales == 'mejor' and (mejor is None or clave < mejor):
+                    if mejor is not None:
+                        _descartar_historial(resultados[mejor[1]])
+                    mejor = clave
+                else:
+                    _descartar_historial(registro)
+
+            # Las corridas perfiladas tienen columnas extra: no se mezclan con las demás
+            perfilado = ('perfil',) if perfilar else ()
+
+            # Sin semilla maestra explícita las corridas no son repetibles: no
+            # se reanudan desde la bitácora ni se escriben en ella. Tampoco se
+            # reanudan corridas hechas con otra versión del código.
+            registro_corridas = None
+            if bitacora is not None and semilla is not None:
+                registro_corridas = BitacoraCorridas(bitacora)
+                previas = registro_corridas.cargar()
+                experimento = huella(version_fuente(func), func, args, kwargs, metas, *perfilado)
+                claves = [f"{nombre}:{experimento}:{semillas[i]}:{i}" for i in range(n_runs)]
+
+                for i in range(n_runs):
+                    registro = previas.pop(claves[i], None)
+                    if registro is not None:
+                        conservar(i, registro)
+                del previas
+                pendientes = [i for i in range(n_runs) if resultados[i] is None]
+
+            almacen = None
+            if cache is not None and semilla is not None and \
+                    parametros_cacheables(_params_de(args, kwargs)):
+                almacen = cache if isinstance(cache, CacheResultados) else CacheResultados(cache)
+                contenido = huella(version_fuente(func), func, args, kwargs, metas, *perfilado)
+                claves_cache = {i: huella(contenido, semillas[i], i) for i in pendientes}
+
+                for i in pendientes:
+                    registro = almacen.obtener(claves_cache[i])
+                    if registro is not None:
+                        if registro_corridas is not None:
+                            registro_corridas.agregar(claves[i], registro)
+                        conservar(i, registro)
+                pendientes = [i for i in pendientes if resultados[i] is None]
+
+            if telemetria is not None:
+                inicio = time.perf_counter_ns()
+                telemetria.emitir('inicio_experimento', algoritmo=nombre, corridas=n_runs,
+                                  pendientes=len(pendientes))
+
+            if procesos <= 1 or not pendientes:
+                nuevos = (
+                    (i, _ejecutar_corrida(func, args, kwargs, nombre, i, semillas[i], metas,
+                                          telemetria, perfilar))
+                    for i in pendientes
+                )
+                ejecutor = None
+            else:
+                configuracion = None if telemetria is None else telemetria.configuracion()
+                ejecutor = ProcessPoolExecutor(max_workers=procesos,
+                                               initializer=_inicializar_trabajador,
+                                               initargs=(func, args, kwargs, metas, configuracion,
+                                                         perfilar))
+                # Las corridas se recogen en el orden en que terminan
+                futuros = {ejecutor.submit(_ejecutar_corrida_trabajador, nombre, i, semillas[i]): i
+                           for i in pendientes}
+                nuevos = ((futuros[futuro], futuro.result()) for futuro in as_completed(futuros))
+
+            try:
+                # Cada corrida se guarda en la bitácora (y en la caché) en cuanto termina
+                for i, registro in nuevos:
+                    if registro_corridas is not None:
+                        registro_corridas.agregar(claves[i], registro)
+                    if almacen is not None:
+                        almacen.guardar(claves_cache[i], registro)
+                    conservar(i, registro)
+            except BaseException:
+                # Ante un error o Ctrl-C no se espera a las corridas pendientes
+                if ejecutor is not None:
+                    ejecutor.shutdown(wait=False, cancel_futures=True)
+                raise
+            if ejecutor is not None:
+                ejecutor.shutdown()
+
+            if telemetria is not None:
+                telemetria.emitir('fin_experimento', algoritmo=nombre, corridas=n_runs,
+                                  segundos=(time.perf_counter_ns() - inicio) / 1e9)
 
             return pd.DataFrame(resultados)
         return wrapper
@@ -0,0 +1,373 @@
+import math
+import numpy as np
+import pandas as pd
+
+# Sufijos de las columnas de la tabla resumen (ver generar_tabla_resumen)
+SUFIJOS = ('Promedio', 'Mediana', 'Desv.')
+
+
+class MomentosWelford:
+    """
+    Media y varianza en línea (algoritmo de Welford), sin guardar los
+    valores.
+
+    Dos acumuladores se combinan con las fórmulas de Chan et al., lo que
+    permite resumir corridas en procesos distintos y unir los resultados.
+    Los NaN se ignoran, como en pandas.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+
+    def actualizar(self, valores):
+        """Incorpora un valor o un arreglo de valores."""
+        valores = np.asarray(valores, dtype=float).ravel()
+        valores = valores[~np.isnan(valores)]
+        if valores.size == 1:
+            self.n += 1
+            delta = valores[0] - self.media
+            self.media += delta / self.n
+            self.m2 += delta * (valores[0] - self.media)
+        elif valores.size > 1:
+            otro = MomentosWelford()
+            otro.n = valores.size
+            otro.media = float(valores.mean())
+            otro.m2 = float(((valores - otro.media) ** 2).sum())
+            self.combinar(otro)
+
+    def combinar(self, otro):
+        """Incorpora los valores resumidos por otro acumulador."""
+        if otro.n == 0:
+            return self
+        n = self.n + otro.n
+        delta = otro.media - self.media
+        self.media += delta * otro.n / n
+        self.m2 += otro.m2 + delta * delta * self.n * otro.n / n
+        self.n = n
+        return self
+
+    @property
+    def varianza(self):
+        """Varianza muestral (ddof=1); NaN con menos de dos valores."""
+        return self.m2 / (self.n - 1) if self.n > 1 else np.nan
+
+    @property
+    def desviacion(self):
+        return math.sqrt(self.varianza) if self.n > 1 else np.nan
+
+
+class BosquejoCuantiles:
+    """
+    Bosquejo de cuantiles combinable (compactores al estilo KLL).
+
+    Los valores se guardan en niveles; el nivel h contiene elementos con
+    peso 2^h. Cuando un nivel supera 'k' elementos se ordena y se conserva
+    uno de cada dos (alternando la posición inicial), que sube al nivel
+    siguiente con el doble de peso. El error de rango es O(1/k) y la
+    memoria O(k log(n/k)).
+
+    Mientras no se haya compactado (n <= k) los cuantiles son exactos e
+    iguales a los de numpy/pandas (interpolación lineal).
+
+    Parámetros
+    ----------
+    k : int
+        Capacidad de cada nivel.
+    """
+
+    def __init__(self, k=256):
+        self.k = int(k)
+        self.niveles = [[]]
+        self.n = 0
+        self._paridad = 0
+
+    def actualizar(self, valores):
+        """Incorpora un valor o un arreglo de valores (los NaN se ignoran)."""
+        valores = np.asarray(valores, dtype=float).ravel()
+        valores = valores[~np.isnan(valores)]
+        self.niveles[0].extend(valores.tolist())
+        self.n += valores.size
+        self._compactar()
+
+    def combinar(self, otro):
+        """Incorpora los valores resumidos por otro bosquejo."""
+        while len(self.niveles) < len(otro.niveles):
+            self.niveles.append([])
+        for nivel, elementos in zip(self.niveles, otro.niveles):
+            nivel.extend(elementos)
+        self.n += otro.n
+        self._compactar()
+        return self
+
+    def _compactar(self):
+        h = 0
+        while h < len(self.niveles):
+            if len(self.niveles[h]) > self.k:
+                elementos = sorted(self.niveles[h])
+                # Con un número impar de elementos, el último se queda en el nivel
+                sobrante = elementos[-1:] if len(elementos) % 2 else []
+                pares = elementos[:len(elementos) - len(sobrante)]
+                if h + 1 == len(self.niveles):
+                    self.niveles.append([])
+                self.niveles[h + 1].extend(pares[self._paridad::2])
+                self.niveles[h] = sobrante
+                self._paridad ^= 1
+            h += 1
+
+    def cuantil(self, q):
+        """Cuantil 'q' (entre 0 y 1) aproximado; NaN si el bosquejo está vacío."""
+        if self.n == 0:
+            return np.nan
+        if len(self.niveles) == 1:
+            return float(np.quantile(self.niveles[0], q))
+
+        valores = np.concatenate([np.asarray(nivel, dtype=float) for nivel in self.niveles])
+        pesos = np.concatenate([np.full(len(nivel), 2.0 ** h) for h, nivel in enumerate(self.niveles)])
+        orden = np.argsort(valores, kind='stable')
+        acumulado = np.cumsum(pesos[orden])
+        posicion = np.searchsorted(acumulado, q * acumulado[-1], side='left')
+        return float(valores[orden][min(posicion, len(orden) - 1)])
+
+    def mediana(self):
+        return self.cuantil(0.5)
+
+
+class ResumenEnLinea:
+    """
+    Resumen por algoritmo de las métricas de las corridas, actualizado a
+    medida que terminan (ver experiment_runner, parámetro 'resumen').
+
+    Solo se guardan momentos de Welford y un bosquejo de cuantiles por
+    algoritmo y métrica, no los registros (ni sus historiales), por lo que
+    la memoria no crece con el número de corridas. Resúmenes construidos
+    en procesos distintos se unen con combinar().
+
+    Parámetros
+    ----------
+    k : int
+        Capacidad de los bosquejos de cuantiles (medianas exactas hasta k
+        corridas por algoritmo).
+    """
+
+    METRICAS = ('ECM_Final', 'Iteraciones', 'Evaluaciones', 'Gradientes', 'Tiempo_seg')
+
+    def __init__(self, k=256):
+        self.k = k
+        self.acumuladores = {}
+
+    def _acumulador(self, algoritmo, columna):
+        por_columna = self.acumuladores.setdefault(algoritmo, {})
+        if columna not in por_columna:
+            por_columna[columna] = (MomentosWelford(), BosquejoCuantiles(self.k))
+        return por_columna[columna]
+
+    def _metricas(self, registro):
+        """Métricas de un registro, en el orden de la tabla resumen."""
+        metricas = {c: registro[c] for c in self.METRICAS if c in registro}
+        prefijo = 'Evaluaciones_Meta_'
+        for columna in registro:
+            if columna.startswith(prefijo):
+                etiqueta = columna[len(prefijo):]
+                valor = registro[columna]
+                alcanzada = valor is not None and not (isinstance(valor, float) and math.isnan(valor))
+                metricas[f"Exito_Meta_{etiqueta}"] = float(alcanzada)
+                metricas[columna] = valor
+                if f"Gradientes_Meta_{etiqueta}" in registro:
+                    metricas[f"Gradientes_Meta_{etiqueta}"] = registro[f"Gradientes_Meta_{etiqueta}"]
+                metricas[f"Tiempo_Meta_{etiqueta}"] = registro.get(f"Tiempo_Meta_{etiqueta}", np.nan)
+        metricas.update((c, v) for c, v in registro.items() if c.startswith('Perfil_'))
+        return metricas
+
+    def agregar(self, registro):
+        """Incorpora el registro de una corrida (dict, como los de experiment_runner)."""
+        algoritmo = registro['Algoritmo']
+        for columna, valor in self._metricas(registro).items():
+            momentos, bosquejo = self._acumulador(algoritmo, columna)
+            valor = np.nan if valor is None else valor
+            momentos.actualizar(valor)
+            bosquejo.actualizar(valor)
+
+    def agregar_df(self, df):
+        """Incorpora las corridas de un DataFrame de resultados."""
+        for registro in df.drop(columns='Historial', errors='ignore').to_dict('records'):
+            self.agregar(registro)
+
+    def combinar(self, otro):
+        """Une el resumen de otro proceso o lote de corridas."""
+        for algoritmo, por_columna in otro.acumuladores.items():
+            for columna, (momentos, bosquejo) in por_columna.items():
+                propios = self._acumulador(algoritmo, columna)
+                propios[0].combinar(momentos)
+                propios[1].combinar(bosquejo)
+        return self
+
+    def tabla(self, ecm_optimo=None):
+        """
+        Tabla con el mismo formato que generar_tabla_resumen: promedio,
+        mediana y desviación estándar de cada métrica por algoritmo, y la
+        brecha de optimalidad si se indica 'ecm_optimo'.
+        """
+        if not self.acumuladores:
+            return pd.DataFrame()
+
+        filas = {}
+        columnas = []
+        for algoritmo in sorted(self.acumuladores):
+            fila = {}
+            for columna, (momentos, bosquejo) in self.acumuladores[algoritmo].items():
+                fila[columna] = (momentos.media if momentos.n else np.nan,
+                                 bosquejo.mediana(), momentos.desviacion)
+                if columna not in columnas:
+                    columnas.append(columna)
+            if ecm_optimo is not None and 'ECM_Final' in fila:
+                media, mediana, desviacion = fila['ECM_Final']
+                fila['Brecha'] = (media - ecm_optimo, mediana - ecm_optimo, desviacion)
+            filas[algoritmo] = fila
+        if ecm_optimo is not None and 'ECM_Final' in columnas:
+            columnas.append('Brecha')
+
+        datos = {f"{c} {sufijo}": [filas[a].get(c, (np.nan,) * 3)[i] for a in filas]
+                 for c in columnas for i, sufijo in enumerate(SUFIJOS)}
+        return pd.DataFrame(datos, index=pd.Index(list(filas), name='Algoritmo'))
+
+
+def intervalo_bootstrap(valores, estadistico=np.mean, n_remuestras=2000, nivel=0.95, rng=None):
+    """
+    Intervalo de confianza bootstrap (percentil) de un estadístico.
+
+    Las 'n_remuestras' remuestras se generan de una sola vez como una
+    matriz de índices (n_remuestras, n), y el estadístico se evalúa por
+    filas, sin bucles de Python.
+
+    Parámetros
+    ----------
+    valores : array_like
+        Muestra (los NaN se descartan).
+    estadistico : callable
+        Función con argumento 'axis' (np.mean, np.median, ...).
+    n_remuestras : int
+    nivel : float
+        Nivel de confianza.
+    rng : numpy.random.Generator, int o None
+
+    Retorna
+    -------
+    tuple
+        (estimado, limite_inferior, limite_superior)
+    """
+    valores = np.asarray(valores, dtype=float)
+    valores = valores[~np.isnan(valores)]
+    if valores.size == 0:
+        return np.nan, np.nan, np.nan
+
+    rng = np.random.default_rng(rng)
+    indices = rng.integers(0, valores.size, size=(n_remuestras, valores.size))
+    replicas = estadistico(valores[indices], axis=1)
+    alfa = (1 - nivel) / 2
+    inferior, superior = np.quantile(replicas, [alfa, 1 - alfa])
+    return float(estadistico(valores)), float(inferior), float(superior)
+
+
+def intervalos_bootstrap(df, columna='ECM_Final', estadistico=np.mean, n_remuestras=2000,
+                         nivel=0.95, rng=None):
+    """
+    Intervalos bootstrap de 'columna' para cada algoritmo de un DataFrame
+    de resultados.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        Columnas 'Estimado', 'IC_Inferior' e 'IC_Superior', indexado por
+        algoritmo.
+    """
+    rng = np.random.default_rng(rng)
+    filas = {algoritmo: intervalo_bootstrap(grupo[columna].to_numpy(dtype=float), estadistico,
+                                            n_remuestras, nivel, rng)
+             for algoritmo, grupo in df.groupby('Algoritmo')}
+    return pd.DataFrame.from_dict(filas, orient='index',
+                                  columns=['Estimado', 'IC_Inferior', 'IC_Superior']).rename_axis('Algoritmo')
+
+
+def _rangos(valores):
+    """Rangos (desde 1) con el promedio en los empates."""
+    orden = np.argsort(valores, kind='stable')
+    ordenados = valores[orden]
+    # Inicio de cada grupo de valores iguales
+    inicios = np.flatnonzero(np.r_[True, ordenados[1:] != ordenados[:-1]])
+    tamanos = np.diff(np.r_[inicios, ordenados.size])
+    promedio = inicios + (tamanos + 1) / 2
+    rangos = np.empty(valores.size)
+    rangos[orden] = np.repeat(promedio, tamanos)
+    return rangos, tamanos
+
+
+def mann_whitney(a, b):
+    """
+    Prueba U de Mann-Whitney (bilateral) con aproximación normal,
+    corrección por empates y por continuidad.
+
+    Retorna
+    -------
+    tuple
+        (U, p_valor, A12), donde U es el estadístico de 'a' y A12 (Vargha y
+        Delaney) la probabilidad de que un valor de 'a' supere a uno de 'b'
+        (0.5 = sin diferencia; con ECM, A12 < 0.5 indica que 'a' es mejor).
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    a, b = a[~np.isnan(a)], b[~np.isnan(b)]
+    n1, n2 = a.size, b.size
+    if n1 == 0 or n2 == 0:
+        return np.nan, np.nan, np.nan
+
+    rangos, tamanos = _rangos(np.concatenate((a, b)))
+    u = rangos[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+
+    media = n1 * n2 / 2
+    varianza = n1 * n2 / 12 * ((n + 1) - (tamanos ** 3 - tamanos).sum() / (n * (n - 1)))
+    if varianza <= 0:
+        p_valor = 1.0
+    else:
+        z = (abs(u - media) - 0.5) / math.sqrt(varianza)
+        p_valor = min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+    return float(u), p_valor, float(u / (n1 * n2))
+
+
+def pruebas_pareadas(df, columna='ECM_Final', alfa=0.05):
+    """
+    Pruebas de Mann-Whitney entre cada par de algoritmos, con los p-valores
+    ajustados por el método de Holm.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        Una fila por par: 'Algoritmo_A', 'Algoritmo_B', 'U', 'p_valor',
+        'p_Holm', 'A12' y 'Significativa' (p_Holm < alfa).
+    """
+    grupos = {algoritmo: grupo[columna].to_numpy(dtype=float)
+              for algoritmo, grupo in df.groupby('Algoritmo')}
+    nombres = sorted(grupos)
+
+    filas = []
+    for i, a in enumerate(nombres):
+        for b in nombres[i + 1:]:
+            u, p_valor, a12 = mann_whitney(grupos[a], grupos[b])
+            filas.append({'Algoritmo_A': a, 'Algoritmo_B': b, 'U': u, 'p_valor': p_valor, 'A12': a12})
+
+    pruebas = pd.DataFrame(filas, columns=['Algoritmo_A', 'Algoritmo_B', 'U', 'p_valor', 'A12'])
+    if pruebas.empty:
+        return pruebas.assign(p_Holm=[], Significativa=[])
+
+    # Holm: p ordenados de menor a mayor, multiplicados por (m - i) y monótonos
+    m = len(pruebas)
+    orden = np.argsort(pruebas['p_valor'].to_numpy(), kind='stable')
+    ajustados = np.fmax.accumulate(pruebas['p_valor'].to_numpy()[orden] * (m - np.arange(m)))
+    p_holm = np.empty(m)
+    p_holm[orden] = np.minimum(ajustados, 1.0)
+
+    pruebas.insert(4, 'p_Holm', p_holm)
+    pruebas['Significativa'] = pruebas['p_Holm'] < alfa
+    return pruebas
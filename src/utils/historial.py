@@ -0,0 +1,180 @@
+import numpy as np
+
+MODOS_HISTORIAL = ('completo', 'diezmado', 'mejoras', 'apagado')
+
+# Columna del registro de la corrida con el paso de cada valor del historial
+COLUMNA_PASOS = 'Historial_Pasos'
+
+
+class RegistroHistorial:
+    """
+    Registro acotado del historial de ECM de una corrida.
+
+    Reemplaza a la lista de Python que crecía con un float por iteración.
+    Los valores se guardan en un arreglo float64 preasignado, y el modo
+    determina qué pasos se conservan:
+
+        - 'completo' : todos los pasos (comportamiento original).
+        - 'diezmado' : uno de cada 'cada' pasos (0, cada, 2*cada, ...).
+        - 'mejoras'  : solo los pasos donde el valor mejora al mínimo previo
+                       (puntos de cambio de la curva best-so-far).
+        - 'apagado'  : no se guarda nada.
+
+    Parámetros
+    ----------
+    modo : str
+        Uno de MODOS_HISTORIAL.
+    cada : int
+        Intervalo de diezmado (solo modo 'diezmado').
+    capacidad : int
+        Número de pasos esperado, usado para preasignar el arreglo. Si se
+        excede, el arreglo se duplica.
+    ancho : int o None
+        Si se indica, cada paso registra un vector de 'ancho' valores (por
+        ejemplo, uno por cadena) y el historial es una matriz
+        (pasos, ancho). En modo 'mejoras' se compara el mínimo de cada fila.
+    """
+
+    def __init__(self, modo='completo', cada=1, capacidad=1024, ancho=None):
+        if modo not in MODOS_HISTORIAL:
+            raise ValueError(f"Modo de historial desconocido: '{modo}'. "
+                             f"Opciones: {', '.join(MODOS_HISTORIAL)}.")
+        if cada < 1:
+            raise ValueError("El intervalo de diezmado debe ser al menos 1.")
+
+        self.modo = modo
+        self.cada = int(cada)
+        self.ancho = ancho
+
+        # La capacidad se ajusta a lo que el modo realmente va a guardar
+        if modo == 'diezmado':
+            capacidad = capacidad // self.cada + 1
+        elif modo == 'mejoras':
+            capacidad = min(capacidad, 64)
+        elif modo == 'apagado':
+            capacidad = 0
+
+        capacidad = max(int(capacidad), 1)
+        forma = (capacidad,) if ancho is None else (capacidad, ancho)
+
+        self._valores = np.empty(forma)
+        self._pasos = np.empty(capacidad, dtype=np.int64) if modo == 'mejoras' else None
+        self._tam = 0
+        self._paso = 0
+        self._mejor = np.inf
+
+    def _reservar(self, k):
+        """Garantiza espacio para 'k' registros más."""
+        capacidad = self._valores.shape[0]
+        if self._tam + k <= capacidad:
+            return
+
+        nueva = max(2 * capacidad, self._tam + k)
+        valores = np.empty((nueva,) + self._valores.shape[1:])
+        valores[:self._tam] = self._valores[:self._tam]
+        self._valores = valores
+
+        if self._pasos is not None:
+            pasos = np.empty(nueva, dtype=np.int64)
+            pasos[:self._tam] = self._pasos[:self._tam]
+            self._pasos = pasos
+
+    def _agregar(self, valor):
+        if self._tam == self._valores.shape[0]:
+            self._reservar(1)
+
+        self._valores[self._tam] = valor
+        if self._pasos is not None:
+            self._pasos[self._tam] = self._paso
+        self._tam += 1
+
+    def registrar(self, valor):
+        """Registra el valor del paso actual y avanza el contador de pasos."""
+        modo = self.modo
+
+        if modo == 'completo':
+            self._agregar(valor)
+        elif modo == 'diezmado':
+            if self._paso % self.cada == 0:
+                self._agregar(valor)
+        elif modo == 'mejoras':
+            referencia = valor if self.ancho is None else np.min(valor)
+            if referencia < self._mejor:
+                self._mejor = referencia
+                self._agregar(valor)
+
+        self._paso += 1
+
+    def registrar_lote(self, valores):
+        """
+        Registra varios pasos consecutivos a la vez (equivalente a llamar a
+        registrar() con cada valor, en orden).
+        """
+        valores = np.asarray(valores, dtype=np.float64)
+        if self.ancho is None:
+            valores = valores.ravel()
+        m = valores.shape[0]
+        if m == 0:
+            return
+
+        pasos = np.arange(self._paso, self._paso + m)
+
+        if self.modo == 'completo':
+            seleccion = np.arange(m)
+        elif self.modo == 'diezmado':
+            seleccion = np.flatnonzero(pasos % self.cada == 0)
+        elif self.modo == 'mejoras':
+            referencia = valores if self.ancho is None else valores.min(axis=1)
+            minimo_previo = np.minimum.accumulate(np.concatenate(([self._mejor], referencia)))[:-1]
+            seleccion = np.flatnonzero(referencia < minimo_previo)
+            if seleccion.size:
+                self._mejor = float(referencia[seleccion[-1]])
+        else:
+            seleccion = np.empty(0, dtype=np.int64)
+
+        k = seleccion.size
+        if k:
+            self._reservar(k)
+            self._valores[self._tam:self._tam + k] = valores[seleccion]
+            if self._pasos is not None:
+                self._pasos[self._tam:self._tam + k] = pasos[seleccion]
+            self._tam += k
+
+        self._paso += m
+
+    def __len__(self):
+        return self._tam
+
+    def valores(self):
+        """Arreglo float64 con los valores registrados."""
+        return self._valores[:self._tam].copy()
+
+    def pasos(self):
+        """Índice de paso (0, 1, ...) de cada valor registrado."""
+        if self.modo == 'mejoras':
+            return self._pasos[:self._tam].copy()
+        return np.arange(self._tam, dtype=np.int64) * (self.cada if self.modo == 'diezmado' else 1)
+
+    def reportar(self, params):
+        """
+        Informa en params['detalles'] (si existe) el paso de cada valor
+        registrado, como columna 'Historial_Pasos' del registro de la
+        corrida. En modo 'completo' no se informa: los pasos son 0, 1, ...
+        """
+        detalles = params.get('detalles')
+        if detalles is not None and self.modo != 'completo':
+            detalles[COLUMNA_PASOS] = self.pasos()
+
+
+def crear_registro(params, capacidad=1024, ancho=None):
+    """
+    Crea el registro de historial de un algoritmo a partir de sus
+    parámetros: params['historial'] (modo, por defecto 'completo') y
+    params['historial_cada'] (intervalo de diezmado, por defecto 1).
+    """
+    return RegistroHistorial(
+        modo=params.get('historial', 'completo'),
+        cada=params.get('historial_cada', 1),
+        capacidad=capacidad,
+        ancho=ancho
+    )
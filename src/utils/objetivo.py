@@ -0,0 +1,542 @@
+import math
+import time
+import numpy as np
+
+from src.utils.perfilado import perfilar_objetivo
+
+
+class ObjetivoECM:
+    """
+    Función objetivo (ECM) precalculada a partir de estadísticos suficientes.
+
+    El ECM de un modelo lineal y = X b + b0 depende de los datos únicamente a
+    través de n, ΣX, Σy, XᵀX, Xᵀy y Σy² (forma de Gram). Esta clase los
+    calcula una sola vez por conjunto de datos y, a partir de ellos, evalúa
+    el ECM de cualquier vector de coeficientes sin recorrer los datos: en
+    tiempo constante para la regresión simple y en O(d²) con d variables.
+
+    Para evitar la cancelación numérica de la fórmula directa con sumas
+    crudas, los estadísticos se guardan centrados (medias y co-momentos) y el
+    ECM se expresa como:
+
+        ECM = (SSE_min + (b - b*)ᵀ Sxx (b - b*)) / n + (ȳ - b0 - bᵀ x̄)^2
+
+    donde b* = Sxx⁻¹ Sxy es el vector de pendientes de mínimos cuadrados y
+    SSE_min la suma de cuadrados residual en el óptimo. Ambos términos son no
+    negativos. En la regresión simple (d = 1) se reduce a
+
+        ECM = (SSE_min + Sxx * (b1 - b1*)^2) / n + (ȳ - b0 - b1 * x̄)^2
+
+    Atributos
+    ---------
+    n : int
+        Número de observaciones.
+    dimension : int
+        Número de variables independientes (d).
+    media_x : float o numpy.ndarray (d,)
+        Media de cada variable independiente.
+    media_y : float
+        Media de y.
+    sxx : float o numpy.ndarray (d, d)
+        Matriz de Gram centrada Σ(x-x̄)(x-x̄)ᵀ.
+    sxy : float o numpy.ndarray (d,)
+        Co-momentos centrados Σ(x-x̄)(y-ȳ).
+    syy : float
+        Suma de cuadrados centrada Σ(y-ȳ)².
+
+    Con d = 1 los atributos son escalares, como en la regresión simple.
+    """
+
+    def __init__(self, n, media_x, media_y, sxx, sxy, syy, sse_min=None):
+        if n <= 0:
+            raise ValueError("Se requiere al menos una observación para construir el objetivo.")
+
+        self._mx = np.atleast_1d(np.asarray(media_x, dtype=float)).ravel()
+        d = self._mx.size
+        self._sxx = np.asarray(sxx, dtype=float).reshape(d, d)
+        self._sxy = np.asarray(sxy, dtype=float).reshape(d)
+
+        self.n = int(n)
+        self.dimension = d
+        self.media_y = float(media_y)
+        self.syy = float(syy)
+
+        # Pendientes de mínimos cuadrados (de norma mínima si Sxx es singular)
+        if d == 1:
+            s = self._sxx[0, 0]
+            self._pend = np.array([self._sxy[0] / s if s > 0 else 0.0])
+        else:
+            self._pend = np.linalg.lstsq(self._sxx, self._sxy, rcond=None)[0]
+
+        if sse_min is None:
+            sse_min = self.syy - np.dot(self._pend, self._sxy)
+        self.sse_min = max(float(sse_min), 0.0)
+
+        self._inv_n = 1.0 / self.n
+
+        if d == 1:
+            self._b1 = float(self._pend[0])
+            self.media_x = float(self._mx[0])
+            self.sxx = float(self._sxx[0, 0])
+            self.sxy = float(self._sxy[0])
+        else:
+            self.media_x = self._mx
+            self.sxx = self._sxx
+            self.sxy = self._sxy
+
+    @classmethod
+    def desde_datos(cls, x, y):
+        """
+        Construye el objetivo recorriendo los datos una sola vez (O(n d²)).
+
+        Parámetros
+        ----------
+        x : array_like, forma (n,) o (n, d)
+            Variable(s) independiente(s).
+        y : array_like, forma (n,)
+            Variable objetivo.
+
+        Retorna
+        -------
+        ObjetivoECM
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float).ravel()
+
+        if x.ndim <= 1:
+            x = x.reshape(-1, 1)
+
+        if x.shape[0] != y.shape[0]:
+            raise ValueError("x e y deben tener la misma cantidad de observaciones.")
+
+        n = y.size
+        if n == 0:
+            raise ValueError("Se requiere al menos una observación para construir el objetivo.")
+
+        media_x = x.mean(axis=0)
+        media_y = y.mean()
+        xc = x - media_x
+        yc = y - media_y
+
+        sxx = xc.T @ xc
+        sxy = xc.T @ yc
+        syy = np.dot(yc, yc)
+
+        # Residuo exacto en el óptimo (evita Syy - b*ᵀSxy cuando el ajuste es casi perfecto)
+        pendientes = cls(n, media_x, media_y, sxx, sxy, syy)._pend
+        residuo = yc - xc @ pendientes
+        sse_min = np.dot(residuo, residuo)
+
+        return cls(n, media_x, media_y, sxx, sxy, syy, sse_min)
+
+    @classmethod
+    def desde_bloques(cls, bloques):
+        """
+        Construye el objetivo en una sola pasada sobre bloques de datos.
+
+        Cada bloque se reduce a sus estadísticos y éstos se combinan con
+        combinar(), por lo que nunca hay más de un bloque en memoria.
+
+        Parámetros
+        ----------
+        bloques : iterable de (x, y)
+            Fragmentos consecutivos del conjunto de datos.
+
+        Retorna
+        -------
+        ObjetivoECM
+        """
+        objetivo = None
+        for x, y in bloques:
+            if np.size(y) == 0:
+                continue
+            parcial = cls.desde_datos(x, y)
+            objetivo = parcial if objetivo is None else objetivo.combinar(parcial)
+
+        if objetivo is None:
+            raise ValueError("Se requiere al menos una observación para construir el objetivo.")
+        return objetivo
+
+    def combinar(self, otro):
+        """
+        Combina los estadísticos de dos subconjuntos disjuntos de datos.
+
+        Usa las fórmulas de actualización por pares (Chan et al.) para las
+        medias y co-momentos centrados, de modo que el resultado es el
+        mismo objetivo que se obtendría con los datos concatenados.
+
+        Parámetros
+        ----------
+        otro : ObjetivoECM
+
+        Retorna
+        -------
+        ObjetivoECM
+            Nuevo objetivo con los datos de ambos.
+        """
+        if otro.dimension != self.dimension:
+            raise ValueError("Los objetivos a combinar deben tener el mismo número de variables.")
+
+        n = self.n + otro.n
+        dx = otro._mx - self._mx
+        dy = otro.media_y - self.media_y
+        factor = self.n * otro.n / n
+
+        return ObjetivoECM(
+            n,
+            self._mx + dx * otro.n / n,
+            self.media_y + dy * otro.n / n,
+            self._sxx + otro._sxx + np.outer(dx, dx) * factor,
+            self._sxy + otro._sxy + dx * dy * factor,
+            self.syy + otro.syy + dy * dy * factor,
+        )
+
+    @property
+    def b1_optimo(self):
+        """Pendiente de mínimos cuadrados (vector de pendientes si d > 1)."""
+        return self._b1 if self.dimension == 1 else self._pend.copy()
+
+    @property
+    def b0_optimo(self):
+        """Intercepto de mínimos cuadrados."""
+        return float(self.media_y - np.dot(self._pend, self._mx))
+
+    @property
+    def betas_optimos(self):
+        """Vector de mínimos cuadrados [b0, b1, ..., bd]."""
+        return [self.b0_optimo] + self._pend.tolist()
+
+    @property
+    def ecm_minimo(self):
+        """ECM alcanzado por la solución de mínimos cuadrados."""
+        return self.sse_min * self._inv_n
+
+    def evaluar(self, beta_0, beta_1):
+        """
+        Evalúa el ECM de un modelo (b0, b1) sin recorrer los datos.
+
+        Parámetros
+        ----------
+        beta_0 : float
+            Intercepto.
+        beta_1 : float o array_like (d,)
+            Pendiente (regresión simple) o vector de pendientes.
+
+        Retorna
+        -------
+        float
+            Mismo valor que calcular_ecm(beta_0, beta_1, x, y) salvo
+            diferencias de redondeo.
+        """
+        if self.dimension == 1 and np.ndim(beta_1) == 0:
+            d1 = beta_1 - self._b1
+            d0 = self.media_y - beta_0 - beta_1 * self.media_x
+            return (self.sse_min + self.sxx * d1 * d1) * self._inv_n + d0 * d0
+
+        b = np.asarray(beta_1, dtype=float).reshape(self.dimension)
+        dv = b - self._pend
+        d0 = self.media_y - beta_0 - np.dot(b, self._mx)
+        return float((self.sse_min + dv @ self._sxx @ dv) * self._inv_n + d0 * d0)
+
+    __call__ = evaluar
+
+    def evaluar_vector(self, betas):
+        """Evalúa el ECM de un vector de coeficientes [b0, b1, ..., bd]."""
+        if self.dimension == 1:
+            return self.evaluar(betas[0], betas[1])
+        return self.evaluar(betas[0], betas[1:])
+
+    def evaluar_lote(self, betas_0, betas_1):
+        """
+        Evalúa el ECM de k candidatos a la vez.
+
+        Parámetros
+        ----------
+        betas_0 : array_like, forma (k,)
+            Interceptos de los candidatos.
+        betas_1 : array_like, forma (k,) o (k, d)
+            Pendientes de los candidatos.
+
+        Retorna
+        -------
+        numpy.ndarray, forma (k,)
+            ECM de cada candidato. El costo es O(k d²), independiente de n.
+        """
+        betas_0 = np.asarray(betas_0, dtype=float)
+        betas_1 = np.asarray(betas_1, dtype=float)
+
+        if self.dimension == 1 and betas_1.shape == betas_0.shape:
+            d1 = betas_1 - self._b1
+            d0 = self.media_y - betas_0 - betas_1 * self.media_x
+            return (self.sse_min + self.sxx * d1 * d1) * self._inv_n + d0 * d0
+
+        betas_1 = betas_1.reshape(betas_0.shape + (self.dimension,))
+        dv = betas_1 - self._pend
+        cuadratica = np.einsum('...i,ij,...j->...', dv, self._sxx, dv)
+        d0 = self.media_y - betas_0 - betas_1 @ self._mx
+        return (self.sse_min + cuadratica) * self._inv_n + d0 * d0
+
+    def evaluar_matriz(self, betas):
+        """
+        Evalúa el ECM de cada fila de una matriz de coeficientes.
+
+        Parámetros
+        ----------
+        betas : numpy.ndarray, forma (k, d + 1)
+            Cada fila es un vector [b0, b1, ..., bd].
+
+        Retorna
+        -------
+        numpy.ndarray, forma (k,)
+        """
+        betas = np.asarray(betas, dtype=float)
+        if self.dimension == 1:
+            return self.evaluar_lote(betas[..., 0], betas[..., 1])
+        return self.evaluar_lote(betas[..., 0], betas[..., 1:])
+
+    def gradiente(self, beta_0, beta_1):
+        """
+        Gradiente exacto del ECM respecto de (b0, b1), sin recorrer los datos.
+
+        Retorna
+        -------
+        (float, float o numpy.ndarray)
+            (dECM/db0, dECM/db1); el segundo es un vector si d > 1.
+        """
+        if self.dimension == 1 and np.ndim(beta_1) == 0:
+            d1 = beta_1 - self._b1
+            d0 = self.media_y - beta_0 - beta_1 * self.media_x
+            return -2.0 * d0, 2.0 * (self.sxx * d1 * self._inv_n - self.media_x * d0)
+
+        b = np.asarray(beta_1, dtype=float).reshape(self.dimension)
+        d0 = self.media_y - beta_0 - np.dot(b, self._mx)
+        return -2.0 * d0, 2.0 * (self._sxx @ (b - self._pend) * self._inv_n - self._mx * d0)
+
+
+class ContadorEvaluaciones:
+    """
+    Contador de evaluaciones del objetivo y de tiempo hasta alcanzar metas.
+
+    Cada evaluación (individual o en lote) incrementa 'evaluaciones' y
+    actualiza el mejor ECM visto. La primera vez que el mejor ECM queda por
+    debajo de (o iguala) una meta se guardan el número de evaluaciones y
+    de gradientes hechos hasta ese punto y el tiempo transcurrido desde
+    'inicio_ns' (medido con time.perf_counter_ns). Evaluaciones y
+    gradientes se cuentan por separado porque no tienen el mismo costo.
+
+    Parámetros
+    ----------
+    metas : dict, iterable o None
+        Umbrales de ECM. Un diccionario {etiqueta: umbral} permite nombrar
+        las metas; con una lista la etiqueta es el umbral formateado.
+
+    Atributos
+    ---------
+    evaluaciones : int
+        Evaluaciones del ECM (un lote de k candidatos cuenta k).
+    gradientes : int
+        Evaluaciones del gradiente (exacto o de un mini-lote).
+    evaluaciones_meta, gradientes_meta, ns_meta : dict
+        Por etiqueta de meta, evaluaciones, gradientes y nanosegundos hasta
+        alcanzarla (None si no se alcanzó).
+
+    Con observar() se registra una función que recibe el contador cada
+    cierto número de evaluaciones más gradientes (por ejemplo, para emitir
+    telemetría); sin observador el costo es una comparación por evaluación,
+    lote o gradiente.
+    """
+
+    def __init__(self, metas=None):
+        if metas is None:
+            metas = {}
+        elif not isinstance(metas, dict):
+            metas = {f"{m:g}": m for m in metas}
+
+        self.metas = dict(metas)
+        self.evaluaciones = 0
+        self.gradientes = 0
+        self.mejor = math.inf
+        self.evaluaciones_meta = {etiqueta: None for etiqueta in self.metas}
+        self.gradientes_meta = {etiqueta: None for etiqueta in self.metas}
+        self.ns_meta = {etiqueta: None for etiqueta in self.metas}
+
+        # Metas pendientes de la más fácil (umbral mayor) a la más difícil
+        self._pendientes = sorted(self.metas.items(), key=lambda meta: meta[1], reverse=True)
+        self.inicio_ns = time.perf_counter_ns()
+
+        self._observador = None
+        self._observar_cada = 0
+        self._proxima_muestra = math.inf
+
+    def iniciar(self):
+        """Reinicia el origen de los tiempos a meta."""
+        self.inicio_ns = time.perf_counter_ns()
+
+    def _alcanzar(self, evaluaciones, valor):
+        ahora = time.perf_counter_ns() - self.inicio_ns
+        while self._pendientes and valor <= self._pendientes[0][1]:
+            etiqueta = self._pendientes.pop(0)[0]
+            self.evaluaciones_meta[etiqueta] = evaluaciones
+            self.gradientes_meta[etiqueta] = self.gradientes
+            self.ns_meta[etiqueta] = ahora
+
+    def observar(self, funcion, cada):
+        """Llama a funcion(contador) cada 'cada' evaluaciones más gradientes."""
+        self._observador = funcion
+        self._observar_cada = int(cada)
+        self._proxima_muestra = self.evaluaciones + self.gradientes + self._observar_cada
+
+    def _muestrear(self):
+        self._observador(self)
+        cada = self._observar_cada
+        self._proxima_muestra = ((self.evaluaciones + self.gradientes) // cada + 1) * cada
+
+    def registrar(self, valor):
+        """Registra una evaluación individual."""
+        self.evaluaciones += 1
+        if valor < self.mejor:
+            self.mejor = valor
+            if self._pendientes:
+                self._alcanzar(self.evaluaciones, valor)
+        if self.evaluaciones + self.gradientes >= self._proxima_muestra:
+            self._muestrear()
+
+    def registrar_gradiente(self):
+        """Registra una evaluación del gradiente (exacto o de un mini-lote)."""
+        self.gradientes += 1
+        if self.evaluaciones + self.gradientes >= self._proxima_muestra:
+            self._muestrear()
+
+    def registrar_progreso(self, valor):
+        """
+        Actualiza el mejor ECM y las metas con un valor que no cuenta como
+        evaluación (por ejemplo, el ECM que un método de gradiente calcula
+        solo para su historial). El costo hasta cada meta queda en los
+        gradientes (y evaluaciones) hechos hasta ese momento.
+        """
+        if valor < self.mejor:
+            self.mejor = valor
+            if self._pendientes:
+                self._alcanzar(self.evaluaciones, valor)
+
+    def registrar_lote(self, valores):
+        """Registra un lote de evaluaciones, en orden."""
+        k = valores.size
+        if k == 0:
+            return
+
+        minimo = float(valores.min())
+        if minimo < self.mejor:
+            self.mejor = minimo
+            # Evaluación exacta del lote en la que se alcanza cada meta
+            while self._pendientes and minimo <= self._pendientes[0][1]:
+                umbral = self._pendientes[0][1]
+                posicion = int(np.argmax(valores.ravel() <= umbral))
+                self._alcanzar(self.evaluaciones + posicion + 1, umbral)
+
+        self.evaluaciones += k
+        if self.evaluaciones + self.gradientes >= self._proxima_muestra:
+            self._muestrear()
+
+
+class ObjetivoContador(ObjetivoECM):
+    """
+    Objetivo ECM instrumentado: se comporta igual que el objetivo original
+    pero informa cada evaluación a un ContadorEvaluaciones.
+
+    Parámetros
+    ----------
+    objetivo : ObjetivoECM
+        Objetivo a instrumentar (se comparten sus estadísticos).
+    contador : ContadorEvaluaciones
+    """
+
+    def __init__(self, objetivo, contador):
+        self.__dict__.update(objetivo.__dict__)
+        self.contador = contador
+
+    def evaluar(self, beta_0, beta_1):
+        valor = ObjetivoECM.evaluar(self, beta_0, beta_1)
+        self.contador.registrar(valor)
+        return valor
+
+    __call__ = evaluar
+
+    def evaluar_lote(self, betas_0, betas_1):
+        valores = ObjetivoECM.evaluar_lote(self, betas_0, betas_1)
+        self.contador.registrar_lote(valores)
+        return valores
+
+    def gradiente(self, beta_0, beta_1):
+        self.contador.registrar_gradiente()
+        return ObjetivoECM.gradiente(self, beta_0, beta_1)
+
+
+def crear_objetivo(x, y=None, params=None):
+    """
+    Devuelve un objetivo ECM listo para evaluarse sin recorrer los datos.
+
+    Si 'x' ya es un objetivo precalculado se retorna tal cual (en ese caso
+    'y' se ignora); de lo contrario se construye a partir de los arreglos.
+    Esto permite que los algoritmos reciban indistintamente (x, y) o un
+    ObjetivoECM en lugar de los datos crudos.
+
+    Si params['contador'] es un ContadorEvaluaciones (lo agrega
+    experiment_runner), el objetivo se instrumenta con ObjetivoContador; si
+    params['perfil'] es un PerfilFases, sus evaluaciones se miden en la
+    fase 'evaluacion'.
+    """
+    if isinstance(x, ObjetivoECM):
+        objetivo = x
+    elif y is None:
+        raise ValueError("Se requieren los valores de 'y' para construir el objetivo.")
+    else:
+        objetivo = ObjetivoECM.desde_datos(x, y)
+
+    if not params:
+        return objetivo
+    if params.get('contador') is not None:
+        objetivo = ObjetivoContador(objetivo, params['contador'])
+    return perfilar_objetivo(objetivo, params.get('perfil'))
+
+
+def vector_inicial(params, dimension):
+    """
+    Vector de coeficientes inicial [b0, b1, ..., bd] de un algoritmo.
+
+    Usa params['inicio'] si se indica; si no, params['inicio_b0'] para el
+    intercepto y params['inicio_b1'] para todas las pendientes.
+    """
+    if 'inicio' in params:
+        inicio = np.asarray(params['inicio'], dtype=float).ravel()
+        if inicio.size != dimension + 1:
+            raise ValueError(f"'inicio' debe tener {dimension + 1} coeficientes.")
+        return inicio
+
+    inicio = np.full(dimension + 1, float(params.get('inicio_b1', 0.0)))
+    inicio[0] = params.get('inicio_b0', 0.0)
+    return inicio
+
+
+# Código de prueba
+def main():
+    x = np.array([1, 2, 3, 4])
+    y = np.array([5, 7, 10, 15])
+
+    objetivo = ObjetivoECM.desde_datos(x, y)
+
+    print("ECM (2, 3):", objetivo(2, 3))
+    print(f"Óptimo: b0 = {objetivo.b0_optimo:.4f}, b1 = {objetivo.b1_optimo:.4f}, "
+          f"ECM = {objetivo.ecm_minimo:.6f}")
+
+    # Regresión múltiple: y = 1 + 2 x1 - x2
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 5, (50, 2))
+    Y = 1 + X @ np.array([2.0, -1.0])
+
+    objetivo = ObjetivoECM.desde_datos(X, Y)
+    print("Óptimo (2 variables):", np.round(objetivo.betas_optimos, 4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+from src.utils.historial import COLUMNA_PASOS
+
+ARCHIVO_ESQUEMA = 'esquema.json'
+ARCHIVO_VALORES = 'historial_valores.npy'
+ARCHIVO_OFFSETS = 'historial_offsets.npy'
+ARCHIVO_ANCHOS = 'historial_anchos.npy'
+ARCHIVO_PASOS = 'historial_pasos.npy'
+
+
+def _columna_a_arreglo(serie):
+    """
+    Convierte una columna escalar del DataFrame en un arreglo NumPy de tipo
+    fijo (numérico o texto de ancho fijo) apto para memory-mapping.
+    """
+    if pd.api.types.is_numeric_dtype(serie) or pd.api.types.is_bool_dtype(serie):
+        return serie.to_numpy()
+
+    numerica = pd.to_numeric(serie, errors='coerce')
+    if numerica.notna().sum() == serie.notna().sum():
+        return numerica.to_numpy(dtype=float)
+
+    return serie.astype(str).to_numpy(dtype=str)
+
+
+def guardar_resultados(df_total, ruta):
+    """
+    Guarda los resultados de las corridas en un almacén columnar binario.
+
+    El almacén es un directorio con:
+        - un archivo .npy por cada columna escalar (ECM_Final, Tiempo_seg, ...),
+        - 'historial_valores.npy' : todos los historiales concatenados en un
+          único arreglo float64 contiguo,
+        - 'historial_offsets.npy' : arreglo int64 de longitud (corridas + 1);
+          el historial de la corrida i es valores[offsets[i]:offsets[i + 1]],
+        - 'historial_anchos.npy' : número de columnas de cada historial
+          (0 si es unidimensional, K si es una matriz de K cadenas),
+        - 'historial_pasos.npy' : solo si hay columna 'Historial_Pasos';
+          arreglo int64 con el paso de cada fila de cada historial,
+          concatenado en el mismo orden (0, 1, ... para las corridas sin
+          pasos propios),
+        - 'esquema.json' : orden de las columnas y número de corridas.
+
+    Parámetros
+    ----------
+    df_total : pandas.DataFrame
+        Resultados consolidados (por ejemplo, salida de experiment_runner).
+        Las columnas 'Historial' e 'Historial_Pasos' son opcionales.
+    ruta : str
+        Directorio de destino (se crea si no existe).
+    """
+    os.makedirs(ruta, exist_ok=True)
+
+    columnas = [c for c in df_total.columns if c not in ('Historial', COLUMNA_PASOS)]
+
+    for col in columnas:
+        np.save(os.path.join(ruta, f"{col}.npy"), _columna_a_arreglo(df_total[col]),
+                allow_pickle=False)
+
+    if 'Historial' in df_total.columns:
+        historiales = [np.asarray(h, dtype=np.float64) for h in df_total['Historial']]
+    else:
+        historiales = [np.empty(0) for _ in range(len(df_total))]
+
+    anchos = np.array([h.shape[1] if h.ndim == 2 else 0 for h in historiales], dtype=np.int64)
+
+    if COLUMNA_PASOS in df_total.columns:
+        pasos = [np.arange(len(h), dtype=np.int64) if np.ndim(p) == 0 else np.asarray(p, dtype=np.int64)
+                 for h, p in zip(historiales, df_total[COLUMNA_PASOS])]
+        for h, p in zip(historiales, pasos):
+            if len(p) != len(h):
+                raise ValueError("Cada historial debe tener un paso por fila.")
+        np.save(os.path.join(ruta, ARCHIVO_PASOS),
+                np.concatenate(pasos) if pasos else np.empty(0, dtype=np.int64))
+    elif os.path.exists(os.path.join(ruta, ARCHIVO_PASOS)):
+        os.remove(os.path.join(ruta, ARCHIVO_PASOS))
+
+    historiales = [h.ravel() for h in historiales]
+
+    longitudes = np.fromiter((h.size for h in historiales), dtype=np.int64, count=len(historiales))
+    offsets = np.zeros(len(historiales) + 1, dtype=np.int64)
+    np.cumsum(longitudes, out=offsets[1:])
+
+    valores = np.concatenate(historiales) if historiales else np.empty(0)
+
+    np.save(os.path.join(ruta, ARCHIVO_VALORES), valores.astype(np.float64, copy=False))
+    np.save(os.path.join(ruta, ARCHIVO_OFFSETS), offsets)
+    np.save(os.path.join(ruta, ARCHIVO_ANCHOS), anchos)
+
+    with open(os.path.join(ruta, ARCHIVO_ESQUEMA), 'w', encoding='utf-8') as f:
+        json.dump({'columnas': columnas, 'corridas': len(df_total)}, f, indent=2)
+
+
+class ResultadosColumnares:
+    """
+    Vista de lectura sobre un almacén creado con guardar_resultados.
+
+    Los arreglos se abren con memory-mapping, de modo que cargar el almacén
+    no lee los historiales a memoria: cada historial se obtiene como una
+    vista del arreglo contiguo solo cuando se solicita.
+
+    Atributos
+    ---------
+    escalares : pandas.DataFrame
+        Columnas escalares de cada corrida (una fila por corrida).
+    valores : numpy.ndarray
+        Historiales concatenados.
+    offsets : numpy.ndarray
+        Límites de cada historial dentro de 'valores'.
+    anchos : numpy.ndarray
+        Columnas de cada historial (0 para historiales unidimensionales).
+    pasos_concatenados : numpy.ndarray o None
+        Paso de cada fila de los historiales, si el almacén los tiene.
+    """
+
+    def __init__(self, ruta, mmap=True):
+        modo = 'r' if mmap else None
+
+        with open(os.path.join(ruta, ARCHIVO_ESQUEMA), encoding='utf-8') as f:
+            esquema = json.load(f)
+
+        self.ruta = ruta
+        self.escalares = pd.DataFrame({
+            col: np.load(os.path.join(ruta, f"{col}.npy"), mmap_mode=modo)
+            for col in esquema['columnas']
+        })
+        self.valores = np.load(os.path.join(ruta, ARCHIVO_VALORES), mmap_mode=modo)
+        self.offsets = np.load(os.path.join(ruta, ARCHIVO_OFFSETS), mmap_mode=modo)
+
+        ruta_anchos = os.path.join(ruta, ARCHIVO_ANCHOS)
+        if os.path.exists(ruta_anchos):
+            self.anchos = np.load(ruta_anchos)
+        else:
+            self.anchos = np.zeros(len(self.offsets) - 1, dtype=np.int64)
+
+        self.pasos_concatenados = None
+        ruta_pasos = os.path.join(ruta, ARCHIVO_PASOS)
+        if os.path.exists(ruta_pasos):
+            self.pasos_concatenados = np.load(ruta_pasos, mmap_mode=modo)
+            filas = np.diff(self.offsets) // np.maximum(self.anchos, 1)
+            self._offsets_pasos = np.concatenate(([0], np.cumsum(filas)))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def historial(self, i):
+        """
+        Historial de la corrida en la posición 'i' (vista, sin copia). Si la
+        corrida registró varias cadenas se retorna una matriz (pasos, K).
+        """
+        valores = self.valores[self.offsets[i]:self.offsets[i + 1]]
+        if self.anchos[i] > 0:
+            return valores.reshape(-1, self.anchos[i])
+        return valores
+
+    def pasos(self, i):
+        """
+        Paso de cada fila del historial de la corrida 'i' (0, 1, ... si la
+        corrida registró todos los pasos).
+        """
+        if self.pasos_concatenados is None:
+            filas = (self.offsets[i + 1] - self.offsets[i]) // max(int(self.anchos[i]), 1)
+            return np.arange(filas, dtype=np.int64)
+        return self.pasos_concatenados[self._offsets_pasos[i]:self._offsets_pasos[i + 1]]
+
+    def a_dataframe(self):
+        """
+        Reconstruye el DataFrame completo, incluida la columna 'Historial'
+        (y 'Historial_Pasos' si el almacén guarda los pasos).
+        """
+        df = self.escalares.copy()
+        df['Historial'] = [np.array(self.historial(i)) for i in range(len(self))]
+        if self.pasos_concatenados is not None:
+            df[COLUMNA_PASOS] = [np.array(self.pasos(i)) for i in range(len(self))]
+        return df
+
+
+def cargar_resultados(ruta, mmap=True):
+    """
+    Abre un almacén de resultados creado con guardar_resultados.
+
+    Parámetros
+    ----------
+    ruta : str
+        Directorio del almacén.
+    mmap : bool
+        Si es True (por defecto) los arreglos se abren con memory-mapping.
+
+    Retorna
+    -------
+    ResultadosColumnares
+    """
+    return ResultadosColumnares(ruta, mmap=mmap)
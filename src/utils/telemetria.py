@@ -0,0 +1,199 @@
+import os
+import sys
+import json
+import time
+import queue
+import socket
+import threading
+
+from src.utils.bitacora import _a_json
+
+
+class SumideroJSONL:
+    """
+    Sumidero de eventos en un archivo JSON Lines (un evento por línea).
+
+    Cada lote se escribe con una sola llamada en modo de agregado, por lo
+    que varios procesos pueden compartir el archivo.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        directorio = os.path.dirname(ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        self._archivo = open(ruta, 'a', encoding='utf-8')
+
+    def configuracion(self):
+        return (SumideroJSONL, {'ruta': self.ruta})
+
+    def escribir(self, eventos):
+        self._archivo.write(''.join(json.dumps(e, default=_a_json) + '\n' for e in eventos))
+        self._archivo.flush()
+
+    def cerrar(self):
+        self._archivo.close()
+
+
+class SumideroUDP:
+    """
+    Sumidero de eventos por UDP local: un datagrama JSON por evento.
+
+    No espera a ningún receptor; si nadie escucha los eventos se pierden
+    sin afectar a las corridas. Para observarlos, por ejemplo:
+    'nc -ul 9999'.
+    """
+
+    def __init__(self, host='127.0.0.1', puerto=9999):
+        self.host = host
+        self.puerto = puerto
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def configuracion(self):
+        return (SumideroUDP, {'host': self.host, 'puerto': self.puerto})
+
+    def escribir(self, eventos):
+        for evento in eventos:
+            try:
+                self._socket.sendto(json.dumps(evento, default=_a_json).encode(), (self.host, self.puerto))
+            except OSError:
+                pass
+
+    def cerrar(self):
+        self._socket.close()
+
+
+class BusEventos:
+    """
+    Bus de eventos de telemetría con escritura en segundo plano.
+
+    emitir() solo agrega el evento a una cola acotada y retorna de
+    inmediato; un hilo escritor vacía la cola por lotes hacia los
+    sumideros. Si la cola está llena el evento se descarta (y se cuenta en
+    'descartados') en lugar de frenar la corrida. Si un sumidero falla, el
+    error se cuenta en 'errores' (el primero se informa por stderr) y el
+    hilo sigue escribiendo en los demás.
+
+    Eventos emitidos por experiment_runner:
+        - 'inicio_corrida' : algoritmo, ejecucion, semilla.
+        - 'muestra' : evaluaciones, gradientes, mejor ECM y segundos
+          transcurridos, cada 'muestreo_cada' evaluaciones del objetivo o
+          del gradiente.
+        - 'fin_corrida' : ECM final, iteraciones, evaluaciones y tiempo.
+    Todos incluyen 'evento', 'ts' (time.time()) y 'pid'.
+
+    Parámetros
+    ----------
+    sumideros : list
+        SumideroJSONL, SumideroUDP u objetos con escribir(eventos) y
+        cerrar().
+    muestreo_cada : int
+        Evaluaciones (del objetivo más gradientes) entre muestras de una
+        corrida.
+    capacidad : int
+        Tamaño máximo de la cola.
+    """
+
+    def __init__(self, sumideros, muestreo_cada=10_000, capacidad=100_000):
+        self.sumideros = list(sumideros)
+        self.muestreo_cada = muestreo_cada
+        self.capacidad = capacidad
+        self.descartados = 0
+        self.errores = 0
+        self.ultimo_error = None
+        self._pid = os.getpid()
+        self._cola = queue.Queue(maxsize=capacidad)
+        self._hilo = threading.Thread(target=self._escribir, name='telemetria', daemon=True)
+        self._hilo.start()
+
+    def configuracion(self):
+        """Datos para reconstruir el bus en otro proceso (ver desde_configuracion)."""
+        return {'sumideros': [s.configuracion() for s in self.sumideros],
+                'muestreo_cada': self.muestreo_cada, 'capacidad': self.capacidad}
+
+    @classmethod
+    def desde_configuracion(cls, configuracion):
+        sumideros = [clase(**kwargs) for clase, kwargs in configuracion['sumideros']]
+        return cls(sumideros, configuracion['muestreo_cada'], configuracion['capacidad'])
+
+    def emitir(self, evento, **datos):
+        """Encola un evento sin bloquear."""
+        datos.update(evento=evento, ts=time.time(), pid=self._pid)
+        try:
+            self._cola.put_nowait(datos)
+        except queue.Full:
+            self.descartados += 1
+
+    def _escribir(self):
+        while True:
+            eventos = [self._cola.get()]
+            # Se toma todo lo que ya esté en la cola para escribir por lotes
+            while True:
+                try:
+                    eventos.append(self._cola.get_nowait())
+                except queue.Empty:
+                    break
+
+            fin = eventos[-1] is None
+            lote = [e for e in eventos if e is not None]
+            if lote:
+                for sumidero in self.sumideros:
+                    self._escribir_en(sumidero, lote)
+            for _ in eventos:
+                self._cola.task_done()
+            if fin:
+                return
+
+    def _escribir_en(self, sumidero, lote):
+        """Escribe un lote en un sumidero; un error no detiene al hilo escritor."""
+        try:
+            sumidero.escribir(lote)
+        except Exception as error:
+            if not self.errores:
+                print(f"Telemetría: error en {type(sumidero).__name__}: {error!r}", file=sys.stderr)
+            self.errores += 1
+            self.ultimo_error = error
+
+    def vaciar(self, timeout=10.0):
+        """
+        Espera a que se escriban todos los eventos encolados, a lo sumo
+        'timeout' segundos (None = sin límite). Retorna True si la cola
+        quedó vacía.
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+        with self._cola.all_tasks_done:
+            while self._cola.unfinished_tasks:
+                if not self._hilo.is_alive():
+                    return False
+                restante = None if limite is None else limite - time.monotonic()
+                if restante is not None and restante <= 0:
+                    return False
+                # Espera acotada para notar si el hilo escritor terminó
+                self._cola.all_tasks_done.wait(0.1 if restante is None else min(restante, 0.1))
+        return True
+
+    def cerrar(self, timeout=10.0):
+        """
+        Escribe los eventos pendientes (a lo sumo 'timeout' segundos),
+        detiene el hilo y cierra los sumideros.
+        """
+        if not self._hilo.is_alive():
+            return
+        try:
+            self._cola.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._hilo.join(timeout)
+        for sumidero in self.sumideros:
+            try:
+                sumidero.cerrar()
+            except Exception as error:
+                self.errores += 1
+                self.ultimo_error = error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
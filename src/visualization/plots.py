@@ -4,6 +4,18 @@ import numpy as np
 import os
 import ast
 
+from src.utils.resultados import ResultadosColumnares
+from src.utils.historial import COLUMNA_PASOS
+
+# Colores por algoritmo para consistencia en todas las gráficas
+COLORES_ALGORITMOS = {
+    'amplitud': '#1f77b4',
+    'recocido': '#ff7f0e',
+    'genetico': '#2ca02c',
+    'minimos_cuadrados': '#d62728',
+    'descenso_gradiente': '#9467bd',
+}
+
 def parse_historial(hist_str):
     """
     Convierte una cadena de lista limpia (ej: "[0.1, 0.2]") a una lista de Python.
@@ -15,16 +27,37 @@ def parse_historial(hist_str):
     except (ValueError, SyntaxError):
         return []
 
+def _separar_resultados(resultados):
+    """
+    Acepta un DataFrame de resultados o un almacén ResultadosColumnares y
+    retorna (df_escalares, obtener_historial, obtener_pasos), donde
+    obtener_historial(idx) entrega el historial de la fila 'idx' y
+    obtener_pasos(idx) el paso de cada uno de sus valores.
+    """
+    if isinstance(resultados, ResultadosColumnares):
+        return resultados.escalares, resultados.historial, resultados.pasos
+
+    def obtener_historial(idx):
+        return parse_historial(resultados.loc[idx, 'Historial'])
+
+    def obtener_pasos(idx):
+        if COLUMNA_PASOS in resultados.columns and np.ndim(resultados.loc[idx, COLUMNA_PASOS]) > 0:
+            return np.asarray(resultados.loc[idx, COLUMNA_PASOS])
+        return np.arange(len(obtener_historial(idx)))
+
+    return resultados, obtener_historial, obtener_pasos
+
 def plot_convergencia(df_resultados, output_dir):
     """
     Gráfica 1: Evolución del Error (ECM) a través de las iteraciones.
     Muestra la curva de convergencia de la MEJOR ejecución de cada algoritmo.
+    Acepta un DataFrame o un almacén de resultados (cargar_resultados).
     """
+    df_resultados, obtener_historial, obtener_pasos = _separar_resultados(df_resultados)
     plt.figure(figsize=(10, 6))
     
     algoritmos = df_resultados['Algoritmo'].unique()
-    # Diccionario de colores para consistencia en todas las gráficas
-    colores = {'amplitud': '#1f77b4', 'recocido': '#ff7f0e', 'genetico': '#2ca02c'}
+    colores = COLORES_ALGORITMOS
     
     for algo in algoritmos:
         subset = df_resultados[df_resultados['Algoritmo'] == algo]
@@ -32,13 +65,18 @@ def plot_convergencia(df_resultados, output_dir):
 
         # Seleccionar la mejor ejecución (menor error final)
         idx_mejor = subset['ECM_Final'].idxmin()
-        mejor_run = subset.loc[idx_mejor]
         
-        historia = parse_historial(mejor_run['Historial'])
+        historia = obtener_historial(idx_mejor)
+        # Con historial diezmado o de mejoras, cada valor se ubica en su paso
+        pasos = obtener_pasos(idx_mejor)
+
+        # Corridas multicadena: se grafica la mejor cadena en cada paso
+        if np.ndim(historia) == 2:
+            historia = np.min(historia, axis=1)
         
-        if historia:
+        if len(historia) > 0:
             color = colores.get(algo, 'black')
-            plt.plot(historia, label=f"{algo} (Mejor Run)", linewidth=2, color=color, alpha=0.8)
+            plt.plot(pasos, historia, label=f"{algo} (Mejor Run)", linewidth=2, color=color, alpha=0.8)
 
     plt.title('Evolución del Error por Iteración')
     plt.xlabel('Iteraciones')
@@ -56,6 +94,7 @@ def plot_solucion(df_datos, df_resultados, output_dir):
     Gráfica 2: Visualización de la Solución Final.
     Superpone la recta de regresión promedio sobre los datos originales (peces).
     """
+    df_resultados, _, _ = _separar_resultados(df_resultados)
     plt.figure(figsize=(10, 6))
     
     # 1. Puntos de Datos Reales
@@ -65,7 +104,7 @@ def plot_solucion(df_datos, df_resultados, output_dir):
     # 2. Rectas de Regresión (Promedio)
     x_vals = np.linspace(0, 1, 100)
     algoritmos = df_resultados['Algoritmo'].unique()
-    colores = {'amplitud': '#1f77b4', 'recocido': '#ff7f0e', 'genetico': '#2ca02c'}
+    colores = COLORES_ALGORITMOS
     
     for algo in algoritmos:
         subset = df_resultados[df_resultados['Algoritmo'] == algo]
@@ -96,6 +135,7 @@ def plot_boxplot(df_resultados, output_dir):
     Gráfica 3: Boxplot Comparativo.
     Muestra la distribución y estabilidad del ECM final en las 30 ejecuciones.
     """
+    df_resultados, _, _ = _separar_resultados(df_resultados)
     plt.figure(figsize=(10, 6))
     
     algoritmos = df_resultados['Algoritmo'].unique()
@@ -113,7 +153,7 @@ def plot_boxplot(df_resultados, output_dir):
                         medianprops=dict(color="black", linewidth=1.5))
     
     # Colorear las cajas
-    colores = ['#aec7e8', '#ffbb78', '#98df8a'] # Colores pastel para las cajas
+    colores = ['#aec7e8', '#ffbb78', '#98df8a', '#ff9896', '#c5b0d5'] # Colores pastel para las cajas
     for patch, color in zip(bplot['boxes'], colores):
         patch.set_facecolor(color)
 
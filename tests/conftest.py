@@ -0,0 +1,31 @@
+import sys
+import os
+import pytest
+
+# Agregar la raíz del proyecto al path para importar 'src' desde las pruebas
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+
+def pytest_addoption(parser):
+    parser.addoption('--lento', action='store_true',
+                     help="incluye los casos de benchmark lentos (10 millones de filas y escala grande)")
+    parser.addoption('--comparar-linea-base', action='store_true',
+                     help="falla si un caso de benchmark es más lento que la línea base")
+    parser.addoption('--umbral', type=float, default=0.25,
+                     help="caída de rendimiento tolerada frente a la línea base (por defecto 0.25)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', "lento: caso de benchmark lento (se ejecuta con --lento)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--lento'):
+        return
+    omitir = pytest.mark.skip(reason="caso lento: ejecute con --lento")
+    for item in items:
+        if 'lento' in item.keywords:
+            item.add_marker(omitir)
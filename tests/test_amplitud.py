@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from src.algorithms.amplitud import amplitud
+
+
+@pytest.mark.parametrize('modo', ['nodos', 'niveles'])
+@pytest.mark.parametrize('max_iter', [100, 1000])
+def test_corte_en_ajuste_exacto(modo, max_iter):
+    # y = 0.1 + 0.2x está sobre la retícula de paso 0.1: el BFS debe
+    # detenerse al encontrarlo aunque el ECM quede con residuo de redondeo
+    x = np.arange(10.0)
+    y = 0.1 + 0.2 * x
+
+    betas, ecm, iteraciones, historial = amplitud(x, y, {'paso': 0.1, 'max_iter': max_iter, 'modo': modo})
+
+    assert betas == pytest.approx([0.1, 0.2])
+    assert ecm < 1e-20
+    assert iteraciones == 16
+    assert historial[-1] == ecm
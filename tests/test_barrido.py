@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from src.utils.barrido import (barrido, espacio_rejilla, espacio_hipercubo, deduplicar,
+                               mejor_configuracion)
+
+
+def algoritmo_constante(x, y, params):
+    """ECM igual al parámetro 'c': la mejor configuración es la de menor 'c'."""
+    c = params['c']
+    return [c], float(c), 1, np.zeros(1)
+
+
+def _barrido(configuraciones, **kwargs):
+    return barrido(algoritmo_constante, None, None, configuraciones, semilla=0, **kwargs)
+
+
+def test_successive_halving():
+    configuraciones = espacio_rejilla({'c': [3.0, 1.0, 4.0, 2.0]})
+
+    corridas, resumen = _barrido(configuraciones, n_semillas=4, eta=2, corridas_iniciales=1)
+
+    # Ronda 0: 4 × 1, ronda 1: 2 × 1 más, ronda 2: 1 × 2 más
+    assert len(corridas) == 8
+    assert corridas.groupby('Ronda').size().tolist() == [4, 2, 2]
+    assert resumen['Corridas'].tolist() == [4, 2, 1, 1]
+    assert mejor_configuracion(resumen) == {'c': 1.0}
+    # Las corridas de la mejor configuración usan las n_semillas semillas
+    assert corridas[corridas['Configuracion'] == 1]['Semilla'].nunique() == 4
+
+
+def test_sin_halving_corre_todas_las_semillas():
+    configuraciones = espacio_rejilla({'c': [2.0, 1.0], 'd': [0]})
+
+    corridas, resumen = _barrido(configuraciones, n_semillas=3)
+
+    assert len(corridas) == 6
+    assert resumen['Corridas'].tolist() == [3, 3]
+    assert mejor_configuracion(resumen) == {'c': 1.0, 'd': 0}
+    # Todas las configuraciones se comparan con las mismas semillas
+    semillas = corridas.groupby('Configuracion')['Semilla'].apply(sorted)
+    assert semillas.iloc[0] == semillas.iloc[1]
+    assert 'Historial' not in corridas.columns
+
+
+def test_configuraciones_repetidas_se_corren_una_vez():
+    assert deduplicar([{'c': 1.0}, {'c': 2.0}, {'c': 1.0}]) == [{'c': 1.0}, {'c': 2.0}]
+
+    corridas, _ = _barrido([{'c': 1.0}, {'c': 1.0}], n_semillas=2)
+    assert len(corridas) == 2
+
+
+def test_hipercubo_usa_cada_estrato_una_vez():
+    configuraciones = espacio_hipercubo({'a': (0.0, 1.0)}, 10, rng=0)
+    estratos = sorted(int(c['a'] * 10) for c in configuraciones)
+    assert estratos == list(range(10))
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'configuraciones': []},
+    {'n_semillas': 0},
+    {'eta': 1},
+    {'eta': 2, 'corridas_iniciales': 0},
+])
+def test_validacion(kwargs):
+    argumentos = {'configuraciones': [{'c': 1.0}], **kwargs}
+    with pytest.raises(ValueError):
+        _barrido(argumentos.pop('configuraciones'), **argumentos)
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+from src.utils.benchmark import (RUTA_LINEA_BASE, calibrar, cargar_linea_base, casos_benchmark,
+                                 comparar, medir)
+
+# Los casos rápidos siempre; los que solo existen en el benchmark completo
+# (10 millones de filas y escala grande de los optimizadores) con --lento
+RAPIDOS = {nombre for nombre, _, _ in casos_benchmark(rapido=True)}
+NOMBRES = [pytest.param(nombre, marks=[] if nombre in RAPIDOS else pytest.mark.lento)
+           for nombre, _, _ in casos_benchmark(rapido=False)]
+
+
+@pytest.fixture(scope='session')
+def casos(request):
+    completos = request.config.getoption('--lento')
+    return {nombre: (unidad, funcion) for nombre, unidad, funcion in casos_benchmark(not completos)}
+
+
+@pytest.fixture(scope='session')
+def calibracion():
+    return calibrar()
+
+
+@pytest.fixture(scope='session')
+def linea_base():
+    if not os.path.exists(RUTA_LINEA_BASE):
+        return {}
+    return cargar_linea_base(RUTA_LINEA_BASE)
+
+
+def test_linea_base_cubre_todos_los_casos(linea_base):
+    assert set(linea_base) == {nombre for nombre, _, _ in casos_benchmark(rapido=False)}
+
+
+@pytest.mark.parametrize('nombre', NOMBRES)
+def test_benchmark(nombre, casos, calibracion, linea_base, request):
+    unidad, funcion = casos[nombre]
+    rendimiento = medir(funcion, repeticiones=3)
+    resultado = {'unidad': unidad, 'rendimiento': rendimiento, 'relativo': rendimiento / calibracion}
+    request.node.user_properties.append(('rendimiento', rendimiento))
+    assert rendimiento > 0
+
+    # La comparación depende del equipo y de su carga: solo si se pide
+    if request.config.getoption('--comparar-linea-base'):
+        regresiones = comparar({nombre: resultado}, linea_base, request.config.getoption('--umbral'))
+        assert not regresiones, f"{nombre}: {regresiones[0][3]:+.1%} frente a la línea base"
@@ -0,0 +1,83 @@
+import numpy as np
+
+from src.utils.decorators import experiment_runner
+from src.utils.bitacora import BitacoraCorridas
+
+LLAMADAS = 0
+
+
+def algoritmo_contado(x, y, params):
+    global LLAMADAS
+    LLAMADAS += 1
+    rng = np.random.default_rng(params['semilla'])
+    betas = rng.normal(size=2)
+    return betas, float(np.mean((y - betas[0] - betas[1] * x) ** 2)), 3, rng.random(4)
+
+
+def _correr(ruta, semilla=7, n_runs=3, params=None):
+    x = np.linspace(0, 1, 20)
+    y = 2 * x + 1
+    corredor = experiment_runner(n_runs=n_runs, semilla=semilla, bitacora=str(ruta))
+    return corredor(algoritmo_contado)(x, y, params or {'tasa': 0.1})
+
+
+def test_reanuda_corridas_registradas(tmp_path):
+    global LLAMADAS
+    ruta = tmp_path / 'bitacora.jsonl'
+    LLAMADAS = 0
+    completo = _correr(ruta)
+    assert LLAMADAS == 3
+    assert len(BitacoraCorridas(str(ruta)).cargar()) == 3
+
+    # Se simula una campaña interrumpida tras la segunda corrida
+    lineas = ruta.read_text(encoding='utf-8').splitlines(keepends=True)
+    ruta.write_text(''.join(lineas[:2]), encoding='utf-8')
+
+    LLAMADAS = 0
+    reanudado = _correr(ruta)
+
+    assert LLAMADAS == 1
+    assert reanudado['ECM_Final'].tolist() == completo['ECM_Final'].tolist()
+    assert reanudado['Semilla'].tolist() == completo['Semilla'].tolist()
+    for a, b in zip(reanudado['Historial'], completo['Historial']):
+        np.testing.assert_array_equal(a, b)
+    assert len(BitacoraCorridas(str(ruta)).cargar()) == 3
+
+
+def test_linea_incompleta_se_ignora(tmp_path):
+    global LLAMADAS
+    ruta = tmp_path / 'bitacora.jsonl'
+    completo = _correr(ruta)
+    contenido = ruta.read_text(encoding='utf-8')
+    ruta.write_text(contenido[:-20], encoding='utf-8')
+
+    LLAMADAS = 0
+    reanudado = _correr(ruta)
+
+    assert LLAMADAS == 1
+    assert reanudado['ECM_Final'].tolist() == completo['ECM_Final'].tolist()
+    assert len(BitacoraCorridas(str(ruta)).cargar()) == 3
+
+
+def test_otros_parametros_no_reanudan(tmp_path):
+    global LLAMADAS
+    ruta = tmp_path / 'bitacora.jsonl'
+    _correr(ruta)
+
+    LLAMADAS = 0
+    _correr(ruta, params={'tasa': 0.2})
+    assert LLAMADAS == 3
+
+    LLAMADAS = 0
+    _correr(ruta, semilla=8)
+    assert LLAMADAS == 3
+
+
+def test_sin_semilla_no_usa_bitacora(tmp_path):
+    global LLAMADAS
+    ruta = tmp_path / 'bitacora.jsonl'
+    LLAMADAS = 0
+    _correr(ruta, semilla=None)
+
+    assert LLAMADAS == 3
+    assert not ruta.exists()
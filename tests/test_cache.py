@@ -0,0 +1,81 @@
+import os
+import numpy as np
+
+from src.utils.decorators import experiment_runner
+from src.utils.cache import CacheResultados, parametros_cacheables
+
+LLAMADAS = 0
+
+
+def algoritmo_contado(x, y, params):
+    global LLAMADAS
+    LLAMADAS += 1
+    rng = np.random.default_rng(params['semilla'])
+    betas = rng.normal(size=2)
+    return betas, float(np.mean((y - betas[0] - betas[1] * x) ** 2)), 3, rng.random(4)
+
+
+def _correr(almacen, params, n_runs=3):
+    x = np.linspace(0, 1, 20)
+    y = 2 * x + 1
+    return experiment_runner(n_runs=n_runs, semilla=11, cache=almacen)(algoritmo_contado)(x, y, params)
+
+
+def test_fallo_y_luego_acierto(tmp_path):
+    global LLAMADAS
+    almacen = CacheResultados(str(tmp_path))
+
+    LLAMADAS = 0
+    primero = _correr(almacen, {'tasa': 0.1})
+    assert LLAMADAS == 3
+    assert (almacen.fallos, almacen.aciertos) == (3, 0)
+
+    LLAMADAS = 0
+    segundo = _correr(almacen, {'tasa': 0.1})
+    assert LLAMADAS == 0
+    assert (almacen.fallos, almacen.aciertos) == (3, 3)
+    assert segundo['ECM_Final'].tolist() == primero['ECM_Final'].tolist()
+    for a, b in zip(segundo['Historial'], primero['Historial']):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_otros_parametros_no_aciertan(tmp_path):
+    global LLAMADAS
+    almacen = CacheResultados(str(tmp_path))
+    _correr(almacen, {'tasa': 0.1})
+
+    LLAMADAS = 0
+    _correr(almacen, {'tasa': 0.2})
+    assert LLAMADAS == 3
+    assert almacen.aciertos == 0
+
+
+def test_parametros_con_generador_no_se_guardan(tmp_path):
+    global LLAMADAS
+    almacen = CacheResultados(str(tmp_path))
+    params = {'tasa': 0.1, 'rng': np.random.default_rng(0)}
+    assert not parametros_cacheables(params)
+
+    LLAMADAS = 0
+    _correr(almacen, params)
+    _correr(almacen, params)
+    assert LLAMADAS == 6
+    assert os.listdir(tmp_path) == []
+
+
+def test_desalojo_lru(tmp_path):
+    almacen = CacheResultados(str(tmp_path), max_bytes=10**6)
+    registro = {'ECM_Final': 1.0, 'Historial': np.zeros(5)}
+    for clave in ('a', 'b', 'c'):
+        almacen.guardar(clave, registro)
+        # Fechas de modificación distintas aunque el reloj sea grueso
+        os.utime(tmp_path / f"{clave}.json", ns=(ord(clave), ord(clave)))
+    tam = os.path.getsize(tmp_path / 'a.json')
+    almacen.max_bytes = 2 * tam
+    os.utime(tmp_path / 'a.json', ns=(10**9, 10**9))
+
+    almacen.desalojar()
+
+    assert sorted(os.listdir(tmp_path)) == ['a.json', 'c.json']
+    assert almacen.obtener('b') is None
+    np.testing.assert_array_equal(almacen.obtener('a')['Historial'], np.zeros(5))
@@ -0,0 +1,142 @@
+import math
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.estadisticas import (MomentosWelford, BosquejoCuantiles, ResumenEnLinea,
+                                    mann_whitney, pruebas_pareadas, intervalo_bootstrap)
+
+
+def test_momentos_combinados_iguales_al_total():
+    valores = np.random.default_rng(0).normal(3.0, 2.0, 1_000)
+    total = MomentosWelford()
+    total.actualizar(valores)
+    a, b = MomentosWelford(), MomentosWelford()
+    for valor in valores[:10]:
+        a.actualizar(valor)
+    b.actualizar(valores[10:])
+
+    a.combinar(b)
+
+    assert a.n == total.n == 1_000
+    assert a.media == pytest.approx(np.mean(valores), rel=1e-12)
+    assert a.desviacion == pytest.approx(pd.Series(valores).std(), rel=1e-10)
+    assert total.varianza == pytest.approx(np.var(valores, ddof=1), rel=1e-10)
+
+
+def test_momentos_ignoran_nan():
+    momentos = MomentosWelford()
+    momentos.actualizar([1.0, np.nan, 3.0])
+    assert (momentos.n, momentos.media) == (2, 2.0)
+    assert math.isnan(MomentosWelford().varianza)
+
+
+def test_cuantiles_exactos_sin_compactar():
+    valores = np.random.default_rng(1).random(100)
+    bosquejo = BosquejoCuantiles(k=128)
+    bosquejo.actualizar(valores)
+
+    for q in (0.0, 0.1, 0.5, 0.9, 1.0):
+        assert bosquejo.cuantil(q) == pd.Series(valores).quantile(q)
+    assert math.isnan(BosquejoCuantiles().mediana())
+
+
+def test_cuantiles_aproximados_al_compactar():
+    valores = np.random.default_rng(2).random(20_000)
+    bosquejo = BosquejoCuantiles(k=64)
+    for bloque in np.array_split(valores, 50):
+        bosquejo.actualizar(bloque)
+
+    assert bosquejo.n == valores.size
+    # Memoria acotada: muchos menos elementos que valores
+    assert sum(len(nivel) for nivel in bosquejo.niveles) < 1_000
+    for q in (0.1, 0.5, 0.9):
+        assert bosquejo.cuantil(q) == pytest.approx(q, abs=0.05)
+
+
+def _registros(algoritmo, ecms):
+    return [{'Algoritmo': algoritmo, 'Ejecucion': i + 1, 'ECM_Final': ecm, 'Iteraciones': 10 * i,
+             'Evaluaciones_Meta_1': np.nan if ecm > 1 else i}
+            for i, ecm in enumerate(ecms)]
+
+
+def test_resumen_combinado_igual_al_total():
+    ecms = np.random.default_rng(3).random(40) * 2
+    registros = _registros('A', ecms) + _registros('B', ecms[::-1] + 1)
+
+    total = ResumenEnLinea()
+    total.agregar_df(pd.DataFrame(registros))
+    parte_1, parte_2 = ResumenEnLinea(), ResumenEnLinea()
+    for registro in registros[:25]:
+        parte_1.agregar(registro)
+    for registro in registros[25:]:
+        parte_2.agregar(registro)
+
+    combinada = parte_1.combinar(parte_2).tabla()
+
+    pd.testing.assert_frame_equal(combinada, total.tabla(), rtol=1e-12)
+    df = pd.DataFrame(registros)
+    esperado = df.groupby('Algoritmo')['ECM_Final'].agg(['mean', 'median', 'std'])
+    np.testing.assert_allclose(combinada['ECM_Final Promedio'], esperado['mean'], rtol=1e-12)
+    np.testing.assert_allclose(combinada['ECM_Final Mediana'], esperado['median'], rtol=1e-12)
+    np.testing.assert_allclose(combinada['ECM_Final Desv.'], esperado['std'], rtol=1e-10)
+    assert combinada.loc['A', 'Exito_Meta_1 Promedio'] == pytest.approx(np.mean(ecms <= 1))
+
+
+def test_resumen_brecha():
+    resumen = ResumenEnLinea()
+    for registro in _registros('A', [1.0, 2.0, 3.0]):
+        resumen.agregar(registro)
+    tabla = resumen.tabla(ecm_optimo=0.5)
+    assert tabla.loc['A', 'Brecha Promedio'] == pytest.approx(1.5)
+    assert tabla.loc['A', 'Brecha Mediana'] == pytest.approx(1.5)
+
+
+def test_mann_whitney_separacion_completa():
+    u, p_valor, a12 = mann_whitney([1, 2, 3], [4, 5, 6])
+
+    assert (u, a12) == (0.0, 0.0)
+    assert p_valor == pytest.approx(math.erfc((4.0 / math.sqrt(5.25)) / math.sqrt(2)))
+    assert p_valor == pytest.approx(0.0809, abs=1e-4)
+
+    u, p_inverso, a12 = mann_whitney([4, 5, 6], [1, 2, 3])
+    assert (u, a12, p_inverso) == (9.0, 1.0, p_valor)
+
+
+def test_mann_whitney_empates():
+    u, p_valor, a12 = mann_whitney([1.0, 1.0], [1.0, 1.0])
+    assert (u, p_valor, a12) == (2.0, 1.0, 0.5)
+    assert all(math.isnan(v) for v in mann_whitney([], [1.0]))
+
+
+def test_pruebas_pareadas_holm():
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame({
+        'Algoritmo': np.repeat(['A', 'B', 'C', 'D'], 15),
+        'ECM_Final': np.concatenate([rng.normal(0.0, 1, 15), rng.normal(0.3, 1, 15),
+                                     rng.normal(1.5, 1, 15), rng.normal(3.0, 1, 15)]),
+    })
+
+    pruebas = pruebas_pareadas(df, alfa=0.05)
+
+    assert len(pruebas) == 6
+    # Holm paso a paso: el i-ésimo p más chico por (m - i), sin bajar respecto del anterior
+    p = pruebas['p_valor'].tolist()
+    esperados = [0.0] * 6
+    maximo = 0.0
+    for i, j in enumerate(sorted(range(6), key=lambda j: p[j])):
+        maximo = max(maximo, min(1.0, p[j] * (6 - i)))
+        esperados[j] = maximo
+    np.testing.assert_allclose(pruebas['p_Holm'], esperados)
+    assert (pruebas['p_Holm'] >= pruebas['p_valor']).all()
+    assert (pruebas['Significativa'] == (pruebas['p_Holm'] < 0.05)).all()
+    fila = pruebas[(pruebas['Algoritmo_A'] == 'A') & (pruebas['Algoritmo_B'] == 'D')].iloc[0]
+    assert fila['Significativa'] and fila['A12'] < 0.5
+
+
+def test_intervalo_bootstrap_contiene_la_media():
+    valores = np.random.default_rng(5).normal(10.0, 1.0, 200)
+    estimado, inferior, superior = intervalo_bootstrap(valores, rng=0)
+    assert estimado == pytest.approx(np.mean(valores))
+    assert inferior < estimado < superior
+    assert intervalo_bootstrap(valores, rng=0) == (estimado, inferior, superior)
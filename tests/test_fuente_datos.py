@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.objetivo import ObjetivoECM
+from src.preprocessing.fuente_datos import (
+    leer_bloques_csv, objetivo_desde_csv, objetivo_desde_binario)
+
+
+@pytest.fixture
+def datos():
+    rng = np.random.default_rng(0)
+    x = rng.normal(50.0, 10.0, (1_003, 2))
+    y = 3.0 + x @ np.array([0.5, -1.2]) + rng.normal(0, 2.0, 1_003)
+    return x, y
+
+
+def _comparar(objetivo, referencia):
+    assert objetivo.n == referencia.n
+    np.testing.assert_allclose(objetivo.media_x, referencia.media_x, rtol=1e-12)
+    assert objetivo.media_y == pytest.approx(referencia.media_y, rel=1e-12)
+    np.testing.assert_allclose(objetivo.sxx, referencia.sxx, rtol=1e-9)
+    np.testing.assert_allclose(objetivo.sxy, referencia.sxy, rtol=1e-9)
+    assert objetivo.ecm_minimo == pytest.approx(referencia.ecm_minimo, rel=1e-9)
+
+    betas = np.random.default_rng(1).uniform(-2, 2, (20, referencia.dimension + 1))
+    np.testing.assert_allclose(objetivo.evaluar_matriz(betas), referencia.evaluar_matriz(betas), rtol=1e-9)
+
+
+def test_desde_bloques_equivale_a_desde_datos(datos):
+    x, y = datos
+    bloques = [(x[i:i + 97], y[i:i + 97]) for i in range(0, len(y), 97)]
+
+    _comparar(ObjetivoECM.desde_bloques(bloques), ObjetivoECM.desde_datos(x, y))
+
+
+def test_combinar_es_conmutativo(datos):
+    x, y = datos
+    a = ObjetivoECM.desde_datos(x[:10], y[:10])
+    b = ObjetivoECM.desde_datos(x[10:], y[10:])
+
+    _comparar(a.combinar(b), ObjetivoECM.desde_datos(x, y))
+    _comparar(b.combinar(a), ObjetivoECM.desde_datos(x, y))
+
+
+def test_objetivo_desde_csv_por_bloques(datos, tmp_path):
+    x, y = datos
+    ruta = tmp_path / 'datos.csv'
+    pd.DataFrame({'x1': x[:, 0], 'x2': x[:, 1], 'y': y}).to_csv(ruta, index=False)
+
+    assert sum(len(yb) for _, yb in leer_bloques_csv(ruta, 'x1', 'y', tam_bloque=100)) == len(y)
+    _comparar(objetivo_desde_csv(ruta, ['x1', 'x2'], 'y', tam_bloque=100), ObjetivoECM.desde_datos(x, y))
+    _comparar(objetivo_desde_csv(ruta, 'x1', 'y', tam_bloque=100), ObjetivoECM.desde_datos(x[:, 0], y))
+
+
+def test_objetivo_desde_binario_por_bloques(datos, tmp_path):
+    x, y = datos
+    np.save(tmp_path / 'x.npy', x)
+    np.save(tmp_path / 'y.npy', y)
+
+    objetivo = objetivo_desde_binario(tmp_path / 'x.npy', tmp_path / 'y.npy', tam_bloque=128)
+
+    _comparar(objetivo, ObjetivoECM.desde_datos(x, y))
+
+
+def test_binario_con_longitudes_distintas(tmp_path):
+    np.save(tmp_path / 'x.npy', np.zeros(5))
+    np.save(tmp_path / 'y.npy', np.zeros(4))
+    with pytest.raises(ValueError):
+        objetivo_desde_binario(tmp_path / 'x.npy', tmp_path / 'y.npy')
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from src.utils.objetivo import ObjetivoECM, ContadorEvaluaciones
+from src.algorithms.genetico import (genetico, seleccion_torneo_vectorizada,
+                                     cruza_aritmetica_vectorizada, mutacion_uniforme_vectorizada,
+                                     migrar, origenes_migracion, cerrar_ejecutor_islas)
+
+PARAMS = {'tam_poblacion': 30, 'generaciones': 40, 'prob_mutacion': 0.2, 'rango_mutacion': 0.5,
+          'rango_inicio': (-5, 5), 'semilla': 1}
+
+
+@pytest.fixture
+def objetivo():
+    rng = np.random.default_rng(0)
+    x = rng.random((80, 2))
+    return ObjetivoECM.desde_datos(x, 1.0 + x @ np.array([2.0, -1.0]) + rng.normal(0, 0.05, 80))
+
+
+def test_arreglos_reproducible(objetivo):
+    params = {**PARAMS, 'modo': 'arreglos'}
+    betas, ecm, gens, hist = genetico(objetivo, None, dict(params))
+    otra = genetico(objetivo, None, dict(params))
+
+    assert (betas, ecm, gens) == otra[:3]
+    np.testing.assert_array_equal(hist, otra[3])
+    assert len(betas) == 3
+    assert ecm == pytest.approx(objetivo.evaluar_vector(np.array(betas)), rel=1e-12)
+    assert genetico(objetivo, None, {**params, 'semilla': 2})[1] != ecm
+
+
+def test_arreglos_elitismo_no_empeora(objetivo):
+    _, ecm, gens, hist = genetico(objetivo, None, {**PARAMS, 'modo': 'arreglos', 'elitismo': 2})
+
+    assert gens == PARAMS['generaciones'] - 1
+    assert hist.shape == (PARAMS['generaciones'],)
+    assert np.all(np.diff(hist) <= 0)
+    assert ecm <= hist[-1]
+
+
+def test_arreglos_cuenta_evaluaciones(objetivo):
+    contador = ContadorEvaluaciones()
+    genetico(objetivo, None, {**PARAMS, 'modo': 'arreglos', 'elitismo': 1, 'contador': contador})
+
+    # Población inicial más los hijos (todos menos el élite) de cada generación
+    tam, gens = PARAMS['tam_poblacion'], PARAMS['generaciones']
+    assert contador.evaluaciones == tam + gens * (tam - 1)
+
+
+def test_operadores_vectorizados():
+    rng = np.random.default_rng(0)
+    fitness = np.array([5.0, 1.0, 3.0, 2.0])
+
+    # Con torneos de toda la población (k grande) casi siempre gana el mejor
+    ganadores = seleccion_torneo_vectorizada(fitness, 200, k=20, rng=rng)
+    assert ganadores.shape == (200,)
+    assert np.mean(ganadores == 1) > 0.95
+
+    padres1, padres2 = rng.random((10, 3)), rng.random((10, 3))
+    hijos1, hijos2 = cruza_aritmetica_vectorizada(padres1, padres2, rng=rng)
+    np.testing.assert_allclose(hijos1 + hijos2, padres1 + padres2)
+
+    genes = np.zeros((10, 3))
+    assert mutacion_uniforme_vectorizada(genes, 0.0, 1.0, rng=rng) is genes
+    assert not genes.any()
+    mutacion_uniforme_vectorizada(genes, 1.0, 0.5, rng=rng)
+    assert np.all(np.abs(genes) <= 0.5) and genes.all()
+
+
+ISLAS = {**PARAMS, 'islas': 3, 'generaciones': 25, 'migracion_cada': 5, 'migrantes': 2}
+
+
+def test_islas_no_dependen_de_n_jobs(objetivo):
+    try:
+        en_serie = genetico(objetivo, None, {**ISLAS, 'n_jobs': 1})
+        en_paralelo = genetico(objetivo, None, {**ISLAS, 'n_jobs': 2})
+    finally:
+        cerrar_ejecutor_islas()
+
+    assert en_serie[:3] == en_paralelo[:3]
+    np.testing.assert_array_equal(en_serie[3], en_paralelo[3])
+
+
+@pytest.mark.parametrize('topologia', ['anillo', 'completa'])
+def test_islas_mejor_visto(objetivo, topologia):
+    contador = ContadorEvaluaciones()
+    betas, ecm, gens, hist = genetico(objetivo, None, {**ISLAS, 'topologia': topologia,
+                                                       'contador': contador})
+
+    assert hist.shape == (ISLAS['generaciones'], ISLAS['islas'])
+    assert gens == ISLAS['generaciones'] - 1
+    # El resultado es el mejor individuo de toda la corrida
+    assert ecm <= hist.min()
+    assert ecm == pytest.approx(objetivo.evaluar_vector(np.array(betas)), rel=1e-12)
+    assert contador.mejor == pytest.approx(ecm)
+    assert contador.evaluaciones > ISLAS['islas'] * ISLAS['tam_poblacion']
+
+
+def test_migracion_reemplaza_a_los_peores():
+    rng = np.random.default_rng(0)
+    estados = [(np.full((4, 2), float(i)), np.array([4.0, 1.0, 3.0, 2.0]) + 10 * i, rng, 0.1)
+               for i in range(3)]
+
+    nuevos = migrar(estados, origenes_migracion(3, 'anillo'), 1)
+
+    # La isla 1 recibe el mejor de la isla 0 en lugar de su peor individuo
+    genes, fitness, *_ = nuevos[1]
+    np.testing.assert_array_equal(fitness, [1.0, 11.0, 13.0, 12.0])
+    np.testing.assert_array_equal(genes[0], [0.0, 0.0])
+    np.testing.assert_array_equal(estados[1][1], [14.0, 11.0, 13.0, 12.0])
+    assert origenes_migracion(3, 'completa') == [[1, 2], [0, 2], [0, 1]]
+    with pytest.raises(ValueError):
+        origenes_migracion(3, 'estrella')
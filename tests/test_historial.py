@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from src.utils.decorators import experiment_runner
+from src.utils.historial import RegistroHistorial, MODOS_HISTORIAL, COLUMNA_PASOS, crear_registro
+
+VALORES = np.array([5.0, 6.0, 4.0, 4.0, 3.0, 7.0, 1.0, 2.0])
+
+
+def _registrar(registro, valores):
+    for valor in valores:
+        registro.registrar(valor)
+    return registro
+
+
+@pytest.mark.parametrize('modo, cada, valores, pasos', [
+    ('completo', 1, VALORES, np.arange(8)),
+    ('diezmado', 3, [5.0, 4.0, 1.0], [0, 3, 6]),
+    ('mejoras', 1, [5.0, 4.0, 3.0, 1.0], [0, 2, 4, 6]),
+    ('apagado', 1, [], []),
+])
+def test_modos(modo, cada, valores, pasos):
+    registro = _registrar(RegistroHistorial(modo, cada=cada, capacidad=2), VALORES)
+
+    np.testing.assert_array_equal(registro.valores(), valores)
+    np.testing.assert_array_equal(registro.pasos(), pasos)
+    assert len(registro) == len(valores)
+
+
+@pytest.mark.parametrize('modo', MODOS_HISTORIAL)
+@pytest.mark.parametrize('ancho', [None, 3])
+def test_registrar_lote_equivale_a_registrar(modo, ancho):
+    rng = np.random.default_rng(0)
+    valores = rng.random(200) if ancho is None else rng.random((200, ancho))
+    por_paso = _registrar(RegistroHistorial(modo, cada=7, capacidad=4, ancho=ancho), valores)
+
+    por_lotes = RegistroHistorial(modo, cada=7, capacidad=4, ancho=ancho)
+    for inicio in range(0, 200, 33):
+        por_lotes.registrar_lote(valores[inicio:inicio + 33])
+
+    np.testing.assert_array_equal(por_lotes.valores(), por_paso.valores())
+    np.testing.assert_array_equal(por_lotes.pasos(), por_paso.pasos())
+
+
+def test_reportar_pasos():
+    detalles = {}
+    _registrar(RegistroHistorial('mejoras'), VALORES).reportar({'detalles': detalles})
+    np.testing.assert_array_equal(detalles[COLUMNA_PASOS], [0, 2, 4, 6])
+
+    # En modo completo los pasos son implícitos, y sin 'detalles' no se informa nada
+    detalles = {}
+    _registrar(RegistroHistorial('completo'), VALORES).reportar({'detalles': detalles})
+    assert detalles == {}
+    _registrar(RegistroHistorial('mejoras'), VALORES).reportar({})
+
+
+def test_validacion():
+    with pytest.raises(ValueError):
+        RegistroHistorial('todo')
+    with pytest.raises(ValueError):
+        RegistroHistorial('diezmado', cada=0)
+
+
+def algoritmo_con_historial(x, y, params):
+    registro = crear_registro(params)
+    registro.registrar_lote(VALORES)
+    registro.reportar(params)
+    return [0.0, 0.0], 1.0, len(VALORES), registro.valores()
+
+
+def test_pasos_en_el_registro_de_la_corrida():
+    corredor = experiment_runner(n_runs=2, semilla=0)(algoritmo_con_historial)
+
+    resultados = corredor(None, None, {'historial': 'diezmado', 'historial_cada': 4})
+
+    np.testing.assert_array_equal(resultados['Historial'].iloc[0], [5.0, 3.0])
+    np.testing.assert_array_equal(resultados[COLUMNA_PASOS].iloc[0], [0, 4])
+    assert COLUMNA_PASOS not in corredor(None, None, {}).columns
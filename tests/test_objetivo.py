@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from src.utils.common import calcular_ecm
+from src.utils.objetivo import ObjetivoECM, ContadorEvaluaciones, crear_objetivo
+
+
+def _datos(n=200, dimension=1, semilla=0):
+    rng = np.random.default_rng(semilla)
+    x = rng.random((n, dimension)) if dimension > 1 else rng.random(n)
+    pendientes = np.linspace(1.0, 2.0, dimension)
+    y = 0.5 + (x @ pendientes if dimension > 1 else 1.5 * x) + rng.normal(0, 0.1, n)
+    return x, y
+
+
+def test_evaluar_coincide_con_calcular_ecm():
+    x, y = _datos()
+    objetivo = ObjetivoECM.desde_datos(x, y)
+    for b0, b1 in [(0.0, 0.0), (0.5, 1.5), (-2.0, 3.0)]:
+        assert objetivo.evaluar(b0, b1) == pytest.approx(calcular_ecm(b0, b1, x, y), rel=1e-10)
+
+
+def test_evaluar_lote_coincide_con_calcular_ecm():
+    x, y = _datos()
+    objetivo = ObjetivoECM.desde_datos(x, y)
+    candidatos = np.random.default_rng(1).uniform(-3, 3, (2, 50))
+
+    valores = objetivo.evaluar_lote(candidatos[0], candidatos[1])
+
+    esperados = [calcular_ecm(b0, b1, x, y) for b0, b1 in candidatos.T]
+    np.testing.assert_allclose(valores, esperados, rtol=1e-10)
+
+
+@pytest.mark.parametrize('dimension', [1, 5])
+def test_evaluar_matriz_coincide_con_calcular_ecm(dimension):
+    x, y = _datos(dimension=dimension)
+    objetivo = ObjetivoECM.desde_datos(x, y)
+    betas = np.random.default_rng(2).uniform(-3, 3, (40, dimension + 1))
+
+    valores = objetivo.evaluar_matriz(betas)
+
+    esperados = [calcular_ecm(b[0], b[1] if dimension == 1 else b[1:], x, y) for b in betas]
+    np.testing.assert_allclose(valores, esperados, rtol=1e-10)
+    np.testing.assert_allclose([objetivo.evaluar_vector(b) for b in betas], esperados, rtol=1e-10)
+
+
+def test_minimo_en_los_coeficientes_optimos():
+    x, y = _datos(dimension=3)
+    objetivo = ObjetivoECM.desde_datos(x, y)
+    betas, *_ = np.linalg.lstsq(np.column_stack([np.ones(len(y)), x]), y, rcond=None)
+
+    np.testing.assert_allclose(objetivo.betas_optimos, betas, rtol=1e-8)
+    assert objetivo.ecm_minimo == pytest.approx(calcular_ecm(betas[0], betas[1:], x, y), rel=1e-10)
+
+
+def test_contador_registra_evaluaciones_y_metas():
+    x, y = _datos()
+    contador = ContadorEvaluaciones({'facil': 0.05, 'imposible': 0.0})
+    objetivo = crear_objetivo(x, y, {'contador': contador})
+
+    objetivo.evaluar(0.0, 0.0)
+    objetivo.evaluar_lote(np.array([0.5, 100.0]), np.array([1.5, 100.0]))
+
+    assert contador.evaluaciones == 3
+    # El óptimo (segunda evaluación) alcanza la meta fácil; la imposible no
+    assert contador.evaluaciones_meta == {'facil': 2, 'imposible': None}
+    assert contador.mejor == pytest.approx(objetivo.evaluar(0.5, 1.5))
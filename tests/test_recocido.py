@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from src.utils.objetivo import ObjetivoECM
+from src.algorithms.recocido import recocido, intercambiar_replicas
+
+PARAMS = {'t_inicial': 100.0, 't_final': 0.01, 'alpha': 0.9, 'paso': 0.2,
+          'inicio_b0': 0.0, 'inicio_b1': 0.0, 'semilla': 3}
+
+
+@pytest.fixture
+def objetivo():
+    rng = np.random.default_rng(0)
+    x = rng.random((100, 2))
+    return ObjetivoECM.desde_datos(x, 1.0 + x @ np.array([2.0, -1.0]) + rng.normal(0, 0.05, 100))
+
+
+def test_multicadena_historial_por_cadena(objetivo):
+    betas, ecm, iters, hist = recocido(objetivo, None, {**PARAMS, 'num_cadenas': 4})
+    _, _, iters_una, _ = recocido(objetivo, None, PARAMS)
+
+    # Mismo número de pasos que una sola cadena; una fila por paso más la inicial
+    assert iters == iters_una
+    assert hist.shape == (iters + 1, 4)
+    assert ecm == pytest.approx(objetivo.evaluar_vector(np.array(betas)))
+    assert ecm <= hist.min() + 1e-12
+
+
+def test_multicadena_reproducible(objetivo):
+    params = {**PARAMS, 'num_cadenas': 3, 'intervalo_intercambio': 2}
+    a = recocido(objetivo, None, dict(params))
+    b = recocido(objetivo, None, dict(params))
+    c = recocido(objetivo, None, {**params, 'semilla': 4})
+
+    assert a[:3] == b[:3]
+    np.testing.assert_array_equal(a[3], b[3])
+    assert a[1] != c[1]
+
+
+def test_multicadena_max_iter(objetivo):
+    _, _, iters, hist = recocido(objetivo, None, {**PARAMS, 'num_cadenas': 2, 'max_iter': 10})
+    assert iters == 10
+    assert hist.shape == (11, 2)
+
+
+def test_multicadena_historial_mejoras(objetivo):
+    detalles = {}
+    _, _, iters, hist = recocido(objetivo, None, {**PARAMS, 'num_cadenas': 2, 'historial': 'mejoras',
+                                                   'detalles': detalles})
+    pasos = detalles['Historial_Pasos']
+    assert hist.shape == (len(pasos), 2)
+    assert pasos[0] == 0 and np.all(np.diff(pasos) > 0) and pasos[-1] <= iters
+    assert np.all(np.diff(hist.min(axis=1)) < 0)
+
+
+@pytest.mark.parametrize('opciones', [
+    {'enfriamiento': 'logaritmico', 'max_iter': 10},
+    {'adaptar_paso': True},
+    {'max_estancamiento': 5},
+    {'intervalo_intercambio': 0},
+])
+def test_multicadena_opciones_no_admitidas(objetivo, opciones):
+    with pytest.raises(ValueError):
+        recocido(objetivo, None, {**PARAMS, 'num_cadenas': 2, **opciones})
+
+
+def test_intercambio_conserva_los_estados():
+    estados = np.arange(10.0).reshape(5, 2)
+    ecms = np.array([5.0, 4.0, 3.0, 2.0, 1.0])
+    temperaturas = np.geomspace(1.0, 10.0, 5)
+
+    # Con la cadena fría en peor estado el intercambio siempre se acepta (u < 1)
+    aceptados = intercambiar_replicas(estados, ecms, temperaturas, 0, np.full(5, 0.999))
+
+    assert aceptados == 2
+    np.testing.assert_array_equal(ecms, [4.0, 5.0, 2.0, 3.0, 1.0])
+    np.testing.assert_array_equal(estados[:, 0], [2.0, 0.0, 6.0, 4.0, 8.0])
+    assert intercambiar_replicas(estados[:1], ecms[:1], temperaturas[:1], 0, np.zeros(1)) == 0
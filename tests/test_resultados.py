@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.historial import COLUMNA_PASOS
+from src.utils.resultados import guardar_resultados, cargar_resultados
+
+
+@pytest.fixture
+def df_corridas():
+    return pd.DataFrame({
+        'Algoritmo': ['amplitud', 'recocido', 'recocido'],
+        'Ejecucion': [1, 1, 2],
+        'ECM_Final': [0.5, 0.25, 0.125],
+        'Motivo': ['max_iter', None, 'estancamiento'],
+        'Historial': [np.array([3.0, 2.0, 1.0]),
+                      np.arange(8.0).reshape(4, 2),
+                      np.empty(0)],
+    })
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_ida_y_vuelta(df_corridas, tmp_path, mmap):
+    guardar_resultados(df_corridas, str(tmp_path))
+
+    almacen = cargar_resultados(str(tmp_path), mmap=mmap)
+
+    assert len(almacen) == 3
+    np.testing.assert_array_equal(almacen.historial(0), [3.0, 2.0, 1.0])
+    np.testing.assert_array_equal(almacen.historial(1), np.arange(8.0).reshape(4, 2))
+    assert almacen.historial(2).size == 0
+    np.testing.assert_array_equal(almacen.pasos(1), [0, 1, 2, 3])
+    assert almacen.pasos_concatenados is None
+
+    df = almacen.a_dataframe()
+    assert df.columns.tolist() == df_corridas.columns.tolist()
+    assert df['ECM_Final'].tolist() == df_corridas['ECM_Final'].tolist()
+    assert df['Ejecucion'].tolist() == [1, 1, 2]
+    assert df['Algoritmo'].tolist() == ['amplitud', 'recocido', 'recocido']
+    assert df.loc[0, 'Motivo'] == 'max_iter'
+    for a, b in zip(df['Historial'], df_corridas['Historial']):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_pasos(df_corridas, tmp_path):
+    df_corridas[COLUMNA_PASOS] = [np.nan, np.array([0, 5, 9, 20]), np.array([], dtype=np.int64)]
+    guardar_resultados(df_corridas, str(tmp_path))
+
+    almacen = cargar_resultados(str(tmp_path))
+
+    # Sin pasos propios (NaN) se guardan los implícitos 0, 1, ...
+    np.testing.assert_array_equal(almacen.pasos(0), [0, 1, 2])
+    np.testing.assert_array_equal(almacen.pasos(1), [0, 5, 9, 20])
+    assert almacen.pasos(2).size == 0
+    np.testing.assert_array_equal(almacen.a_dataframe()[COLUMNA_PASOS].iloc[1], [0, 5, 9, 20])
+
+    # Al volver a guardar sin pasos, el archivo anterior no queda huérfano
+    guardar_resultados(df_corridas.drop(columns=COLUMNA_PASOS), str(tmp_path))
+    assert cargar_resultados(str(tmp_path)).pasos_concatenados is None
+
+
+def test_pasos_inconsistentes(df_corridas, tmp_path):
+    df_corridas[COLUMNA_PASOS] = [np.array([0, 1]), np.nan, np.nan]
+    with pytest.raises(ValueError):
+        guardar_resultados(df_corridas, str(tmp_path))
+
+
+def test_sin_historial(tmp_path):
+    guardar_resultados(pd.DataFrame({'ECM_Final': [1.0, 2.0]}), str(tmp_path))
+
+    almacen = cargar_resultados(str(tmp_path))
+
+    assert len(almacen) == 2
+    assert almacen.historial(1).size == 0